@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
-import json
+import bisect
+import itertools
 import random
 from collections import defaultdict
 from pathlib import Path
 
+import numpy as np
+
 from dunedog.models.atoms import AffinityEntry, AtomCategory, AtomSource, StoryAtom
+from dunedog.utils.json_io import load_json
 
 # Project data directory: <repo_root>/data/
 _DATA_DIR = Path(__file__).resolve().parents[3] / "data"
@@ -20,7 +24,23 @@ class AtomCatalogue:
         self._atoms: list[StoryAtom] = []
         self._by_category: dict[AtomCategory, list[StoryAtom]] = defaultdict(list)
         self._by_tag: dict[str, list[StoryAtom]] = defaultdict(list)
-        self._affinities: dict[tuple[str, str], AffinityEntry] = {}
+        # Affinities are keyed by an integer pair (low_id << 32) | high_id over
+        # interned atom names, so lookups skip building a sorted tuple.
+        self._name_to_id: dict[str, int] = {}
+        self._affinities: dict[int, AffinityEntry] = {}
+        # Lazily built dense affinity matrix over interned ids, with one extra
+        # all-zero row/column (index -1) standing in for unknown names.
+        self._affinity_dense: np.ndarray | None = None
+        # Sampling weight of each atom, parallel to _by_category.
+        self._weights_by_category: dict[AtomCategory, list[float]] = defaultdict(list)
+        # Lazily built read-only views returned by the query methods.
+        self._atoms_view: tuple[StoryAtom, ...] | None = None
+        self._category_views: dict[AtomCategory, tuple[StoryAtom, ...]] = {}
+        self._tag_views: dict[str, tuple[StoryAtom, ...]] = {}
+        # Lazily built (pool, cumulative weights, total) per category.
+        self._cum_by_category: dict[
+            AtomCategory, tuple[list[StoryAtom], list[float], float]
+        ] = {}
 
     # ------------------------------------------------------------------
     # Loading
@@ -47,9 +67,7 @@ class AtomCatalogue:
 
         atoms_file = Path(atoms_path) if atoms_path else _DATA_DIR / "atoms.json"
         if atoms_file.exists():
-            with open(atoms_file, "r", encoding="utf-8") as fh:
-                raw_atoms = json.load(fh)
-            for entry in raw_atoms:
+            for entry in load_json(atoms_file):
                 # Default source to CATALOGUE for data-file atoms that omit it
                 entry.setdefault("source", AtomSource.CATALOGUE.value)
                 catalogue.add_atom(StoryAtom.from_dict(entry))
@@ -58,11 +76,8 @@ class AtomCatalogue:
             Path(affinities_path) if affinities_path else _DATA_DIR / "affinities.json"
         )
         if affinities_file.exists():
-            with open(affinities_file, "r", encoding="utf-8") as fh:
-                raw_affinities = json.load(fh)
-            for entry in raw_affinities:
-                aff = AffinityEntry.from_dict(entry)
-                catalogue._affinities[aff.key] = aff
+            for entry in load_json(affinities_file):
+                catalogue.add_affinity(AffinityEntry.from_dict(entry))
 
         return catalogue
 
@@ -73,31 +88,99 @@ class AtomCatalogue:
     def add_atom(self, atom: StoryAtom) -> None:
         """Add an atom and update all indices."""
         self._atoms.append(atom)
+        self._intern(atom.name)
         self._by_category[atom.category].append(atom)
+        # Weight = 1 - rarity so common atoms (rarity ~0) get weight ~1.
+        self._weights_by_category[atom.category].append(max(1.0 - atom.rarity, 0.01))
+        self._cum_by_category.pop(atom.category, None)
+        self._atoms_view = None
+        self._category_views.pop(atom.category, None)
         for tag in atom.tags:
             self._by_tag[tag].append(atom)
+            self._tag_views.pop(tag, None)
+
+    def add_affinity(self, entry: AffinityEntry) -> None:
+        """Add (or replace) the affinity between two atom names."""
+        a = self._intern(entry.atom_a)
+        b = self._intern(entry.atom_b)
+        if a > b:
+            a, b = b, a
+        self._affinities[(a << 32) | b] = entry
+        self._affinity_dense = None
+
+    def _intern(self, name: str) -> int:
+        """Return the integer id for *name*, assigning the next one if new."""
+        name_id = self._name_to_id.get(name)
+        if name_id is None:
+            name_id = self._name_to_id[name] = len(self._name_to_id)
+            self._affinity_dense = None
+        return name_id
 
     # ------------------------------------------------------------------
     # Queries
     # ------------------------------------------------------------------
 
-    def get_by_category(self, category: AtomCategory) -> list[StoryAtom]:
+    def get_by_category(self, category: AtomCategory) -> tuple[StoryAtom, ...]:
         """Return all atoms matching *category*."""
-        return list(self._by_category.get(category, []))
+        view = self._category_views.get(category)
+        if view is None:
+            view = self._category_views[category] = tuple(self._by_category.get(category, ()))
+        return view
 
-    def get_by_tag(self, tag: str) -> list[StoryAtom]:
+    def get_by_tag(self, tag: str) -> tuple[StoryAtom, ...]:
         """Return all atoms carrying *tag*."""
-        return list(self._by_tag.get(tag, []))
+        view = self._tag_views.get(tag)
+        if view is None:
+            view = self._tag_views[tag] = tuple(self._by_tag.get(tag, ()))
+        return view
 
     def get_affinity(self, atom_a: str, atom_b: str) -> float:
         """Look up affinity strength between two atom names.
 
         Returns 0.0 when no affinity entry exists.
         """
-        key = tuple(sorted((atom_a, atom_b)))
-        entry = self._affinities.get(key)
+        a = self._name_to_id.get(atom_a)
+        b = self._name_to_id.get(atom_b)
+        if a is None or b is None:
+            return 0.0
+        if a > b:
+            a, b = b, a
+        entry = self._affinities.get((a << 32) | b)
         return entry.strength if entry is not None else 0.0
 
+    def affinity_matrix(self, names: list[str]) -> np.ndarray:
+        """Return the symmetric matrix of affinities between *names*.
+
+        Entry ``[i, j]`` equals ``get_affinity(names[i], names[j])``; the
+        diagonal holds self-affinities (normally 0.0).
+        """
+        ids = self._ids(names)
+        return self._dense_affinities()[np.ix_(ids, ids)]
+
+    def affinity_block(self, rows: list[str], cols: list[str]) -> np.ndarray:
+        """Return affinities between *rows* and *cols* as a 2-D array.
+
+        Entry ``[i, j]`` equals ``get_affinity(rows[i], cols[j])``.
+        """
+        return self._dense_affinities()[np.ix_(self._ids(rows), self._ids(cols))]
+
+    def _dense_affinities(self) -> np.ndarray:
+        """The dense affinity matrix over interned ids, built on first use."""
+        dense = self._affinity_dense
+        if dense is None:
+            size = len(self._name_to_id)
+            dense = np.zeros((size + 1, size + 1))
+            for key, entry in self._affinities.items():
+                a, b = key >> 32, key & 0xFFFFFFFF
+                dense[a, b] = dense[b, a] = entry.strength
+            self._affinity_dense = dense
+        return dense
+
+    def _ids(self, names: list[str]) -> np.ndarray:
+        """Interned ids for *names*, with -1 for unknown names."""
+        get_id = self._name_to_id.get
+        return np.fromiter((get_id(name, -1) for name in names), dtype=np.intp, count=len(names))
+
     def sample_weighted(
         self,
         category: AtomCategory,
@@ -108,22 +191,30 @@ class AtomCatalogue:
 
         Common atoms (low rarity) are more likely to be chosen.
         """
-        pool = self._by_category.get(category, [])
-        if not pool:
-            return []
-        # Weight = 1 - rarity so common atoms (rarity ~0) get weight ~1.
-        weights = [max(1.0 - atom.rarity, 0.01) for atom in pool]
+        cached = self._cum_by_category.get(category)
+        if cached is None:
+            pool = self._by_category.get(category, [])
+            if not pool:
+                return []
+            cum = list(itertools.accumulate(self._weights_by_category[category]))
+            cached = (pool, cum, cum[-1])
+            self._cum_by_category[category] = cached
+
+        pool, cum, total = cached
         n = min(n, len(pool))
-        return rng.choices(pool, weights=weights, k=n)
+        hi = len(pool) - 1
+        return [pool[bisect.bisect(cum, rng.random() * total, 0, hi)] for _ in range(n)]
 
     # ------------------------------------------------------------------
     # Convenience
     # ------------------------------------------------------------------
 
     @property
-    def atoms(self) -> list[StoryAtom]:
-        """All loaded atoms (read-only copy)."""
-        return list(self._atoms)
+    def atoms(self) -> tuple[StoryAtom, ...]:
+        """All loaded atoms (read-only view)."""
+        if self._atoms_view is None:
+            self._atoms_view = tuple(self._atoms)
+        return self._atoms_view
 
     def __len__(self) -> int:
         return len(self._atoms)
@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
+import bisect
+import heapq
+import itertools
 import json
 import random
+import re
 from collections import defaultdict
+from functools import lru_cache
 from pathlib import Path
 
 from wordfreq import zipf_frequency
@@ -42,16 +47,44 @@ _DEFAULT_TEMPLATES: dict[str, list[str]] = {
     ],
 }
 
+# Template slots filled by arrange_grammatically, matched in one left-to-right pass.
+_SLOT_RE = re.compile(r"\{(noun|verb|adj|adv)\}")
+
 # Noun-like endings used by the NOUN_HEAVY strategy.
 _NOUN_ENDINGS = ("ness", "ment", "tion", "sion", "ity", "ence", "ance", "ism", "ist", "er", "or", "dom")
 
-# Consonant-only representation for PHONETIC_CLUSTER.
-_VOWELS = set("aeiou")
+# The same endings grouped by length, so a word's tail is checked with one
+# set lookup per distinct suffix length instead of a scan over every suffix.
+_SUFFIXES_BY_LEN: dict[int, frozenset[str]] = {
+    length: frozenset(s for s in _NOUN_ENDINGS if len(s) == length)
+    for length in sorted({len(s) for s in _NOUN_ENDINGS})
+}
+_MAX_SUFFIX_LEN = max(_SUFFIXES_BY_LEN)
+
+# Consonant-only representation for PHONETIC_CLUSTER: a str.translate table
+# deleting vowels and every non-alphabetic Latin-1 character in one C pass.
+_DEL_TABLE = str.maketrans(
+    "", "", "aeiouAEIOU" + "".join(chr(c) for c in range(256) if not chr(c).isalpha())
+)
+
+
+@lru_cache(maxsize=100_000)
+def _zipf_en(word: str) -> float:
+    """Memoized English zipf frequency; the same words recur across samples."""
+    return zipf_frequency(word, "en")
+
+
+def _is_noun_like(word: str) -> bool:
+    """Return True if *word* ends with one of the noun-like suffixes."""
+    tail = word[-_MAX_SUFFIX_LEN:]
+    if not tail.islower():
+        tail = tail.lower()
+    return any(tail[-length:] in suffixes for length, suffixes in _SUFFIXES_BY_LEN.items())
 
 
 def _consonant_skeleton(word: str) -> str:
     """Return the consonants of *word* in order (lowercased)."""
-    return "".join(c for c in word.lower() if c.isalpha() and c not in _VOWELS)
+    return word.lower().translate(_DEL_TABLE)
 
 
 class DictionaryChaosEngine:
@@ -60,6 +93,7 @@ class DictionaryChaosEngine:
     def __init__(self, word_loader: WordLoader | None = None) -> None:
         self._loader = word_loader or get_loader()
         self._grammar_templates: dict[str, list[str]] | None = None
+        self._all_templates: list[str] = []
 
     # ------------------------------------------------------------------
     # Template loading
@@ -76,6 +110,9 @@ class DictionaryChaosEngine:
         else:
             self._grammar_templates = _DEFAULT_TEMPLATES
 
+        self._all_templates = [
+            t for style_templates in self._grammar_templates.values() for t in style_templates
+        ]
         return self._grammar_templates
 
     # ------------------------------------------------------------------
@@ -114,19 +151,20 @@ class DictionaryChaosEngine:
             # Prefer words with zipf < 3.0; use inverse frequency as weight.
             weights = []
             for w in candidates:
-                zf = zipf_frequency(w, "en")
+                zf = _zipf_en(w)
                 # Boost words below the rarity threshold.
                 weights.append(1.0 / (zf + 0.1) if zf < 3.0 else 0.05)
         else:
-            weights = [max(zipf_frequency(w, "en"), 0.01) for w in candidates]
-
-        chosen: list[str] = []
-        # Weighted sampling without full replacement bias.
-        for _ in range(n):
-            pick = _weighted_choice(candidates, weights, rng)
-            chosen.append(pick)
+            weights = [max(_zipf_en(w), 0.01) for w in candidates]
 
-        return chosen
+        # Weighted sampling: build the cumulative table once, then bisect per draw.
+        cum = list(itertools.accumulate(weights))
+        total = cum[-1]
+        hi = len(candidates) - 1
+        return [
+            candidates[bisect.bisect(cum, rng.random() * total, 0, hi)]
+            for _ in range(n)
+        ]
 
     def _sample_noun_heavy(self, n: int, rng: random.Random) -> list[str]:
         """60% noun-like words (by suffix), 40% random."""
@@ -135,12 +173,12 @@ class DictionaryChaosEngine:
 
         # Gather noun-like candidates from a larger random pool.
         pool = self._loader.get_random_words(max(500, n * 10), rng)
-        nouns = [w for w in pool if w.lower().endswith(_NOUN_ENDINGS)]
+        nouns = [w for w in pool if _is_noun_like(w)]
 
         # If we don't have enough nouns, pad with more random draws.
         while len(nouns) < noun_count:
             extra = self._loader.get_random_words(200, rng)
-            nouns.extend(w for w in extra if w.lower().endswith(_NOUN_ENDINGS))
+            nouns.extend(w for w in extra if _is_noun_like(w))
 
         rng.shuffle(nouns)
         result = nouns[:noun_count]
@@ -159,13 +197,14 @@ class DictionaryChaosEngine:
             key = skel[:3] if len(skel) >= 3 else skel
             clusters[key].append(w)
 
-        # Pick from the largest clusters first.
-        sorted_clusters = sorted(clusters.values(), key=len, reverse=True)
+        # Pick from the largest clusters first; each contributes at least one
+        # word, so only the n largest can ever be reached.
+        per_cluster = max(1, n // len(clusters) + 1) if clusters else 1
         result: list[str] = []
-        for cluster in sorted_clusters:
+        for cluster in heapq.nlargest(n, clusters.values(), key=len):
             if len(result) >= n:
                 break
-            pick_count = min(len(cluster), max(1, n // len(sorted_clusters) + 1))
+            pick_count = min(len(cluster), per_cluster)
             result.extend(rng.sample(cluster, min(pick_count, len(cluster))))
 
         # Trim or pad to exactly n.
@@ -189,7 +228,8 @@ class DictionaryChaosEngine:
         template slots ``{noun}``, ``{verb}``, ``{adj}``, ``{adv}`` from the
         tagged buckets.
         """
-        templates = self._load_grammar_templates()
+        self._load_grammar_templates()
+        all_templates = self._all_templates
 
         # Bucket words by POS tag.
         buckets: dict[str, list[str]] = defaultdict(list)
@@ -202,18 +242,9 @@ class DictionaryChaosEngine:
             if not buckets[tag]:
                 buckets[tag] = list(words)  # degrade gracefully
 
-        all_templates: list[str] = []
-        for style_templates in templates.values():
-            all_templates.extend(style_templates)
-
         phrases: list[str] = []
         for tmpl in rng.sample(all_templates, min(len(all_templates), max(5, len(words) // 4))):
-            phrase = tmpl
-            for tag in ("noun", "verb", "adj", "adv"):
-                placeholder = "{" + tag + "}"
-                while placeholder in phrase:
-                    phrase = phrase.replace(placeholder, rng.choice(buckets[tag]), 1)
-            phrases.append(phrase)
+            phrases.append(_SLOT_RE.sub(lambda m: rng.choice(buckets[m.group(1)]), tmpl))
 
         return phrases
 
@@ -290,16 +321,3 @@ class DictionaryChaosEngine:
             combined_words=combined,
         )
 
-
-def _weighted_choice(
-    items: list[str], weights: list[float], rng: random.Random
-) -> str:
-    """Weighted random choice using the supplied RNG."""
-    total = sum(weights)
-    r = rng.random() * total
-    cumulative = 0.0
-    for item, w in zip(items, weights):
-        cumulative += w
-        if r <= cumulative:
-            return item
-    return items[-1]
@@ -4,7 +4,9 @@ from __future__ import annotations
 
 import random
 
-from Levenshtein import distance as levenshtein_distance
+import numpy as np
+from rapidfuzz import process as rf_process
+from rapidfuzz.distance import Levenshtein
 
 from dunedog.chaos.phonetics import (
     analyze_phonetic_mood,
@@ -26,6 +28,10 @@ LETTER_WEIGHTS = {
 _LETTERS = list(LETTER_WEIGHTS.keys())
 _WEIGHTS = list(LETTER_WEIGHTS.values())
 
+# Vectorised inverse-CDF sampling tables for generate_soup.
+_LETTER_CODES = np.frombuffer("".join(_LETTERS).encode("ascii"), dtype=np.uint8)
+_CUM_WEIGHTS = np.cumsum(_WEIGHTS)
+
 # Sliding window bounds
 _MIN_WINDOW = 3
 _MAX_WINDOW = 7
@@ -33,7 +39,6 @@ _MAX_WINDOW = 7
 # Near-word search limits
 _NEAR_WORD_MIN_LEN = 4
 _NEAR_WORD_MAX_DISTANCE = 2
-_NEAR_WORD_BUCKET_SAMPLE = 1000
 _NEAR_WORD_MAX_CANDIDATES = 50
 
 # Neologism bounds
@@ -49,7 +54,12 @@ class LetterSoupGenerator:
 
     def generate_soup(self, length: int, rng: random.Random) -> str:
         """Generate random letter soup with English-biased letter weights."""
-        return "".join(rng.choices(_LETTERS, weights=_WEIGHTS, k=length))
+        # One vectorised inverse-CDF draw, seeded from *rng* for determinism.
+        gen = np.random.default_rng(rng.getrandbits(64))
+        r = gen.random(length) * _CUM_WEIGHTS[-1]
+        idx = np.searchsorted(_CUM_WEIGHTS, r, side="right")
+        np.minimum(idx, len(_LETTERS) - 1, out=idx)
+        return _LETTER_CODES[idx].tobytes().decode("ascii")
 
     def parse_soup(
         self,
@@ -69,33 +79,49 @@ class LetterSoupGenerator:
         near_words: dict[str, tuple[str, str, int]] = {}  # match -> (fragment, match, dist)
         neologisms: dict[str, Neologism] = {}  # text -> Neologism
 
-        for win in range(_MIN_WINDOW, _MAX_WINDOW + 1):
-            for start in range(n - win + 1):
-                fragment = soup_lower[start : start + win]
-                if not fragment.isalpha():
-                    continue
+        # Length of the all-letter run starting at each position, so windows
+        # can be gated without calling isalpha() on every fragment.
+        run = [0] * (n + 1)
+        for i in range(n - 1, -1, -1):
+            run[i] = run[i + 1] + 1 if soup_lower[i].isalpha() else 0
+
+        # Near-word candidates are sampled once per window size per parse
+        # rather than once per fragment; non-word fragments are queued per
+        # size and scored against them in one batched call after the scan.
+        candidates_by_len: dict[int, list[str]] = {}
+        pending_by_len: dict[int, dict[str, None]] = {}
+        if enable_near_words:
+            for win in range(_NEAR_WORD_MIN_LEN, _MAX_WINDOW + 1):
+                bucket = self._loader.get_words_by_length(win)
+                if len(bucket) > _NEAR_WORD_MAX_CANDIDATES:
+                    bucket = rng.sample(bucket, _NEAR_WORD_MAX_CANDIDATES)
+                candidates_by_len[win] = bucket
+                pending_by_len[win] = {}
+
+        # Length-bucketed word sets, hoisted so the hot loop is a bare
+        # set lookup instead of a method call per fragment.
+        words_by_len = {
+            win: self._loader.get_word_set_by_length(win)
+            for win in range(_MIN_WINDOW, _MAX_WINDOW + 1)
+        }
+
+        # Walk each start once and derive every window size from one slice.
+        for start in range(n - _MIN_WINDOW + 1):
+            longest = min(_MAX_WINDOW, run[start])
+            if longest < _MIN_WINDOW:
+                continue
+            chunk = soup_lower[start : start + longest]
+            for win in range(_MIN_WINDOW, longest + 1):
+                fragment = chunk[:win]
 
                 # Exact word check
-                if self._loader.is_english_word(fragment):
+                if fragment in words_by_len[win]:
                     exact_words.add(fragment)
                     continue
 
-                # Near-word check (length 4+)
+                # Near-word check (length 4+), batched below
                 if enable_near_words and win >= _NEAR_WORD_MIN_LEN:
-                    bucket = self._loader.get_words_by_length(win)
-                    candidates = bucket
-                    if len(bucket) > _NEAR_WORD_BUCKET_SAMPLE:
-                        candidates = rng.sample(bucket, _NEAR_WORD_BUCKET_SAMPLE)
-
-                    checked = 0
-                    for word in candidates:
-                        if checked >= _NEAR_WORD_MAX_CANDIDATES:
-                            break
-                        dist = levenshtein_distance(fragment, word)
-                        if dist <= _NEAR_WORD_MAX_DISTANCE:
-                            if word not in near_words and word not in exact_words:
-                                near_words[word] = (fragment, word, dist)
-                        checked += 1
+                    pending_by_len[win][fragment] = None
 
                 # Neologism check (length 4-8, pronounceable non-word)
                 if _NEO_MIN_LEN <= win <= _NEO_MAX_LEN and fragment not in exact_words:
@@ -107,6 +133,24 @@ class LetterSoupGenerator:
                             phonetic_mood=mood,
                         )
 
+        # One distance matrix per window size; the cutoff caps every entry
+        # at _NEAR_WORD_MAX_DISTANCE + 1 so the kernel can exit early.
+        for win, pending in pending_by_len.items():
+            candidates = candidates_by_len[win]
+            if not pending or not candidates:
+                continue
+            fragments = list(pending)
+            dists = rf_process.cdist(
+                fragments, candidates,
+                scorer=Levenshtein.distance,
+                score_cutoff=_NEAR_WORD_MAX_DISTANCE,
+                dtype=np.uint8,
+            )
+            for row, col in zip(*np.nonzero(dists <= _NEAR_WORD_MAX_DISTANCE)):
+                word = candidates[col]
+                if word not in near_words and word not in exact_words:
+                    near_words[word] = (fragments[row], word, int(dists[row, col]))
+
         overall_mood = analyze_phonetic_mood(soup)
 
         return LetterSoupResult(
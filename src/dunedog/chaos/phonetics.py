@@ -2,20 +2,44 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 VOWELS = set("aeiou")
 SOFT_CONSONANTS = set("lmnrwy")  # dreamy
 HARD_CONSONANTS = set("kptdbg")  # urgent
 SIBILANTS = set("szfv")  # secretive
 # remaining: h, j, c, q, x, z -> neutral
 
+
+def _build_mood_table() -> bytes:
+    """Byte -> phonetic class lookup table for ``bytes.translate``.
+
+    Classes: ``v`` vowel, ``s`` soft, ``h`` hard, ``z`` sibilant,
+    ``o`` other letter, ``-`` non-letter.
+    """
+    table = bytearray(b"-" * 256)
+    for c in range(256):
+        if chr(c).isalpha():
+            table[c] = ord("o")
+    for chars, cls in ((VOWELS, "v"), (SOFT_CONSONANTS, "s"),
+                       (HARD_CONSONANTS, "h"), (SIBILANTS, "z")):
+        for ch in chars:
+            table[ord(ch)] = ord(cls)
+    return bytes(table)
+
+
+_MOOD_TABLE = _build_mood_table()
+
 # Common English consonant clusters (onsets)
-VALID_ONSETS = {
+VALID_ONSETS = frozenset({
     "bl", "br", "cl", "cr", "dr", "fl", "fr", "gl", "gr", "pl", "pr",
     "sc", "sk", "sl", "sm", "sn", "sp", "st", "str", "sw", "tr", "tw",
     "th", "sh", "ch", "wh", "wr", "kn", "qu", "spr", "spl", "scr",
-}
+})
+_MAX_ONSET_LEN = max(len(o) for o in VALID_ONSETS)
 
 
+@lru_cache(maxsize=200_000)
 def pronounceability_score(text: str) -> float:
     """Score 0.0-1.0 based on CV patterns and consonant cluster rules.
 
@@ -25,16 +49,46 @@ def pronounceability_score(text: str) -> float:
     if not text:
         return 0.0
 
-    t = text.lower()
-    alpha = [c for c in t if c.isalpha()]
-    if not alpha:
+    # Single fused pass: vowel ratio, consonant/vowel runs, onset cluster
+    # and tripled characters are all tracked together.
+    n = 0
+    vowel_count = 0
+    consonant_run = max_consonant_run = 0
+    vowel_run = max_vowel_run = 0
+    onset: list[str] = []
+    onset_done = False
+    tripled = False
+    prev = prev2 = ""
+    for c in text.lower():
+        if not c.isalpha():
+            continue
+        n += 1
+        if c in VOWELS:
+            vowel_count += 1
+            consonant_run = 0
+            vowel_run += 1
+            if vowel_run > max_vowel_run:
+                max_vowel_run = vowel_run
+            onset_done = True
+        else:
+            vowel_run = 0
+            consonant_run += 1
+            if consonant_run > max_consonant_run:
+                max_consonant_run = consonant_run
+            if not onset_done:
+                onset.append(c)
+                # No valid onset is longer than _MAX_ONSET_LEN; stop capturing.
+                onset_done = len(onset) > _MAX_ONSET_LEN
+        if c == prev == prev2:
+            tripled = True
+        prev2, prev = prev, c
+
+    if n == 0:
         return 0.0
 
     score = 1.0
-    n = len(alpha)
 
     # --- vowel ratio (ideal ~35-55%) ---
-    vowel_count = sum(1 for c in alpha if c in VOWELS)
     vowel_ratio = vowel_count / n
     if vowel_ratio == 0:
         return 0.0  # no vowels -> unpronounceable
@@ -46,30 +100,12 @@ def pronounceability_score(text: str) -> float:
         score -= 0.15
 
     # --- consonant cluster check ---
-    consonant_run = 0
-    max_consonant_run = 0
-    for c in alpha:
-        if c not in VOWELS:
-            consonant_run += 1
-            max_consonant_run = max(max_consonant_run, consonant_run)
-        else:
-            consonant_run = 0
-
     if max_consonant_run >= 4:
         score -= 0.35
     elif max_consonant_run == 3:
         score -= 0.10
 
     # --- vowel run check ---
-    vowel_run = 0
-    max_vowel_run = 0
-    for c in alpha:
-        if c in VOWELS:
-            vowel_run += 1
-            max_vowel_run = max(max_vowel_run, vowel_run)
-        else:
-            vowel_run = 0
-
     if max_vowel_run >= 4:
         score -= 0.20
     elif max_vowel_run == 3:
@@ -77,26 +113,19 @@ def pronounceability_score(text: str) -> float:
 
     # --- onset cluster validation ---
     # Check 2- and 3-char consonant clusters at start
-    onset = []
-    for c in alpha:
-        if c not in VOWELS:
-            onset.append(c)
-        else:
-            break
-    if len(onset) >= 2:
-        cluster = "".join(onset)
-        if cluster not in VALID_ONSETS:
-            score -= 0.15
+    if len(onset) > _MAX_ONSET_LEN:
+        score -= 0.15
+    elif len(onset) >= 2 and "".join(onset) not in VALID_ONSETS:
+        score -= 0.15
 
     # --- repeated characters ---
-    for i in range(len(alpha) - 2):
-        if alpha[i] == alpha[i + 1] == alpha[i + 2]:
-            score -= 0.25
-            break
+    if tripled:
+        score -= 0.25
 
     return max(0.0, min(1.0, score))
 
 
+@lru_cache(maxsize=200_000)
 def is_pronounceable(text: str, threshold: float = 0.4) -> bool:
     """Whether text meets minimum pronounceability threshold."""
     return pronounceability_score(text) >= threshold
@@ -118,6 +147,7 @@ def looks_like_name(text: str) -> bool:
     return is_pronounceable(t, threshold=0.5)
 
 
+@lru_cache(maxsize=200_000)
 def analyze_phonetic_mood(text: str) -> str:
     """Analyse the phonetic character of text.
 
@@ -132,16 +162,20 @@ def analyze_phonetic_mood(text: str) -> str:
         return "balanced"
 
     t = text.lower()
-    alpha = [c for c in t if c.isalpha()]
-    if not alpha:
+    # Classify every character in one C-level translate, then count classes.
+    classes = t.encode("latin-1", "ignore").translate(_MOOD_TABLE)
+    vowel_count = classes.count(b"v")
+    soft_count = classes.count(b"s")
+    hard_count = classes.count(b"h")
+    sib_count = classes.count(b"z")
+
+    n = len(classes) - classes.count(b"-")
+    if not t.isascii():
+        # Letters outside Latin-1 are dropped by the encode; count them back in.
+        n += sum(1 for c in t if ord(c) > 255 and c.isalpha())
+    if not n:
         return "balanced"
 
-    vowel_count = sum(1 for c in alpha if c in VOWELS)
-    soft_count = sum(1 for c in alpha if c in SOFT_CONSONANTS)
-    hard_count = sum(1 for c in alpha if c in HARD_CONSONANTS)
-    sib_count = sum(1 for c in alpha if c in SIBILANTS)
-
-    n = len(alpha)
     vowel_ratio = vowel_count / n
 
     # If vowels dominate (>55%), it's flowing
@@ -3,24 +3,35 @@
 from __future__ import annotations
 
 import argparse
-import asyncio
+import functools
 import os
 import sys
+from typing import TYPE_CHECKING
 
-from rich.console import Console
-from rich.panel import Panel
-from rich.text import Text
+if TYPE_CHECKING:
+    from rich.console import Console
 
-from pydantic import SecretStr
+    from dunedog.llm.synthesizer import StorySynthesizer, SynthesizedStory
+    from dunedog.models.skeleton import StorySkeleton
 
-from dunedog.models.config import GenerationConfig, Preset
+# rich, pydantic and the pipeline modules are imported inside the commands
+# that use them, so `dunedog --help` and argument errors start fast.
 
 
-console = Console()
+@functools.lru_cache(maxsize=None)
+def _console() -> Console:
+    """Return the shared rich Console, created on first use."""
+    from rich.console import Console
 
+    return Console()
 
+
+@functools.lru_cache(maxsize=None)
 def _bounded_int(lo: int, hi: int):
-    """Return an argparse type function that enforces lo <= value <= hi."""
+    """Return an argparse type function that enforces lo <= value <= hi.
+
+    Cached, so repeated bounds such as (1, 10000) share one parser function.
+    """
     def _parse(value: str) -> int:
         iv = int(value)
         if iv < lo or iv > hi:
@@ -70,6 +81,7 @@ def _build_parser() -> argparse.ArgumentParser:
     evolve.add_argument("-o", "--output", type=str, required=True, help="Output file")
     evolve.add_argument("-g", "--generations", type=_bounded_int(1, 1000), default=5, help="Number of generations (1-1000, default 5)")
     evolve.add_argument("--seed", type=int, default=None)
+    evolve.add_argument("-w", "--workers", type=_bounded_int(1, 64), default=1, help="Scoring processes (1-64, default 1)")
 
     # -- setup --
     sub.add_parser("setup", help="Download NLTK data and verify setup")
@@ -92,12 +104,36 @@ def _resolve_api_key(provider: str | None, api_key: str | None) -> str:
     return ""
 
 
+async def _synthesize(
+    synthesizer: StorySynthesizer,
+    skeletons: list[StorySkeleton],
+) -> list[SynthesizedStory]:
+    """Run one synthesis, then close the shared HTTP client.
+
+    The CLI owns the client's lifetime: the event loop ends with this call.
+    """
+    from dunedog.llm.provider import aclose_client
+
+    try:
+        return await synthesizer.synthesize(skeletons)
+    finally:
+        await aclose_client()
+
+
 def cmd_generate(args: argparse.Namespace) -> None:
     """Full generation pipeline."""
+    import asyncio
+
+    from pydantic import SecretStr
+    from rich.panel import Panel
+    from rich.text import Text
+
+    from dunedog.models.config import GenerationConfig
     from dunedog.utils.seed_manager import SeedManager
     from dunedog.output.batch_generator import StoryBatchGenerator
     from dunedog.output import exporter
 
+    console = _console()
     config = GenerationConfig.from_preset(args.preset, seed=args.seed)
     if args.count is not None:
         config.skeletons_to_generate = args.count
@@ -145,13 +181,15 @@ def cmd_generate(args: argparse.Namespace) -> None:
         config.llm.provider,
         api_key=config.llm.api_key.get_secret_value(),
         model=config.llm.model,
+        max_retries=config.llm.max_retries,
+        backoff_base=config.llm.backoff_base,
     )
     synthesizer = StorySynthesizer(provider, config.llm)
 
     console.print(f"[bold]Synthesizing stories via {config.llm.provider}...[/bold]")
     top_skeletons = skeletons[:config.llm.max_stories_for_llm]
 
-    stories = asyncio.run(synthesizer.synthesize(top_skeletons))
+    stories = asyncio.run(_synthesize(synthesizer, top_skeletons))
 
     if stories:
         console.print(f"\n[bold green]Generated {len(stories)} stories:[/bold green]\n")
@@ -176,9 +214,14 @@ def cmd_generate(args: argparse.Namespace) -> None:
 
 def cmd_demo(args: argparse.Namespace) -> None:
     """Demo: generate and display a single skeleton."""
+    from rich.panel import Panel
+    from rich.text import Text
+
+    from dunedog.models.config import GenerationConfig
     from dunedog.utils.seed_manager import SeedManager
     from dunedog.output.batch_generator import StoryBatchGenerator
 
+    console = _console()
     config = GenerationConfig.from_preset("quick", seed=args.seed)
     config.skeletons_to_generate = 1
 
@@ -213,7 +256,7 @@ def cmd_demo(args: argparse.Namespace) -> None:
         atom_lines = []
         for a in skeleton.atoms:
             tags = f" [{', '.join(a.tags)}]" if a.tags else ""
-            atom_lines.append(f"  {a.category.value:>10}: {a.name}{tags}")
+            atom_lines.append(f"  {a.category:>10}: {a.name}{tags}")
         console.print(Panel("\n".join(atom_lines), title="Story Atoms", border_style="green"))
 
     # Display spread
@@ -241,6 +284,8 @@ def cmd_demo(args: argparse.Namespace) -> None:
     if not args.no_llm and args.provider:
         api_key = _resolve_api_key(args.provider, args.api_key)
         if api_key:
+            import asyncio
+
             from dunedog.llm.provider import create_provider
             from dunedog.llm.synthesizer import StorySynthesizer
             from dunedog.models.config import LLMConfig
@@ -250,16 +295,19 @@ def cmd_demo(args: argparse.Namespace) -> None:
             synthesizer = StorySynthesizer(provider, llm_config)
 
             console.print("\n[bold]Synthesizing story...[/bold]")
-            stories = asyncio.run(synthesizer.synthesize([skeleton]))
+            stories = asyncio.run(_synthesize(synthesizer, [skeleton]))
             for story in stories:
                 console.print(Panel(Text(story.content), title=Text(story.title), border_style="blue"))
 
 
 def cmd_soup(args: argparse.Namespace) -> None:
     """Generate letter soup only."""
+    from rich.panel import Panel
+
     from dunedog.utils.seed_manager import SeedManager
     from dunedog.chaos.letter_soup import LetterSoupGenerator
 
+    console = _console()
     seed_mgr = SeedManager(args.seed)
     gen = LetterSoupGenerator()
 
@@ -286,6 +334,7 @@ def cmd_evolve(args: argparse.Namespace) -> None:
     from dunedog.output.exporter import load_skeletons, to_json
     from dunedog.models.config import EvolutionConfig
 
+    console = _console()
     skeletons = load_skeletons(args.input)
     console.print(f"Loaded {len(skeletons)} skeletons from {args.input}")
 
@@ -302,11 +351,15 @@ def cmd_evolve(args: argparse.Namespace) -> None:
         enabled=True,
         generations=args.generations,
         population_size=len(skeletons),
+        max_workers=args.workers,
     )
 
     engine = StoryEvolutionEngine()
     console.print(f"Evolving for {args.generations} generations...")
-    result = engine.evolve(skeletons, evo_config, rng)
+    try:
+        result = engine.evolve(skeletons, evo_config, rng)
+    finally:
+        engine.close()
 
     console.print(f"[green]Evolution complete. Best fitness: {result.fitness_history[-1]:.4f}[/green]")
     to_json(result.population, args.output)
@@ -317,6 +370,7 @@ def cmd_setup(_args: argparse.Namespace) -> None:
     """Download NLTK data and verify setup."""
     import nltk
 
+    console = _console()
     packages = [
         "punkt",
         "punkt_tab",
@@ -340,8 +394,15 @@ def cmd_setup(_args: argparse.Namespace) -> None:
     data_dir = Path(__file__).resolve().parents[2] / "data"
     word_path = data_dir / "english_words.txt"
     if word_path.exists():
-        with open(word_path) as f:
-            count = sum(1 for _ in f)
+        # Count newlines over 1 MiB binary chunks instead of iterating lines.
+        count = 0
+        last = b"\n"
+        with open(word_path, "rb") as f:
+            for buf in iter(lambda: f.read(1 << 20), b""):
+                count += buf.count(b"\n")
+                last = buf
+        if not last.endswith(b"\n"):
+            count += 1  # final line without a trailing newline
         console.print(f"  [green]Word list: {count:,} words[/green]")
     else:
         console.print("  [yellow]Warning: english_words.txt not found[/yellow]")
@@ -374,10 +435,10 @@ def main() -> None:
     try:
         cmd_func(args)
     except KeyboardInterrupt:
-        console.print("\n[yellow]Interrupted.[/yellow]")
+        _console().print("\n[yellow]Interrupted.[/yellow]")
         sys.exit(130)
     except Exception as exc:
-        console.print(f"[red]Error: {exc}[/red]")
+        _console().print(f"[red]Error: {exc}[/red]")
         sys.exit(1)
 
 
@@ -2,8 +2,14 @@
 
 from __future__ import annotations
 
+import itertools
 import random
+import re
+from collections import Counter
 from dataclasses import dataclass, field
+from functools import lru_cache
+
+import numpy as np
 
 from dunedog.models.atoms import AtomCategory, AtomSource, StoryAtom
 from dunedog.models.results import DictionaryChaosResult, LetterSoupResult
@@ -34,6 +40,68 @@ _TENSION_WORDS = frozenset({
     "darkness", "anger", "hatred", "despair", "tension", "dilemma",
 })
 
+# Abstract-noun endings; unresolved nouns with these map to TENSION.
+_ABSTRACT_SUFFIX_RE = re.compile(r"(?:tion|sion|ment|ness|ity)\Z")
+
+# Rarity given to atoms created from chaos words (they skew rare).
+_CREATED_RARITY = 0.7
+
+# Tags echoing a category or POS, left out of theme summaries.
+_THEME_SKIP = frozenset({"noun", "verb", "adj", "adv", *(c.value for c in AtomCategory)})
+_THEME_TAG_COUNT = 4
+
+
+# Per-word WordNet lookups are shared by category inference and tagging, and
+# the same words recur across skeletons, so each is resolved once per process.
+@lru_cache(maxsize=65536)
+def _pos(word: str) -> str:
+    return get_pos_tag(word)
+
+
+@lru_cache(maxsize=65536)
+def _hyp(word: str) -> tuple[str, ...]:
+    return tuple(get_hypernyms(word))
+
+
+@lru_cache(maxsize=65536)
+def _hyp_set(word: str) -> frozenset[str]:
+    return frozenset(h.lower() for h in _hyp(word))
+
+
+@lru_cache(maxsize=65536)
+def _word_category(word: str) -> AtomCategory | None:
+    """Infer an AtomCategory from POS, splitting nouns via hypernyms and heuristics."""
+    pos = _pos(word)
+
+    if pos == "verb":
+        return AtomCategory.TRIGGER
+    if pos == "adj" or pos == "adv":
+        return AtomCategory.QUALITY
+    if pos != "noun":
+        return None
+
+    # crystallize() already lowercases its words; skip the extra copy then.
+    w_low = word if word.islower() else word.lower()
+    if w_low in _TENSION_WORDS:
+        return AtomCategory.TENSION
+
+    # Only non-tension nouns pay for the hypernym lookup.
+    hypernyms = _hyp_set(word)
+
+    if not hypernyms.isdisjoint(_ANIMATE_HYPERNYMS):
+        return AtomCategory.AGENT
+    if not hypernyms.isdisjoint(_PLACE_HYPERNYMS):
+        return AtomCategory.LOCATION
+    if not hypernyms.isdisjoint(_OBJECT_HYPERNYMS):
+        return AtomCategory.OBJECT
+
+    # Fallback: abstract nouns often map to TENSION.
+    if _ABSTRACT_SUFFIX_RE.search(w_low):
+        return AtomCategory.TENSION
+
+    # Default for unresolved nouns.
+    return AtomCategory.OBJECT
+
 
 @dataclass
 class CrystallizationResult:
@@ -60,6 +128,11 @@ class SeedCrystallizer:
         self._catalogue = catalogue or AtomCatalogue.load()
         self._threshold = similarity_threshold
         self._similarity: SimilarityEngine = get_similarity_engine()
+        # Name -> first catalogue atom with that name, and the distinct names
+        # scored against; rebuilt when the catalogue changes.
+        self._cat_atoms: tuple[StoryAtom, ...] = ()
+        self._atom_by_name: dict[str, StoryAtom] = {}
+        self._cat_names: list[str] = []
 
     # ------------------------------------------------------------------
     # Public API
@@ -68,7 +141,7 @@ class SeedCrystallizer:
     def crystallize(
         self,
         words: list[str],
-        rng: random.Random,
+        rng: random.Random | None = None,
         soup_result: LetterSoupResult | None = None,
         chaos_result: DictionaryChaosResult | None = None,
     ) -> CrystallizationResult:
@@ -81,42 +154,81 @@ class SeedCrystallizer:
 
         Extra words from *soup_result* / *chaos_result* are appended to the
         input list so callers can pass raw results alongside an explicit list.
+
+        Crystallization is deterministic; *rng* is accepted for call-site
+        compatibility and is not consumed.
+        """
+        return self.crystallize_many([(words, soup_result, chaos_result)])[0]
+
+    def crystallize_many(
+        self,
+        inputs: list[
+            tuple[list[str], LetterSoupResult | None, DictionaryChaosResult | None]
+        ],
+    ) -> list[CrystallizationResult]:
+        """Crystallize several ``(words, soup_result, chaos_result)`` inputs.
+
+        Equivalent to calling :meth:`crystallize` on each input, but the
+        catalogue similarity pass runs once over the union of their words.
         """
+        prepared = [self._unique_words(*entry) for entry in inputs]
+        batch = list(dict.fromkeys(itertools.chain.from_iterable(prepared)))
+        matches = dict(zip(batch, self._match_catalogue(batch)))
+        return [
+            self._build_result(unique_words, matches, soup_result)
+            for unique_words, (_, soup_result, _) in zip(prepared, inputs)
+        ]
+
+    @staticmethod
+    def _unique_words(
+        words: list[str],
+        soup_result: LetterSoupResult | None,
+        chaos_result: DictionaryChaosResult | None,
+    ) -> list[str]:
+        """Combine *words* with the chaos results' words, normalized and deduplicated."""
         all_words = list(words)
         if soup_result is not None:
             all_words.extend(soup_result.all_words())
         if chaos_result is not None:
             all_words.extend(chaos_result.combined_words or chaos_result.sampled_words)
 
-        # Deduplicate while preserving order.
-        seen: set[str] = set()
-        unique_words: list[str] = []
-        for w in all_words:
-            low = w.lower().strip()
-            if low and low not in seen:
-                seen.add(low)
-                unique_words.append(low)
+        # Deduplicate (lowercased, stripped, non-empty) while preserving order.
+        return list(dict.fromkeys(low for w in all_words if (low := w.lower().strip())))
+
+    def _build_result(
+        self,
+        unique_words: list[str],
+        matches: dict[str, StoryAtom | None],
+        soup_result: LetterSoupResult | None,
+    ) -> CrystallizationResult:
+        """Map, create or leave unmapped each word given its catalogue match."""
+        soup_words = frozenset(soup_result.all_words()) if soup_result is not None else frozenset()
 
         result = CrystallizationResult()
+        created: list[tuple[str, AtomCategory, AtomSource]] = []
 
         for word in unique_words:
             # 1. catalogue match
-            mapped = self.map_to_catalogue(word)
+            mapped = matches[word]
             if mapped is not None:
                 result.mapped_atoms.append(mapped)
                 continue
 
             # 2. infer category and create atom
-            category = self._infer_category(word)
+            category, source = self._classify(word, soup_words)
             if category is not None:
-                source = self._pick_source(word, soup_result, chaos_result)
-                atom = self.create_atom(word, category, source)
-                result.created_atoms.append(atom)
+                created.append((word, category, source))
                 continue
 
             # 3. unmapped
             result.unmapped_words.append(word)
 
+        # Same atoms as create_atom(), built in one pass with positional arguments.
+        result.created_atoms = [
+            StoryAtom(word, category, source, self._generate_tags(word, category), _CREATED_RARITY)
+            for word, category, source in created
+        ]
+
         result.theme_summary = self._generate_theme_summary(result.all_atoms)
         return result
 
@@ -126,42 +238,19 @@ class SeedCrystallizer:
 
     def _infer_category(self, word: str) -> AtomCategory | None:
         """Infer an AtomCategory from word semantics and POS."""
-        pos = get_pos_tag(word)
-
-        if pos == "verb":
-            return AtomCategory.TRIGGER
-
-        if pos == "adj":
-            return AtomCategory.QUALITY
-
-        if pos == "adv":
-            return AtomCategory.QUALITY
-
-        if pos == "noun":
-            return self._classify_noun(word)
-
-        return None
-
-    def _classify_noun(self, word: str) -> AtomCategory:
-        """Distinguish noun sub-categories via hypernyms and heuristics."""
-        if word.lower() in _TENSION_WORDS:
-            return AtomCategory.TENSION
-
-        hypernyms = {h.lower() for h in get_hypernyms(word)}
-
-        if hypernyms & _ANIMATE_HYPERNYMS:
-            return AtomCategory.AGENT
-        if hypernyms & _PLACE_HYPERNYMS:
-            return AtomCategory.LOCATION
-        if hypernyms & _OBJECT_HYPERNYMS:
-            return AtomCategory.OBJECT
+        return self._classify(word, frozenset())[0]
 
-        # Fallback: abstract nouns often map to TENSION.
-        if word.lower().endswith(("tion", "sion", "ment", "ness", "ity")):
-            return AtomCategory.TENSION
+    @staticmethod
+    def _classify(
+        word: str, soup_words: frozenset[str]
+    ) -> tuple[AtomCategory | None, AtomSource]:
+        """Infer *word*'s category (None if unknown) and its AtomSource in one call.
 
-        # Default for unresolved nouns.
-        return AtomCategory.OBJECT
+        The source is LETTER_SOUP for words in *soup_words* (the letter-soup
+        word set, built once per crystallize call), otherwise DICTIONARY.
+        """
+        source = AtomSource.LETTER_SOUP if word in soup_words else AtomSource.DICTIONARY
+        return _word_category(word), source
 
     # ------------------------------------------------------------------
     # Catalogue mapping
@@ -173,19 +262,30 @@ class SeedCrystallizer:
         Returns the best match whose score exceeds ``self._threshold``,
         or ``None`` if nothing is close enough.
         """
-        catalogue_atoms = self._catalogue.atoms
-        if not catalogue_atoms:
-            return None
+        return self._match_catalogue([word])[0]
 
-        candidates = [a.name for a in catalogue_atoms]
-        top = self._similarity.most_similar(word, candidates, n=1)
+    def _match_catalogue(self, words: list[str]) -> list[StoryAtom | None]:
+        """Batched :meth:`map_to_catalogue`: score all *words* in one pass."""
+        catalogue_atoms = self._catalogue.atoms
+        if not catalogue_atoms or not words:
+            return [None] * len(words)
 
-        if top and top[0][1] >= self._threshold:
-            match_name = top[0][0]
+        if catalogue_atoms is not self._cat_atoms:
+            self._cat_atoms = catalogue_atoms
+            self._atom_by_name = {}
             for atom in catalogue_atoms:
-                if atom.name == match_name:
-                    return atom
-        return None
+                self._atom_by_name.setdefault(atom.name, atom)
+            self._cat_names = list(self._atom_by_name)
+
+        scores = self._similarity.score_matrix(words, self._cat_names)
+        best_idx = scores.argmax(axis=1)
+        # Compare at the matrix's precision so a score equal to the threshold passes.
+        keep = scores[np.arange(len(words)), best_idx] >= scores.dtype.type(self._threshold)
+        names = self._cat_names
+        return [
+            self._atom_by_name[names[j]] if ok else None
+            for j, ok in zip(best_idx.tolist(), keep.tolist())
+        ]
 
     # ------------------------------------------------------------------
     # Atom creation
@@ -204,36 +304,21 @@ class SeedCrystallizer:
             category=category,
             source=source,
             tags=tags,
-            rarity=0.7,  # chaos-derived atoms skew rare
+            rarity=_CREATED_RARITY,
         )
 
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
 
-    @staticmethod
-    def _pick_source(
-        word: str,
-        soup_result: LetterSoupResult | None,
-        chaos_result: DictionaryChaosResult | None,
-    ) -> AtomSource:
-        """Determine the AtomSource for *word* based on which result it came from."""
-        if soup_result is not None and word in soup_result.all_words():
-            return AtomSource.LETTER_SOUP
-        if chaos_result is not None:
-            combined = chaos_result.combined_words or chaos_result.sampled_words
-            if word in combined:
-                return AtomSource.DICTIONARY
-        return AtomSource.DICTIONARY
-
     @staticmethod
     def _generate_tags(word: str, category: AtomCategory) -> list[str]:
         """Derive a small set of tags for a newly created atom."""
         tags: list[str] = [category.value]
-        pos = get_pos_tag(word)
+        pos = _pos(word)
         if pos:
             tags.append(pos)
-        hypernyms = get_hypernyms(word)
+        hypernyms = _hyp(word)
         if hypernyms:
             tags.append(hypernyms[0].replace("_", " "))
         return tags
@@ -244,20 +329,20 @@ class SeedCrystallizer:
         if not atoms:
             return ""
 
-        category_counts: dict[str, int] = {}
-        tag_pool: list[str] = []
+        category_counts: Counter[str] = Counter()
+        # First four unique descriptive tags (skip category/pos echoes).
+        tag_slice: dict[str, None] = {}
 
         for atom in atoms:
-            cat = atom.category.value
-            category_counts[cat] = category_counts.get(cat, 0) + 1
-            tag_pool.extend(atom.tags)
-
-        dominant = max(category_counts, key=category_counts.get)  # type: ignore[arg-type]
-
-        # Collect unique descriptive tags (skip category/pos echoes).
-        skip = {"noun", "verb", "adj", "adv"} | {c.value for c in AtomCategory}
-        unique_tags = list(dict.fromkeys(t for t in tag_pool if t not in skip))
-        tag_slice = unique_tags[:4]
+            category_counts[atom.category.value] += 1
+            if len(tag_slice) < _THEME_TAG_COUNT:
+                for t in atom.tags:
+                    if t not in _THEME_SKIP and t not in tag_slice:
+                        tag_slice[t] = None
+                        if len(tag_slice) == _THEME_TAG_COUNT:
+                            break
+
+        dominant = category_counts.most_common(1)[0][0]
 
         parts = [f"dominant-{dominant}"]
         if tag_slice:
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from collections import defaultdict
 
+import numpy as np
+
 from dunedog.models.atoms import StoryAtom
 from dunedog.utils.embeddings import SimilarityEngine, get_similarity_engine
 
@@ -13,14 +15,14 @@ def cluster_atoms(
     similarity_engine: SimilarityEngine | None = None,
     threshold: float = 0.5,
 ) -> list[list[StoryAtom]]:
-    """Simple agglomerative clustering on atom similarity.
+    """Agglomerative (average-linkage) clustering on atom similarity.
 
-    Algorithm:
-    1. Start with each atom in its own cluster.
-    2. Find the two most similar clusters (average linkage).
-    3. Merge if similarity > *threshold*.
-    4. Repeat until no more merges are possible.
+    Clusters are merged while their average pairwise similarity is at least
+    *threshold*. Merges are found with the nearest-neighbor chain algorithm,
+    which gives the same result as repeatedly merging the globally most
+    similar pair (average linkage is reducible) in O(n²) instead of O(n³).
 
+    Clusters are returned in order of their first atom, members in input order.
     Falls back to tag-based clustering if the similarity engine returns
     all-zero scores.
     """
@@ -31,73 +33,93 @@ def cluster_atoms(
 
     engine = similarity_engine or get_similarity_engine()
 
-    # Pre-compute pairwise similarity matrix (atom names).
-    n = len(atoms)
-    sim_matrix: dict[tuple[int, int], float] = {}
-    all_zero = True
-    for i in range(n):
-        for j in range(i + 1, n):
-            score = engine.similarity(atoms[i].name, atoms[j].name)
-            sim_matrix[(i, j)] = score
-            if score > 0.0:
-                all_zero = False
+    # Symmetric pairwise similarity matrix of the atom names, in one batch.
+    sim = engine.pairwise_matrix([a.name for a in atoms])
 
     # Fallback when no meaningful similarity signal exists.
-    if all_zero:
+    if not (sim > 0.0).any():
         return _tag_based_clustering(atoms)
 
-    # Initialise clusters: each atom in its own cluster.
-    clusters: dict[int, list[int]] = {i: [i] for i in range(n)}
-
-    while len(clusters) > 1:
-        best_pair: tuple[int, int] | None = None
-        best_score = -1.0
-
-        cluster_ids = sorted(clusters.keys())
-        for idx_a in range(len(cluster_ids)):
-            for idx_b in range(idx_a + 1, len(cluster_ids)):
-                cid_a = cluster_ids[idx_a]
-                cid_b = cluster_ids[idx_b]
-                score = _average_linkage(clusters[cid_a], clusters[cid_b], sim_matrix)
-                if score > best_score:
-                    best_score = score
-                    best_pair = (cid_a, cid_b)
-
-        if best_pair is None or best_score < threshold:
-            break
-
-        # Merge cluster b into cluster a.
-        cid_a, cid_b = best_pair
-        clusters[cid_a] = clusters[cid_a] + clusters[cid_b]
-        del clusters[cid_b]
-
-    return [[atoms[i] for i in indices] for indices in clusters.values()]
-
-
-def _average_linkage(
-    cluster_a: list[int],
-    cluster_b: list[int],
-    sim_matrix: dict[tuple[int, int], float],
-) -> float:
-    """Compute average pairwise similarity between two clusters."""
-    total = 0.0
-    count = 0
-    for i in cluster_a:
-        for j in cluster_b:
-            key = (min(i, j), max(i, j))
-            total += sim_matrix.get(key, 0.0)
-            count += 1
-    return total / count if count else 0.0
+    return [[atoms[i] for i in indices] for indices in _nn_chain(sim, threshold)]
+
+
+def _nn_chain(sim: np.ndarray, threshold: float) -> list[list[int]]:
+    """Average-linkage merges above *threshold* via the nearest-neighbor chain.
+
+    *sim* is a symmetric similarity matrix. A float32 copy of it serves as the
+    matrix of pairwise similarity *sums* between clusters: merging two clusters
+    just adds their rows, and the average linkage to cluster k is the sum
+    divided by the pair count ``size[a] * size[k]``. The chain reads whole
+    rows, so the square layout is kept rather than a packed triangle. Returns
+    the member indices of every final cluster, ordered by first member.
+    """
+    total = np.array(sim, dtype=np.float32)
+    threshold = np.float32(threshold)
+    n = len(total)
+    size = np.ones(n, dtype=np.float32)
+    # Each merged-away cluster points at the cluster it joined.
+    parent = np.arange(n)
+    # Clusters that may still merge. A singleton whose best partner is already
+    # below threshold never will (an average over a cluster is at most its best
+    # member), so all of those are retired up front; when no pair clears the
+    # threshold the loop below never runs.
+    best = np.where(np.eye(n, dtype=bool), -np.inf, total).max(axis=1)
+    open_mask = best >= threshold
+    n_open = int(open_mask.sum())
+    chain: list[int] = []
+
+    while n_open > 1:
+        if not chain:
+            chain.append(int(open_mask.argmax()))
+        a = chain[-1]
+        open_mask[a] = False
+        row = np.where(open_mask, total[a] / (size[a] * size), -np.inf)
+        open_mask[a] = True
+        b = int(row.argmax())
+        # Prefer the previous chain element on ties so the chain terminates.
+        if len(chain) > 1 and row[chain[-2]] == row[b]:
+            b = chain[-2]
+
+        if row[b] < threshold:
+            # a's best partner is below threshold, and average linkage can
+            # only lower it further: a is final.
+            open_mask[a] = False
+            n_open -= 1
+            chain.pop()
+            continue
+
+        if len(chain) > 1 and b == chain[-2]:
+            # Reciprocal nearest neighbors: merge b into a (keep lower id).
+            chain.pop()
+            chain.pop()
+            keep, gone = min(a, b), max(a, b)
+            merged = total[keep] + total[gone]
+            total[keep, :] = total[:, keep] = merged
+            size[keep] += size[gone]
+            open_mask[gone] = False
+            n_open -= 1
+            parent[gone] = keep
+        else:
+            chain.append(b)
+
+    groups: dict[int, list[int]] = {}
+    for i in range(n):
+        root = i
+        while parent[root] != root:
+            root = parent[root]
+        groups.setdefault(root, []).append(i)
+    return list(groups.values())
 
 
 def _tag_based_clustering(atoms: list[StoryAtom]) -> list[list[StoryAtom]]:
     """Fallback clustering by shared tags.
 
     Atoms that share at least one tag are placed in the same cluster.
-    Uses a simple union-find approach.
+    Uses union-find with union by rank and path halving.
     """
     n = len(atoms)
     parent = list(range(n))
+    rank = [0] * n
 
     def find(x: int) -> int:
         while parent[x] != x:
@@ -107,15 +129,27 @@ def _tag_based_clustering(atoms: list[StoryAtom]) -> list[list[StoryAtom]]:
 
     def union(a: int, b: int) -> None:
         ra, rb = find(a), find(b)
-        if ra != rb:
-            parent[rb] = ra
+        if ra == rb:
+            return
+        # Attach the shallower tree under the deeper one.
+        if rank[ra] < rank[rb]:
+            ra, rb = rb, ra
+        parent[rb] = ra
+        if rank[ra] == rank[rb]:
+            rank[ra] += 1
 
     # Build tag-to-atom index and union atoms sharing a tag.
     tag_index: dict[str, list[int]] = defaultdict(list)
     for i, atom in enumerate(atoms):
-        for tag in atom.tags:
+        for tag in dict.fromkeys(atom.tags):
             tag_index[tag].append(i)
 
+    # Degenerate cases: no tags at all, or one tag shared by every atom.
+    if not tag_index:
+        return [[atom] for atom in atoms]
+    if any(len(indices) == n for indices in tag_index.values()):
+        return [list(atoms)]
+
     for indices in tag_index.values():
         for k in range(1, len(indices)):
             union(indices[0], indices[k])
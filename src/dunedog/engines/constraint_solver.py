@@ -2,21 +2,54 @@
 
 from __future__ import annotations
 
-import json
 import random
 from pathlib import Path
 
+import numpy as np
+
 from dunedog.catalogues.loader import AtomCatalogue
 from dunedog.models.skeleton import StorySkeleton
 from dunedog.models.validation import ValidationResult
+from dunedog.utils.bitmasks import label_masks
+from dunedog.utils.json_io import load_json
 from dunedog.world_rules.engine import WorldRulesEngine
 
 _DATA_DIR = Path(__file__).resolve().parents[3] / "data"
 
 
+def _ordered_sum(values: np.ndarray) -> float:
+    """Left-to-right sum, bit-identical to accumulating in a Python loop.
+
+    ndarray.sum() uses pairwise summation, which can differ in the last ulp
+    and so shift seeded coherence scores.
+    """
+    return float(np.cumsum(values)[-1]) if len(values) else 0.0
+
+
+def _beat_table(
+    transitions: dict[str, dict[str, float]],
+) -> tuple[dict[str, int], np.ndarray]:
+    """Flatten beat transitions into a dense probability matrix.
+
+    Unknown beats map to index -1, the extra all-zero last row/column.
+    """
+    names = sorted({*transitions, *(dst for row in transitions.values() for dst in row)})
+    index = {name: i for i, name in enumerate(names)}
+    matrix = np.zeros((len(names) + 1, len(names) + 1))
+    for src, row in transitions.items():
+        for dst, prob in row.items():
+            matrix[index[src], index[dst]] = prob
+    return index, matrix
+
+
 class WorldConstraintSolver:
     """Validates skeletons against world rules and scores coherence."""
 
+    # Parsed beat_transitions.json and its dense (index, matrix) form,
+    # shared read-only by every solver.
+    _shared_transitions: dict[str, dict[str, float]] | None = None
+    _shared_beat_table: tuple[dict[str, int], np.ndarray] | None = None
+
     def __init__(
         self,
         rules_engine: WorldRulesEngine | None = None,
@@ -28,11 +61,17 @@ class WorldConstraintSolver:
         self._load_transitions()
 
     def _load_transitions(self) -> None:
-        """Load beat_transitions.json from data/."""
-        path = _DATA_DIR / "beat_transitions.json"
-        if path.exists():
-            with open(path, encoding="utf-8") as f:
-                self._beat_transitions = json.load(f)
+        """Load beat_transitions.json from data/ (parsed once per process)."""
+        shared = WorldConstraintSolver._shared_transitions
+        table = WorldConstraintSolver._shared_beat_table
+        if shared is None or table is None:
+            path = _DATA_DIR / "beat_transitions.json"
+            shared = load_json(path) if path.exists() else {}
+            table = _beat_table(shared)
+            WorldConstraintSolver._shared_transitions = shared
+            WorldConstraintSolver._shared_beat_table = table
+        self._beat_transitions = shared
+        self._beat_index, self._beat_matrix = table
 
     # ------------------------------------------------------------------
     # Delegation to rules engine
@@ -77,10 +116,17 @@ class WorldConstraintSolver:
 
         The final value is clamped to [0.0, 1.0].
         """
-        affinity = self._affinity_score(skeleton)
+        affinity_sum, shared, pairs = self._pairwise_stats(skeleton)
+        if pairs:
+            # Map the average affinity from [-1, 1] to [0, 0.3].
+            affinity = 0.15 + 0.15 * (affinity_sum / pairs)
+            thematic = 0.4 * (shared / pairs)
+        else:
+            # Neutral when there's nothing to compare.
+            affinity = 0.15
+            thematic = 0.2
         penalty = self._violation_penalty(skeleton)
         beat_flow = self._beat_flow_score(skeleton)
-        thematic = self._thematic_consistency(skeleton)
 
         raw = affinity + penalty + beat_flow + thematic
         return max(0.0, min(1.0, raw))
@@ -95,24 +141,25 @@ class WorldConstraintSolver:
     # Internal scoring helpers
     # ------------------------------------------------------------------
 
-    def _affinity_score(self, skeleton: StorySkeleton) -> float:
-        """Average pairwise affinity, mapped to 0 -- 0.3."""
+    def _pairwise_stats(self, skeleton: StorySkeleton) -> tuple[float, int, int]:
+        """Affinity and tag-overlap factors, gathered over one set of pair indices.
+
+        Returns ``(affinity_sum, shared_tag_pairs, pair_count)``.
+        """
         atoms = skeleton.atoms
-        if len(atoms) < 2:
-            return 0.15  # neutral when there's nothing to compare
-
-        total = 0.0
-        count = 0
-        for i in range(len(atoms)):
-            for j in range(i + 1, len(atoms)):
-                total += self._catalogue.get_affinity(
-                    atoms[i].name, atoms[j].name
-                )
-                count += 1
-
-        avg = total / count  # in [-1, 1]
-        # Map [-1, 1] -> [0, 0.3]
-        return 0.15 + 0.15 * avg
+        n = len(atoms)
+        if n < 2:
+            return 0.0, 0, 0
+
+        upper = np.triu_indices(n, 1)
+        matrix = self._catalogue.affinity_matrix([a.name for a in atoms])
+        affinity_sum = _ordered_sum(matrix[upper])
+
+        # Object dtype keeps arbitrary-width int masks; & dispatches per pair.
+        masks = np.array(label_masks(atoms, lambda atom: atom.tags), dtype=object)
+        shared = int(np.count_nonzero(masks[upper[0]] & masks[upper[1]]))
+
+        return affinity_sum, shared, len(upper[0])
 
     def _violation_penalty(self, skeleton: StorySkeleton) -> float:
         """Negative penalty from invariant violations."""
@@ -128,33 +175,8 @@ class WorldConstraintSolver:
         if len(beats) < 2:
             return 0.15
 
-        total_prob = 0.0
-        pairs = 0
-        for i in range(len(beats) - 1):
-            src = beats[i]
-            dst = beats[i + 1]
-            transitions = self._beat_transitions.get(src, {})
-            total_prob += transitions.get(dst, 0.0)
-            pairs += 1
-
-        avg_prob = total_prob / pairs  # in [0, 1]
+        get_index = self._beat_index.get
+        idx = np.fromiter((get_index(b, -1) for b in beats), dtype=np.intp, count=len(beats))
+        probs = self._beat_matrix[idx[:-1], idx[1:]]
+        avg_prob = _ordered_sum(probs) / len(probs)  # in [0, 1]
         return 0.3 * avg_prob
-
-    def _thematic_consistency(self, skeleton: StorySkeleton) -> float:
-        """Proportion of atom pairs sharing at least one tag, mapped to 0 -- 0.4."""
-        atoms = skeleton.atoms
-        if len(atoms) < 2:
-            return 0.2
-
-        shared = 0
-        total = 0
-        for i in range(len(atoms)):
-            tags_i = set(atoms[i].tags)
-            for j in range(i + 1, len(atoms)):
-                tags_j = set(atoms[j].tags)
-                if tags_i & tags_j:
-                    shared += 1
-                total += 1
-
-        ratio = shared / total if total else 0.0
-        return 0.4 * ratio
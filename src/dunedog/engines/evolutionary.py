@@ -2,15 +2,21 @@
 
 from __future__ import annotations
 
-import json
 import random
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+from itertools import accumulate, chain
 from pathlib import Path
 
+import numpy as np
+
 from dunedog.models.skeleton import StorySkeleton, EvolutionResult, GenerationStats
 from dunedog.models.config import EvolutionConfig
 from dunedog.models.atoms import StoryAtom, AtomCategory, AtomSource
 from dunedog.engines.constraint_solver import WorldConstraintSolver
 from dunedog.catalogues.loader import AtomCatalogue
+from dunedog.utils.bitmasks import label_masks
+from dunedog.utils.json_io import load_json
 
 _TONES = [
     "dark", "luminous", "tense", "enigmatic", "dreamlike",
@@ -18,6 +24,9 @@ _TONES = [
     "paranoid", "disorienting", "inverted", "convergent",
 ]
 
+# Below this population size pool dispatch costs more than it saves.
+_MIN_PARALLEL_POPULATION = 5
+
 _BEAT_TYPES = [
     "OPENING", "WORLD_BUILDING", "CHARACTER_INTRO", "INCITING_INCIDENT",
     "RISING_ACTION", "COMPLICATION", "MIDPOINT", "ESCALATION",
@@ -25,6 +34,24 @@ _BEAT_TYPES = [
 ]
 
 
+# ------------------------------------------------------------------
+# Process-pool scoring
+# ------------------------------------------------------------------
+
+_worker_solver: WorldConstraintSolver | None = None
+
+
+def _init_score_worker(solver: WorldConstraintSolver) -> None:
+    """Install the parent's constraint solver in a pool worker."""
+    global _worker_solver
+    _worker_solver = solver
+
+
+def _score_worker(skeleton: StorySkeleton) -> float:
+    """Coherence score of *skeleton*, computed in a pool worker."""
+    return _worker_solver.calculate_coherence_score(skeleton)
+
+
 class StoryEvolutionEngine:
     """Evolutionary optimizer for story skeletons.
 
@@ -32,6 +59,9 @@ class StoryEvolutionEngine:
     selection, crossover, mutation, and occasional wild-card injection.
     """
 
+    # Parsed wild_cards.json, shared read-only by every engine.
+    _shared_wild_cards: list[dict] | None = None
+
     def __init__(
         self,
         constraint_solver: WorldConstraintSolver | None = None,
@@ -40,19 +70,33 @@ class StoryEvolutionEngine:
         self._solver = constraint_solver or WorldConstraintSolver()
         self._catalogue = catalogue or AtomCatalogue.load()
         self._wild_cards = self._load_wild_cards()
+        # Replacement pools for atom mutation, resolved once per engine.
+        self._by_category: dict[AtomCategory, tuple[StoryAtom, ...]] = {
+            category: self._catalogue.get_by_category(category) for category in AtomCategory
+        }
+        # Evolved copy of each catalogue atom, keyed by id() of the original
+        # (kept alive by the catalogue).
+        self._evolved: dict[int, StoryAtom] = {}
+        # Scoring pool, created on first parallel evolve() and kept alive
+        # across generations until close().
+        self._pool: ProcessPoolExecutor | None = None
+        self._pool_workers = 0
+        # Cumulative rank-selection weights, keyed by population size.
+        self._rank_cum_weights_cache: dict[int, list[int]] = {}
 
     # ------------------------------------------------------------------
     # Data loading
     # ------------------------------------------------------------------
 
     def _load_wild_cards(self) -> list[dict]:
-        """Load wild_cards.json from data/."""
-        data_dir = Path(__file__).resolve().parents[3] / "data"
-        wc_path = data_dir / "wild_cards.json"
-        if wc_path.exists():
-            with open(wc_path, encoding="utf-8") as f:
-                return json.load(f)
-        return []
+        """Load wild_cards.json from data/ (parsed once per process)."""
+        shared = StoryEvolutionEngine._shared_wild_cards
+        if shared is None:
+            data_dir = Path(__file__).resolve().parents[3] / "data"
+            wc_path = data_dir / "wild_cards.json"
+            shared = load_json(wc_path) if wc_path.exists() else []
+            StoryEvolutionEngine._shared_wild_cards = shared
+        return shared
 
     # ------------------------------------------------------------------
     # Main evolutionary loop
@@ -79,47 +123,61 @@ class StoryEvolutionEngine:
         """
         fitness_history: list[float] = []
 
+        # Hoist per-offspring lookups out of the breeding loop.
+        rand = rng.random
+        crossover = self.crossover
+        mutate = self.mutate
+        copy_skeleton = self._copy_skeleton
+        crossover_rate = config.crossover_rate
+        mutation_rate = config.mutation_rate
+        wild_card_rate = config.wild_card_rate
+
         for gen in range(config.generations):
             # Score population
-            for skeleton in population:
-                self._solver.score_and_update(skeleton)
+            self._score_population(population, config)
 
-            population.sort(key=lambda s: s.coherence_score, reverse=True)
-            fitness_history.append(population[0].coherence_score)
+            fitness = np.fromiter(
+                (s.coherence_score for s in population),
+                dtype=np.float64,
+                count=len(population),
+            )
+            fitness_history.append(float(fitness.max()))
 
             # Create offspring
             offspring: list[StorySkeleton] = []
             n_offspring = len(population) // 2
+            parent_pairs = self._tournament_select_pairs(
+                population, fitness, n_offspring, config.tournament_size, rng,
+            )
 
-            for _ in range(n_offspring):
-                parent_a, parent_b = self.select_parents(
-                    population, "tournament", rng,
-                    tournament_size=config.tournament_size,
-                )
-                if rng.random() < config.crossover_rate:
-                    child_a, child_b = self.crossover(parent_a, parent_b, rng)
+            for parent_a, parent_b in parent_pairs:
+                if rand() < crossover_rate:
+                    child_a, child_b = crossover(parent_a, parent_b, rng)
                 else:
-                    child_a = self._copy_skeleton(parent_a)
-                    child_b = self._copy_skeleton(parent_b)
+                    child_a = copy_skeleton(parent_a)
+                    child_b = copy_skeleton(parent_b)
 
-                child_a = self.mutate(child_a, rng, config.mutation_rate)
-                child_b = self.mutate(child_b, rng, config.mutation_rate)
+                child_a = mutate(child_a, rng, mutation_rate)
+                child_b = mutate(child_b, rng, mutation_rate)
 
-                if rng.random() < config.wild_card_rate and self._wild_cards:
+                if rand() < wild_card_rate and self._wild_cards:
                     child_a = self.inject_wild_card(child_a, rng)
 
-                offspring.extend([child_a, child_b])
+                offspring.append(child_a)
+                offspring.append(child_b)
 
-            # Replace worst with offspring
-            population = population[: len(population) - len(offspring)] + offspring
+            # Replace worst with offspring; survivors need only be the top
+            # scorers, not sorted, so partition instead of sorting.
+            keep = len(population) - len(offspring)
+            survivors = np.argpartition(-fitness, keep - 1)[:keep] if keep > 0 else ()
+            population = [population[i] for i in survivors] + offspring
 
             # Update generation number
             for s in population:
                 s.stats.generation = gen + 1
 
         # Final scoring
-        for skeleton in population:
-            self._solver.score_and_update(skeleton)
+        self._score_population(population, config)
         population.sort(key=lambda s: s.coherence_score, reverse=True)
 
         return EvolutionResult(
@@ -129,6 +187,38 @@ class StoryEvolutionEngine:
             fitness_history=fitness_history,
         )
 
+    def _score_population(
+        self,
+        population: list[StorySkeleton],
+        config: EvolutionConfig,
+    ) -> None:
+        """Score every skeleton, in the process pool when configured."""
+        workers = config.max_workers
+        if workers <= 1 or len(population) < _MIN_PARALLEL_POPULATION:
+            for skeleton in population:
+                self._solver.score_and_update(skeleton)
+            return
+
+        if self._pool is None or self._pool_workers != workers:
+            self.close()
+            self._pool = ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_score_worker,
+                initargs=(self._solver,),
+            )
+            self._pool_workers = workers
+        chunksize = max(1, len(population) // (workers * 4))
+        scores = self._pool.map(_score_worker, population, chunksize=chunksize)
+        for skeleton, score in zip(population, scores):
+            skeleton.stats.coherence_score = score
+
+    def close(self) -> None:
+        """Shut down the scoring process pool, if one was started."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+            self._pool_workers = 0
+
     # ------------------------------------------------------------------
     # Selection
     # ------------------------------------------------------------------
@@ -151,11 +241,16 @@ class StoryEvolutionEngine:
             parent_a = self._tournament_select(population, tournament_size, rng)
             parent_b = self._tournament_select(population, tournament_size, rng)
         elif method == "roulette":
-            parent_a = self._roulette_select(population, rng)
-            parent_b = self._roulette_select(population, rng)
+            cum_weights = self._roulette_cum_weights(population)
+            parent_a = self._roulette_select(population, cum_weights, rng)
+            parent_b = self._roulette_select(population, cum_weights, rng)
         elif method == "rank":
-            parent_a = self._rank_select(population, rng)
-            parent_b = self._rank_select(population, rng)
+            # Population should already be sorted best-first, but sort to be
+            # safe; timsort is linear on already-sorted input.
+            ranked = sorted(population, key=lambda s: s.coherence_score, reverse=True)
+            cum_weights = self._rank_cum_weights(len(ranked))
+            parent_a = self._rank_select(ranked, cum_weights, rng)
+            parent_b = self._rank_select(ranked, cum_weights, rng)
         else:
             raise ValueError(f"Unknown selection method: {method!r}")
 
@@ -172,30 +267,67 @@ class StoryEvolutionEngine:
         contestants = rng.sample(population, k)
         return max(contestants, key=lambda s: s.coherence_score)
 
+    @staticmethod
+    def _tournament_select_pairs(
+        population: list[StorySkeleton],
+        fitness: np.ndarray,
+        n_pairs: int,
+        k: int,
+        rng: random.Random,
+    ) -> list[tuple[StorySkeleton, StorySkeleton]]:
+        """Run all tournaments for a generation in one vectorized pass.
+
+        *fitness* holds each individual's coherence score. Draws a
+        ``(2 * n_pairs, k)`` block of contestant indices (with replacement)
+        and keeps the fittest contestant of each row.
+        """
+        if n_pairs <= 0 or not population:
+            return []
+        gen = np.random.default_rng(rng.getrandbits(64))
+        idx = gen.integers(0, len(population), size=(2 * n_pairs, max(k, 1)))
+        winners = idx[np.arange(idx.shape[0]), fitness[idx].argmax(axis=1)]
+        return [
+            (population[a], population[b])
+            for a, b in winners.reshape(n_pairs, 2).tolist()
+        ]
+
+    @staticmethod
+    def _roulette_cum_weights(population: list[StorySkeleton]) -> list[float]:
+        """Cumulative fitness weights for roulette selection."""
+        # Shift scores so all are positive (minimum weight 0.01)
+        min_score = min(s.coherence_score for s in population)
+        shift = abs(min_score) + 0.01 if min_score < 0 else 0.01
+        return list(accumulate(s.coherence_score + shift for s in population))
+
     def _roulette_select(
         self,
         population: list[StorySkeleton],
+        cum_weights: list[float],
         rng: random.Random,
     ) -> StorySkeleton:
         """Select with probability proportional to fitness score."""
-        # Shift scores so all are positive (minimum weight 0.01)
-        min_score = min(s.coherence_score for s in population)
-        shift = abs(min_score) + 0.01 if min_score < 0 else 0.01
-        weights = [s.coherence_score + shift for s in population]
-        return rng.choices(population, weights=weights, k=1)[0]
+        return rng.choices(population, cum_weights=cum_weights, k=1)[0]
+
+    def _rank_cum_weights(self, n: int) -> list[int]:
+        """Cumulative rank weights for a population of *n*, cached per size."""
+        cum_weights = self._rank_cum_weights_cache.get(n)
+        if cum_weights is None:
+            # Rank weights: best gets n, worst gets 1
+            cum_weights = list(accumulate(range(n, 0, -1)))
+            self._rank_cum_weights_cache[n] = cum_weights
+        return cum_weights
 
     def _rank_select(
         self,
-        population: list[StorySkeleton],
+        ranked: list[StorySkeleton],
+        cum_weights: list[int],
         rng: random.Random,
     ) -> StorySkeleton:
-        """Select with probability proportional to rank (best = highest weight)."""
-        # Population should already be sorted best-first, but sort to be safe
-        ranked = sorted(population, key=lambda s: s.coherence_score, reverse=True)
-        n = len(ranked)
-        # Rank weights: best gets n, worst gets 1
-        weights = [n - i for i in range(n)]
-        return rng.choices(ranked, weights=weights, k=1)[0]
+        """Select with probability proportional to rank (best = highest weight).
+
+        *ranked* must be sorted best-first.
+        """
+        return rng.choices(ranked, cum_weights=cum_weights, k=1)[0]
 
     # ------------------------------------------------------------------
     # Crossover
@@ -217,8 +349,10 @@ class StoryEvolutionEngine:
         child_b = self._copy_skeleton(parent_b)
 
         # --- Atom crossover: swap a random subset ---
-        atoms_a = list(child_a.atoms)
-        atoms_b = list(child_b.atoms)
+        # The children own fresh lists (see StorySkeleton.clone), so atoms
+        # and beats are exchanged in place.
+        atoms_a = child_a.atoms
+        atoms_b = child_b.atoms
 
         if atoms_a and atoms_b:
             # Pick a random number of atoms to swap (at least 1)
@@ -229,24 +363,22 @@ class StoryEvolutionEngine:
             for ia, ib in zip(indices_a, indices_b):
                 atoms_a[ia], atoms_b[ib] = atoms_b[ib], atoms_a[ia]
 
-            child_a.atoms = atoms_a
-            child_b.atoms = atoms_b
-
         # --- Beat crossover: single-point splice ---
-        beats_a = list(child_a.beats)
-        beats_b = list(child_b.beats)
+        beats_a = child_a.beats
+        beats_b = child_b.beats
 
         if beats_a and beats_b:
             cut_a = rng.randint(1, max(1, len(beats_a) - 1))
             cut_b = rng.randint(1, max(1, len(beats_b) - 1))
-            new_beats_a = beats_a[:cut_a] + beats_b[cut_b:]
-            new_beats_b = beats_b[:cut_b] + beats_a[cut_a:]
-            child_a.beats = new_beats_a
-            child_b.beats = new_beats_b
+            tail_a = beats_a[cut_a:]
+            del beats_a[cut_a:]
+            beats_a.extend(beats_b[cut_b:])
+            del beats_b[cut_b:]
+            beats_b.extend(tail_a)
 
         # --- Theme tags: union ---
-        all_tags = list(dict.fromkeys(child_a.theme_tags + child_b.theme_tags))
-        child_a.theme_tags = list(all_tags)
+        all_tags = list(dict.fromkeys(chain(child_a.theme_tags, child_b.theme_tags)))
+        child_a.theme_tags = all_tags
         child_b.theme_tags = list(all_tags)
 
         # --- Tone: each child takes tone from one parent ---
@@ -291,46 +423,55 @@ class StoryEvolutionEngine:
         - Shuffle a segment of beats
         - Change tone randomly
         """
+        # Bind the RNG methods once; they run per atom and per position.
+        rand = rng.random
+        choice = rng.choice
+        atoms = skeleton.atoms
+        beats = skeleton.beats
+
         # Mutate atoms: each atom has `rate` chance of being replaced
-        if skeleton.atoms:
-            for i in range(len(skeleton.atoms)):
-                if rng.random() < rate:
-                    old = skeleton.atoms[i]
-                    replacements = self._catalogue.get_by_category(old.category)
+        if atoms:
+            by_category = self._by_category
+            for i in range(len(atoms)):
+                if rand() < rate:
+                    old = atoms[i]
+                    replacements = by_category[old.category]
                     if replacements:
-                        new_atom = rng.choice(replacements)
-                        # Copy and mark as evolved
-                        skeleton.atoms[i] = StoryAtom(
-                            name=new_atom.name,
-                            category=new_atom.category,
-                            source=AtomSource.EVOLVED,
-                            tags=list(new_atom.tags),
-                            rarity=new_atom.rarity,
-                            metadata=dict(new_atom.metadata),
-                        )
+                        atoms[i] = self._evolved_variant(choice(replacements))
 
         # Mutate spread positions: each position has `rate` chance of reroll
-        if skeleton.spread_positions and skeleton.atoms:
-            positions = list(skeleton.spread_positions.keys())
-            for pos in positions:
-                if rng.random() < rate:
-                    atom = rng.choice(skeleton.atoms)
-                    skeleton.spread_positions[pos] = atom.name
+        spread_positions = skeleton.spread_positions
+        if spread_positions and atoms:
+            for pos in list(spread_positions):
+                if rand() < rate:
+                    spread_positions[pos] = choice(atoms).name
 
         # Mutate beats: `rate` chance of shuffling a segment
-        if len(skeleton.beats) > 2 and rng.random() < rate:
-            start = rng.randint(0, len(skeleton.beats) - 2)
-            end = rng.randint(start + 1, len(skeleton.beats))
-            segment = skeleton.beats[start:end]
+        n_beats = len(beats)
+        if n_beats > 2 and rand() < rate:
+            start = rng.randint(0, n_beats - 2)
+            end = rng.randint(start + 1, n_beats)
+            segment = beats[start:end]
             rng.shuffle(segment)
-            skeleton.beats[start:end] = segment
+            beats[start:end] = segment
 
         # Mutate tone: `rate` chance of changing
-        if rng.random() < rate:
-            skeleton.tone = rng.choice(_TONES)
+        if rand() < rate:
+            skeleton.tone = choice(_TONES)
 
         return skeleton
 
+    def _evolved_variant(self, atom: StoryAtom) -> StoryAtom:
+        """Return *atom* marked as evolved, built once per catalogue atom.
+
+        Skeleton atoms are never edited in place, so every mutation that
+        picks the same catalogue atom can share one evolved copy.
+        """
+        variant = self._evolved.get(id(atom))
+        if variant is None:
+            variant = self._evolved[id(atom)] = replace(atom, source=AtomSource.EVOLVED)
+        return variant
+
     # ------------------------------------------------------------------
     # Wild card injection
     # ------------------------------------------------------------------
@@ -366,12 +507,19 @@ class StoryEvolutionEngine:
             add_tags = params.get("add_tags", [])
             if target_cat:
                 cat = AtomCategory(target_cat)
-                targets = [a for a in skeleton.atoms if a.category == cat]
+                targets = [
+                    i for i, a in enumerate(skeleton.atoms) if a.category == cat
+                ]
                 if targets:
-                    chosen = rng.choice(targets)
+                    # Atoms may be shared with other skeletons (see
+                    # StorySkeleton.clone), so swap in a re-tagged copy.
+                    idx = rng.choice(targets)
+                    chosen = skeleton.atoms[idx]
+                    new_tags = list(chosen.tags)
                     for tag in add_tags:
-                        if tag not in chosen.tags:
-                            chosen.tags.append(tag)
+                        if tag not in new_tags:
+                            new_tags.append(tag)
+                    skeleton.atoms[idx] = replace(chosen, tags=new_tags)
 
         elif effect == "change_tone":
             new_tone = params.get("tone")
@@ -425,34 +573,23 @@ class StoryEvolutionEngine:
         """
         if not population:
             return 1.0
-
-        target_names = frozenset(a.name for a in skeleton.atoms)
-        if not target_names:
+        # One target row: popcounts over int bitmasks beat building and
+        # multiplying an occupancy matrix.
+        target, *others = label_masks(
+            [skeleton, *population], lambda sk: (atom.name for atom in sk.atoms)
+        )
+        if not target:
             return 0.0
-
-        # Calculate Jaccard distance to each other skeleton
-        distances: list[float] = []
-        for other in population:
-            other_names = frozenset(a.name for a in other.atoms)
-            if not other_names and not target_names:
-                distances.append(0.0)
-                continue
-            union = target_names | other_names
-            intersection = target_names & other_names
-            if union:
-                jaccard_dist = 1.0 - len(intersection) / len(union)
-            else:
-                jaccard_dist = 0.0
-            distances.append(jaccard_dist)
-
-        # Average distance = novelty
-        avg_distance = sum(distances) / len(distances) if distances else 0.0
-        return max(0.0, min(1.0, avg_distance))
+        total = 0.0
+        for other in others:
+            # Union is never empty here because the target has atoms
+            total += 1.0 - (target & other).bit_count() / (target | other).bit_count()
+        return min(max(total / len(others), 0.0), 1.0)
 
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
 
     def _copy_skeleton(self, skeleton: StorySkeleton) -> StorySkeleton:
-        """Deep copy a skeleton for modification."""
-        return StorySkeleton.from_dict(skeleton.to_dict())
+        """Copy a skeleton for modification."""
+        return skeleton.clone()
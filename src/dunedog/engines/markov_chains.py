@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
-import json
+import bisect
+import itertools
 import random
 from pathlib import Path
 
+from dunedog.utils.json_io import load_json
+
 
 BEAT_TYPES = [
     "OPENING",
@@ -25,19 +28,43 @@ BEAT_TYPES = [
 
 VALID_ENDINGS = {"RESOLUTION", "DENOUEMENT"}
 
+# Sampling row: (keys, cumulative weights, total weight, last index).
+_Row = tuple[list[str], list[float], float, int]
+
 
 class NarrativeMarkovChain:
     """Generates narrative beat sequences via Markov-chain transitions,
     optionally modified by story-atom signals."""
 
+    # Parsed beat_transitions.json and its precompiled sampling rows for
+    # walks without atom modifiers, shared read-only by every chain.
+    _shared_transitions: dict[str, dict[str, float]] | None = None
+    _shared_rows: dict[str, _Row] | None = None
+
     def __init__(self) -> None:
         self._transitions = self._load_transitions()
+        self._rows = self._base_rows()
 
     def _load_transitions(self) -> dict[str, dict[str, float]]:
-        """Load beat_transitions.json from data/."""
-        data_dir = Path(__file__).resolve().parents[3] / "data"
-        with open(data_dir / "beat_transitions.json") as f:
-            return json.load(f)
+        """Load beat_transitions.json from data/ (parsed once per process)."""
+        shared = NarrativeMarkovChain._shared_transitions
+        if shared is None:
+            data_dir = Path(__file__).resolve().parents[3] / "data"
+            shared = load_json(data_dir / "beat_transitions.json")
+            NarrativeMarkovChain._shared_transitions = shared
+        return shared
+
+    def _base_rows(self) -> dict[str, _Row]:
+        """Sampling row for every beat, built once per process."""
+        rows = NarrativeMarkovChain._shared_rows
+        if rows is None:
+            beats = dict.fromkeys(BEAT_TYPES)
+            for src, row in self._transitions.items():
+                beats[src] = None
+                beats.update(dict.fromkeys(row))
+            rows = {beat: self._sampling_row(beat, None) for beat in beats}
+            NarrativeMarkovChain._shared_rows = rows
+        return rows
 
     # ------------------------------------------------------------------
     # Sequence generation
@@ -64,48 +91,86 @@ class NarrativeMarkovChain:
         """
         sequence: list[str] = ["OPENING"]
         current = "OPENING"
+        # Modifiers are fixed for the whole walk, so each beat's table is
+        # built at most once per call; without modifiers the precompiled
+        # rows are used directly.
+        rows = self._rows if not atom_modifiers else {}
+
+        sample = self._sample
+
+        # Phase 1: below both limits neither stop condition can hold, so
+        # just walk.
+        while len(sequence) < min_beats and len(sequence) < max_beats:
+            row = rows.get(current)
+            if row is None:
+                row = rows[current] = self._sampling_row(current, atom_modifiers)
+            current = sample(row, rng)
+            sequence.append(current)
 
-        while True:
-            # Check termination conditions
-            if len(sequence) >= min_beats and current in VALID_ENDINGS:
-                break
+        # Phase 2: stop at the first valid ending, or force one at max_beats
+        while current not in VALID_ENDINGS:
             if len(sequence) >= max_beats:
-                # Force a valid ending if we aren't already at one
-                if current not in VALID_ENDINGS:
-                    sequence.append(rng.choice(["RESOLUTION", "DENOUEMENT"]))
+                sequence.append(rng.choice(["RESOLUTION", "DENOUEMENT"]))
                 break
+            row = rows.get(current)
+            if row is None:
+                row = rows[current] = self._sampling_row(current, atom_modifiers)
+            current = sample(row, rng)
+            sequence.append(current)
 
-            # Get transition probabilities
-            probs = dict(self._transitions.get(current, {}))
+        return sequence
 
-            # If no transitions defined, fall back to uniform over all beats
-            if not probs:
-                probs = {b: 1.0 for b in BEAT_TYPES}
+    def _sampling_row(
+        self,
+        current: str,
+        atom_modifiers: dict[str, float] | None,
+    ) -> _Row:
+        """Candidate beats and cumulative weights for the step after *current*."""
+        # Get transition probabilities
+        probs = dict(self._transitions.get(current, {}))
 
-            # Apply atom modifiers (additive)
-            if atom_modifiers:
-                for beat, mod in atom_modifiers.items():
-                    probs[beat] = probs.get(beat, 0.0) + mod
+        # If no transitions defined, fall back to uniform over all beats
+        if not probs:
+            probs = {b: 1.0 for b in BEAT_TYPES}
 
-            # Prevent immediate repetition
-            probs[current] = 0.0
+        # Apply atom modifiers (additive)
+        if atom_modifiers:
+            for beat, mod in atom_modifiers.items():
+                probs[beat] = probs.get(beat, 0.0) + mod
 
-            # Pick next beat
-            current = self._weighted_choice(probs, rng)
-            sequence.append(current)
+        # Prevent immediate repetition
+        probs[current] = 0.0
 
-        return sequence
+        return self._cumulative(probs)
 
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
 
     @staticmethod
-    def _weighted_choice(options: dict[str, float], rng: random.Random) -> str:
-        """Pick from weighted options dict."""
-        items = list(options.items())
-        weights = [max(0.0, w) for _, w in items]  # clamp negatives
-        total = sum(weights)
+    def _cumulative(options: dict[str, float]) -> _Row:
+        """Build a sampling row from weighted options.
+
+        The row holds the keys, their clamped cumulative weights, the total
+        weight and the last valid index, so a draw does no setup work.
+        """
+        keys = list(options)
+        cum_weights = list(itertools.accumulate(max(0.0, w) for w in options.values()))  # clamp negatives
+        return keys, cum_weights, cum_weights[-1], len(keys) - 1
+
+    @staticmethod
+    def _sample(row: _Row, rng: random.Random) -> str:
+        """Draw from a precomputed sampling row.
+
+        Consumes the RNG exactly like ``rng.choices(keys, weights)``, so seeded
+        sequences are unchanged.
+        """
+        keys, cum_weights, total, hi = row
         if total == 0:
-            return rng.choice([k for k, _ in items])
-        return rng.choices([k for k, _ in items], weights=weights, k=1)[0]
+            return rng.choice(keys)
+        return keys[bisect.bisect(cum_weights, rng.random() * total, 0, hi)]
+
+    @classmethod
+    def _weighted_choice(cls, options: dict[str, float], rng: random.Random) -> str:
+        """Pick from weighted options dict."""
+        return cls._sample(cls._cumulative(options), rng)
@@ -2,28 +2,54 @@
 
 from __future__ import annotations
 
-import json
+import heapq
 import random
 from pathlib import Path
 
+import numpy as np
+
 from dunedog.models.atoms import AtomCategory, StoryAtom
 from dunedog.models.skeleton import GenerationStats, StorySkeleton
 from dunedog.catalogues.loader import AtomCatalogue
+from dunedog.utils.json_io import load_json
+
+# Tone signal tags, in tie-break order: the first tone with the most
+# matching signals wins.
+_TONE_SIGNALS: dict[str, tuple[str, ...]] = {
+    "dark": ("dark", "horror", "dread", "gothic", "fear", "death", "shadow"),
+    "luminous": ("hope", "wonder", "joy", "light", "love", "comedy", "warmth"),
+    "tense": ("tension", "conflict", "danger", "war", "suspense", "mystery"),
+}
+
+# One bit per signal tag, and each tone's mask over those bits.
+_TONE_TAG_BIT: dict[str, int] = {
+    tag: 1 << i
+    for i, tag in enumerate(tag for tags in _TONE_SIGNALS.values() for tag in tags)
+}
+_TONE_MASKS: tuple[tuple[str, int], ...] = tuple(
+    (tone, sum(_TONE_TAG_BIT[tag] for tag in tags)) for tone, tags in _TONE_SIGNALS.items()
+)
 
 
 class TarotSpreadEngine:
     """Map story atoms onto narrative spread positions, weighted by category
     preference and inter-atom affinity."""
 
+    # Parsed tarot_positions.json, shared read-only by every engine.
+    _shared_spreads: dict | None = None
+
     def __init__(self, catalogue: AtomCatalogue | None = None):
         self._catalogue = catalogue or AtomCatalogue.load()
         self._spreads = self._load_spreads()
 
     def _load_spreads(self) -> dict:
-        """Load tarot_positions.json from data/."""
-        data_dir = Path(__file__).resolve().parents[3] / "data"
-        with open(data_dir / "tarot_positions.json") as f:
-            return json.load(f)
+        """Load tarot_positions.json from data/ (parsed once per process)."""
+        shared = TarotSpreadEngine._shared_spreads
+        if shared is None:
+            data_dir = Path(__file__).resolve().parents[3] / "data"
+            shared = load_json(data_dir / "tarot_positions.json")
+            TarotSpreadEngine._shared_spreads = shared
+        return shared
 
     @property
     def spread_types(self) -> list[str]:
@@ -52,24 +78,34 @@ class TarotSpreadEngine:
         spread = self._spreads[spread_type]
         positions = spread["positions"]
         placed: dict[str, StoryAtom] = {}
-        used_names: set[str] = set()
+
+        # Unused atoms keyed by their index in *atoms*, overall and per
+        # category. Dicts keep the original order (so seeded draws see the
+        # same candidate lists) and drop placed atoms in O(1).
+        available: dict[int, StoryAtom] = dict(enumerate(atoms))
+        by_category: dict[AtomCategory, dict[int, StoryAtom]] = {}
+        by_name: dict[str, list[int]] = {}
+        for i, atom in available.items():
+            by_category.setdefault(atom.category, {})[i] = atom
+            by_name.setdefault(atom.name, []).append(i)
 
         for pos in positions:
             pos_name: str = pos["name"]
             preferred = {AtomCategory(c) for c in pos.get("preferred_categories", [])}
 
-            # Build pool of unused atoms
-            available = [a for a in atoms if a.name not in used_names]
-
             # Step 1: filter by preferred categories
-            matched = [a for a in available if a.category in preferred] if preferred else []
+            buckets = [by_category[c] for c in preferred if c in by_category]
+            if len(buckets) == 1:
+                matched = list(buckets[0].values())
+            else:
+                matched = [available[i] for i in heapq.merge(*buckets)]
 
             # Step 2: weight by affinity to already-placed atoms
             chosen = self._pick_by_affinity(matched, placed, rng)
 
             # Step 3: fallback — pick from any remaining unused atom
             if chosen is None and available:
-                chosen = self._pick_by_affinity(available, placed, rng)
+                chosen = self._pick_by_affinity(list(available.values()), placed, rng)
 
             # Step 4: fallback — sample from catalogue
             if chosen is None:
@@ -81,7 +117,9 @@ class TarotSpreadEngine:
 
             if chosen is not None:
                 placed[pos_name] = chosen
-                used_names.add(chosen.name)
+                # Retire every unused atom sharing the chosen name
+                for i in by_name.pop(chosen.name, ()):
+                    del by_category[available.pop(i).category][i]
 
         return placed
 
@@ -100,18 +138,19 @@ class TarotSpreadEngine:
         if not placed:
             return rng.choice(candidates)
 
-        placed_names = [a.name for a in placed.values()]
-        weights: list[float] = []
-        for cand in candidates:
-            aff_sum = sum(
-                self._catalogue.get_affinity(cand.name, pn) for pn in placed_names
-            )
-            # Shift so all weights are positive; base weight of 1.0
-            weights.append(1.0 + aff_sum)
+        block = self._catalogue.affinity_block(
+            [cand.name for cand in candidates],
+            [a.name for a in placed.values()],
+        )
+        # Left-to-right row sums (cumsum, not .sum()) keep the weights
+        # bit-identical to summing in Python, so seeded draws are unchanged.
+        aff_sums = np.cumsum(block, axis=1)[:, -1]
+        # Shift so all weights are positive; base weight of 1.0
+        weights = 1.0 + aff_sums
 
         # Clamp negatives
-        weights = [max(w, 0.01) for w in weights]
-        return rng.choices(candidates, weights=weights, k=1)[0]
+        weights = np.maximum(weights, 0.01)
+        return rng.choices(candidates, weights=weights.tolist(), k=1)[0]
 
     # ------------------------------------------------------------------
     # Interpretation
@@ -203,22 +242,16 @@ class TarotSpreadEngine:
     @staticmethod
     def _derive_tone(atoms: list[StoryAtom]) -> str:
         """Heuristic tone derivation from atom tags and categories."""
-        tag_set: set[str] = set()
+        # OR together the signal bits of every tag; non-signal tags add 0
+        tag_bit = _TONE_TAG_BIT.get
+        mask = 0
         for a in atoms:
-            tag_set.update(a.tags)
-
-        dark_signals = {"dark", "horror", "dread", "gothic", "fear", "death", "shadow"}
-        light_signals = {"hope", "wonder", "joy", "light", "love", "comedy", "warmth"}
-        tense_signals = {"tension", "conflict", "danger", "war", "suspense", "mystery"}
-
-        dark_count = len(tag_set & dark_signals)
-        light_count = len(tag_set & light_signals)
-        tense_count = len(tag_set & tense_signals)
-
-        best = max(
-            [("dark", dark_count), ("luminous", light_count), ("tense", tense_count)],
-            key=lambda t: t[1],
-        )
-        if best[1] == 0:
-            return "enigmatic"
-        return best[0]
+            for tag in a.tags:
+                mask |= tag_bit(tag, 0)
+
+        best_tone, best_count = "enigmatic", 0
+        for tone, tone_mask in _TONE_MASKS:
+            count = (mask & tone_mask).bit_count()
+            if count > best_count:
+                best_tone, best_count = tone, count
+        return best_tone
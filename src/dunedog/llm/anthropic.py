@@ -1,17 +1,31 @@
 """Anthropic LLM provider."""
 from __future__ import annotations
 
-import httpx
+from typing import AsyncIterator
 
-from .provider import DEFAULT_TIMEOUT, LLMError, LLMProvider
+from .provider import LLMError, LLMProvider
 
 
 class AnthropicProvider(LLMProvider):
     """Provider for the Anthropic messages API."""
 
     API_URL = "https://api.anthropic.com/v1/messages"
+    DISPLAY_NAME = "Anthropic"
 
     async def complete(self, messages: list[dict], **kwargs) -> str:
+        headers, body = self._request(messages, kwargs)
+        return await self._post_json(
+            self.API_URL, headers, body, lambda d: d["content"][0]["text"]
+        )
+
+    async def stream(self, messages: list[dict], **kwargs) -> AsyncIterator[str]:
+        headers, body = self._request(messages, kwargs)
+        body["stream"] = True
+        async for piece in self._stream_sse(self.API_URL, headers, body, self._delta_text):
+            yield piece
+
+    def _request(self, messages: list[dict], kwargs: dict) -> tuple[dict, dict]:
+        """Headers and body for a messages request."""
         headers = {
             "x-api-key": self.api_key,
             "anthropic-version": "2023-06-01",
@@ -35,17 +49,14 @@ class AnthropicProvider(LLMProvider):
         }
         if system_content:
             body["system"] = system_content
-
-        try:
-            async with httpx.AsyncClient(timeout=DEFAULT_TIMEOUT) as client:
-                resp = await client.post(self.API_URL, headers=headers, json=body)
-                resp.raise_for_status()
-                data = resp.json()
-                return data["content"][0]["text"]
-        except httpx.HTTPStatusError as exc:
-            body = exc.response.text[:500]
-            raise LLMError(
-                f"Anthropic API returned {exc.response.status_code}: {body}"
-            ) from exc
-        except (httpx.HTTPError, KeyError, IndexError) as exc:
-            raise LLMError(f"Anthropic request failed: {exc}") from exc
+        return headers, body
+
+    @staticmethod
+    def _delta_text(event: dict) -> str:
+        """Text carried by one stream event; only text deltas carry any."""
+        kind = event.get("type")
+        if kind == "content_block_delta":
+            return event["delta"].get("text", "")
+        if kind == "error":
+            raise LLMError(f"Anthropic stream error: {event.get('error')}")
+        return ""
@@ -1,15 +1,14 @@
 """ChatGPT unofficial backend provider (best-effort)."""
 from __future__ import annotations
 
-import httpx
-
-from .provider import DEFAULT_TIMEOUT, LLMError, LLMProvider
+from .provider import LLMProvider
 
 
 class ChatGPTProvider(LLMProvider):
     """Best-effort provider using the unofficial ChatGPT backend API."""
 
     API_URL = "https://chatgpt.com/backend-api/conversation"
+    DISPLAY_NAME = "ChatGPT"
 
     async def complete(self, messages: list[dict], **kwargs) -> str:
         headers = {
@@ -37,16 +36,6 @@ class ChatGPTProvider(LLMProvider):
             ],
             "model": self.model,
         }
-        try:
-            async with httpx.AsyncClient(timeout=DEFAULT_TIMEOUT) as client:
-                resp = await client.post(self.API_URL, headers=headers, json=body)
-                resp.raise_for_status()
-                data = resp.json()
-                return data["message"]["content"]["parts"][0]
-        except httpx.HTTPStatusError as exc:
-            body = exc.response.text[:500]
-            raise LLMError(
-                f"ChatGPT API returned {exc.response.status_code}: {body}"
-            ) from exc
-        except (httpx.HTTPError, KeyError, IndexError) as exc:
-            raise LLMError(f"ChatGPT request failed: {exc}") from exc
+        return await self._post_json(
+            self.API_URL, headers, body, lambda d: d["message"]["content"]["parts"][0]
+        )
@@ -1,17 +1,31 @@
 """OpenAI LLM provider."""
 from __future__ import annotations
 
-import httpx
+from typing import AsyncIterator
 
-from .provider import DEFAULT_TIMEOUT, LLMError, LLMProvider
+from .provider import LLMProvider
 
 
 class OpenAIProvider(LLMProvider):
     """Provider for the OpenAI chat completions API."""
 
     API_URL = "https://api.openai.com/v1/chat/completions"
+    DISPLAY_NAME = "OpenAI"
 
     async def complete(self, messages: list[dict], **kwargs) -> str:
+        headers, body = self._request(messages, kwargs)
+        return await self._post_json(
+            self.API_URL, headers, body, lambda d: d["choices"][0]["message"]["content"]
+        )
+
+    async def stream(self, messages: list[dict], **kwargs) -> AsyncIterator[str]:
+        headers, body = self._request(messages, kwargs)
+        body["stream"] = True
+        async for piece in self._stream_sse(self.API_URL, headers, body, self._delta_text):
+            yield piece
+
+    def _request(self, messages: list[dict], kwargs: dict) -> tuple[dict, dict]:
+        """Headers and body for a chat completion request."""
         headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
@@ -26,16 +40,10 @@ class OpenAIProvider(LLMProvider):
                 "temperature", self.kwargs.get("temperature", 0.8)
             ),
         }
-        try:
-            async with httpx.AsyncClient(timeout=DEFAULT_TIMEOUT) as client:
-                resp = await client.post(self.API_URL, headers=headers, json=body)
-                resp.raise_for_status()
-                data = resp.json()
-                return data["choices"][0]["message"]["content"]
-        except httpx.HTTPStatusError as exc:
-            body = exc.response.text[:500]
-            raise LLMError(
-                f"OpenAI API returned {exc.response.status_code}: {body}"
-            ) from exc
-        except (httpx.HTTPError, KeyError, IndexError) as exc:
-            raise LLMError(f"OpenAI request failed: {exc}") from exc
+        return headers, body
+
+    @staticmethod
+    def _delta_text(event: dict) -> str:
+        """Text carried by one streamed chunk (usage-only chunks have none)."""
+        choices = event.get("choices")
+        return (choices[0]["delta"].get("content") or "") if choices else ""
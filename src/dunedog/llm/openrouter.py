@@ -1,21 +1,33 @@
 """OpenRouter LLM provider."""
 from __future__ import annotations
 
-import httpx
+from typing import AsyncIterator
 
-from .provider import DEFAULT_TIMEOUT, LLMError, LLMProvider
+from .provider import LLMProvider
 
 
 class OpenRouterProvider(LLMProvider):
     """Provider for the OpenRouter chat completions API."""
 
     API_URL = "https://openrouter.ai/api/v1/chat/completions"
+    DISPLAY_NAME = "OpenRouter"
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.last_usage: dict | None = None
 
     async def complete(self, messages: list[dict], **kwargs) -> str:
+        headers, body = self._request(messages, kwargs)
+        return await self._post_json(self.API_URL, headers, body, self._extract)
+
+    async def stream(self, messages: list[dict], **kwargs) -> AsyncIterator[str]:
+        headers, body = self._request(messages, kwargs)
+        body["stream"] = True
+        async for piece in self._stream_sse(self.API_URL, headers, body, self._delta_text):
+            yield piece
+
+    def _request(self, messages: list[dict], kwargs: dict) -> tuple[dict, dict]:
+        """Headers and body for a chat completion request."""
         headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
@@ -31,17 +43,16 @@ class OpenRouterProvider(LLMProvider):
                 "temperature", self.kwargs.get("temperature", 0.8)
             ),
         }
-        try:
-            async with httpx.AsyncClient(timeout=DEFAULT_TIMEOUT) as client:
-                resp = await client.post(self.API_URL, headers=headers, json=body)
-                resp.raise_for_status()
-                data = resp.json()
-                self.last_usage = data.get("usage")
-                return data["choices"][0]["message"]["content"]
-        except httpx.HTTPStatusError as exc:
-            body = exc.response.text[:500]
-            raise LLMError(
-                f"OpenRouter API returned {exc.response.status_code}: {body}"
-            ) from exc
-        except (httpx.HTTPError, KeyError, IndexError) as exc:
-            raise LLMError(f"OpenRouter request failed: {exc}") from exc
+        return headers, body
+
+    def _extract(self, data: dict) -> str:
+        """Record token usage and return the completion text."""
+        self.last_usage = data.get("usage")
+        return data["choices"][0]["message"]["content"]
+
+    def _delta_text(self, event: dict) -> str:
+        """Text carried by one streamed chunk; the final chunk carries usage."""
+        if event.get("usage"):
+            self.last_usage = event["usage"]
+        choices = event.get("choices")
+        return (choices[0]["delta"].get("content") or "") if choices else ""
@@ -1,10 +1,66 @@
 """Abstract LLM provider and factory."""
 from __future__ import annotations
+
+import asyncio
+import contextlib
+import functools
+import importlib.util
+import logging
+import random
 from abc import ABC, abstractmethod
+from typing import Any, AsyncIterator, Callable, Iterator
 
 import httpx
 
+from dunedog.utils.json_io import dumps_json, loads_json
+
+log = logging.getLogger(__name__)
+
 DEFAULT_TIMEOUT = httpx.Timeout(connect=10.0, read=120.0, write=30.0, pool=10.0)
+DEFAULT_LIMITS = httpx.Limits(
+    max_keepalive_connections=32, max_connections=64, keepalive_expiry=300.0
+)
+
+# Transient statuses worth retrying, and the retry defaults (overridable per
+# provider, see LLMConfig.max_retries / backoff_base).
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BACKOFF_BASE = 1.0
+_BACKOFF_CAP = 30.0
+# Jitter source kept apart from the global RNG so retries never disturb
+# seeded generation.
+_JITTER_RNG = random.Random()
+
+# HTTP/2 lets concurrent requests multiplex over one connection; httpx
+# needs the optional h2 package for it and falls back to HTTP/1.1 without.
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# One pooled client shared by every provider. httpx connections belong to
+# the event loop that opened them, so a new loop (e.g. another asyncio.run)
+# gets a fresh client.
+_SHARED_CLIENT: httpx.AsyncClient | None = None
+_SHARED_CLIENT_LOOP: asyncio.AbstractEventLoop | None = None
+
+
+async def get_client() -> httpx.AsyncClient:
+    """Return the shared keep-alive client for the running event loop."""
+    global _SHARED_CLIENT, _SHARED_CLIENT_LOOP
+    loop = asyncio.get_running_loop()
+    if _SHARED_CLIENT is None or _SHARED_CLIENT_LOOP is not loop or _SHARED_CLIENT.is_closed:
+        _SHARED_CLIENT = httpx.AsyncClient(
+            timeout=DEFAULT_TIMEOUT, limits=DEFAULT_LIMITS, http2=_HTTP2_AVAILABLE,
+        )
+        _SHARED_CLIENT_LOOP = loop
+    return _SHARED_CLIENT
+
+
+async def aclose_client() -> None:
+    """Close the shared client, if one is open on the running loop."""
+    global _SHARED_CLIENT, _SHARED_CLIENT_LOOP
+    client, loop = _SHARED_CLIENT, _SHARED_CLIENT_LOOP
+    _SHARED_CLIENT = _SHARED_CLIENT_LOOP = None
+    if client is not None and loop is asyncio.get_running_loop():
+        await client.aclose()
 
 
 class LLMError(Exception):
@@ -15,10 +71,25 @@ class LLMError(Exception):
 class LLMProvider(ABC):
     """Abstract base for LLM providers."""
 
-    def __init__(self, api_key: str = "", model: str = "", **kwargs):
+    # Provider name used in error messages.
+    DISPLAY_NAME = "LLM"
+
+    def __init__(
+        self,
+        api_key: str = "",
+        model: str = "",
+        client: httpx.AsyncClient | None = None,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        backoff_base: float = DEFAULT_BACKOFF_BASE,
+        **kwargs,
+    ):
         self.api_key = api_key
         self.model = model
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
         self.kwargs = kwargs
+        # Caller-owned client override; None uses the shared client.
+        self._client = client
 
     def __repr__(self) -> str:
         key_display = "***" if self.api_key else ""
@@ -29,6 +100,124 @@ class LLMProvider(ABC):
         """Send messages to LLM and return response text."""
         ...
 
+    async def stream(self, messages: list[dict], **kwargs) -> AsyncIterator[str]:
+        """Yield the response text in pieces as it arrives.
+
+        Providers without a streaming API yield the whole completion once.
+        """
+        yield await self.complete(messages, **kwargs)
+
+    async def _post_json(
+        self,
+        url: str,
+        headers: dict[str, str],
+        body: dict,
+        extract: Callable[[Any], str],
+    ) -> str:
+        """POST *body* as JSON to *url* and return ``extract(response_json)``.
+
+        429 and 5xx responses are retried up to ``max_retries`` times with
+        jittered exponential backoff (or the server's Retry-After), reusing
+        the pooled connection. HTTP, decoding and response-shape errors are
+        raised as LLMError.
+        """
+        with self._translate_errors():
+            client = await self._get_client()
+            content = dumps_json(body)
+            for attempt in range(self.max_retries + 1):
+                resp = await client.post(url, headers=headers, content=content)
+                if resp.status_code not in _RETRY_STATUSES or attempt == self.max_retries:
+                    break
+                delay = self._retry_delay(resp, attempt)
+                self._log_retry(resp, delay, attempt)
+                await asyncio.sleep(delay)
+            resp.raise_for_status()
+            return extract(loads_json(resp.content))
+
+    async def _stream_sse(
+        self,
+        url: str,
+        headers: dict[str, str],
+        body: dict,
+        extract: Callable[[Any], str],
+    ) -> AsyncIterator[str]:
+        """POST *body* and yield ``extract(event)`` for each server-sent event.
+
+        Events are decoded from ``data:`` lines as they arrive, up to a
+        ``[DONE]`` marker; empty pieces are skipped. Opening the stream is
+        retried like _post_json, and errors are raised as LLMError.
+        """
+        with self._translate_errors():
+            client = await self._get_client()
+            content = dumps_json(body)
+            for attempt in range(self.max_retries + 1):
+                async with client.stream("POST", url, headers=headers, content=content) as resp:
+                    if resp.status_code in _RETRY_STATUSES and attempt < self.max_retries:
+                        delay = self._retry_delay(resp, attempt)
+                        self._log_retry(resp, delay, attempt)
+                    else:
+                        if resp.is_error:
+                            await resp.aread()  # so the error message can show the body
+                        resp.raise_for_status()
+                        async for line in resp.aiter_lines():
+                            if not line.startswith("data:"):
+                                continue  # comments, event names, keep-alives
+                            data = line[5:].strip()
+                            if data == "[DONE]":
+                                break
+                            piece = extract(loads_json(data))
+                            if piece:
+                                yield piece
+                        return
+                await asyncio.sleep(delay)
+
+    @contextlib.contextmanager
+    def _translate_errors(self) -> Iterator[None]:
+        """Re-raise HTTP, decoding and response-shape errors as LLMError."""
+        name = self.DISPLAY_NAME
+        try:
+            yield
+        except httpx.HTTPStatusError as exc:
+            text = exc.response.text[:500]
+            raise LLMError(
+                f"{name} API returned {exc.response.status_code}: {text}"
+            ) from exc
+        except (httpx.HTTPError, ValueError, KeyError, IndexError) as exc:
+            raise LLMError(f"{name} request failed: {exc}") from exc
+
+    def _retry_delay(self, resp: httpx.Response, attempt: int) -> float:
+        """Seconds to wait before retry number *attempt* (0-based)."""
+        retry_after = resp.headers.get("retry-after")
+        if retry_after is not None:
+            try:
+                # Never let the server park us for longer than our own cap
+                return min(max(float(retry_after), 0.0), _BACKOFF_CAP)
+            except ValueError:
+                pass  # HTTP-date form; fall back to backoff
+        base = self.backoff_base
+        return min(_BACKOFF_CAP, base * 2 ** attempt) + _JITTER_RNG.uniform(0, base)
+
+    def _log_retry(self, resp: httpx.Response, delay: float, attempt: int) -> None:
+        """Warn that a transient error is about to be retried after *delay*."""
+        log.warning(
+            "%s API returned %d; retrying in %.1fs (retry %d of %d)",
+            self.DISPLAY_NAME, resp.status_code, delay, attempt + 1, self.max_retries,
+        )
+
+    async def _get_client(self) -> httpx.AsyncClient:
+        """The HTTP client to send requests with."""
+        if self._client is not None:
+            return self._client
+        return await get_client()
+
+    async def aclose(self) -> None:
+        """Release connections owned by this provider.
+
+        Providers own none: the shared client may still be serving other
+        providers, so its owner (e.g. the CLI) closes it with aclose_client(),
+        and a client passed to the constructor is left to whoever created it.
+        """
+
 
 DEFAULT_MODELS = {
     "openai": "gpt-4o",
@@ -37,29 +226,38 @@ DEFAULT_MODELS = {
     "chatgpt": "gpt-4o",
 }
 
+# Provider name -> (module, class). Modules are imported on first use, so
+# only the providers actually requested are loaded.
+_PROVIDER_CLASSES: dict[str, tuple[str, str]] = {
+    "openai": (".openai", "OpenAIProvider"),
+    "anthropic": (".anthropic", "AnthropicProvider"),
+    "openrouter": (".openrouter", "OpenRouterProvider"),
+    "chatgpt": (".chatgpt", "ChatGPTProvider"),
+}
 
-def create_provider(
-    provider_name: str, api_key: str = "", model: str = "", **kwargs
-) -> LLMProvider:
-    """Factory function to create the right provider."""
-    if not model:
-        model = DEFAULT_MODELS.get(provider_name, "")
-
-    if provider_name == "openai":
-        from .openai import OpenAIProvider
 
-        return OpenAIProvider(api_key=api_key, model=model, **kwargs)
-    elif provider_name == "anthropic":
-        from .anthropic import AnthropicProvider
+@functools.lru_cache(maxsize=None)
+def _provider_class(provider_name: str) -> type[LLMProvider]:
+    """Import and return the provider class registered as *provider_name*."""
+    try:
+        module_name, class_name = _PROVIDER_CLASSES[provider_name]
+    except KeyError:
+        raise LLMError(f"Unknown provider: {provider_name}") from None
+    return getattr(importlib.import_module(module_name, __package__), class_name)
 
-        return AnthropicProvider(api_key=api_key, model=model, **kwargs)
-    elif provider_name == "openrouter":
-        from .openrouter import OpenRouterProvider
 
-        return OpenRouterProvider(api_key=api_key, model=model, **kwargs)
-    elif provider_name == "chatgpt":
-        from .chatgpt import ChatGPTProvider
+def create_provider(
+    provider_name: str,
+    api_key: str = "",
+    model: str = "",
+    client: httpx.AsyncClient | None = None,
+    **kwargs,
+) -> LLMProvider:
+    """Factory function to create the right provider.
 
-        return ChatGPTProvider(api_key=api_key, model=model, **kwargs)
-    else:
-        raise LLMError(f"Unknown provider: {provider_name}")
+    *client* overrides the shared HTTP client (e.g. a mock in tests).
+    """
+    if not model:
+        model = DEFAULT_MODELS.get(provider_name, "")
+    kwargs["client"] = client
+    return _provider_class(provider_name)(api_key=api_key, model=model, **kwargs)
@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
+import io
 import json
 import logging
 import re
 from dataclasses import dataclass, field
+from typing import AsyncIterator
 
 from dunedog.llm.provider import LLMProvider
 from dunedog.models.config import LLMConfig
@@ -13,6 +16,15 @@ from dunedog.models.skeleton import StorySkeleton
 
 log = logging.getLogger(__name__)
 
+SYSTEM_PROMPT = "You are a literary storyteller. You create vivid, interconnected short stories from narrative blueprints."
+
+# Response-format patterns, compiled once.
+_STRATEGY_RE = re.compile(r"STRATEGY:\s*(.+)")
+_SECTION_SPLIT_RE = re.compile(r"\n-{3,}\n")
+_TITLE_RE = re.compile(r"TITLE:\s*(.+)")
+# "BATCH <n>:" on a line of its own opens the answer to the n-th batch.
+_BATCH_HEADER_RE = re.compile(r"^BATCH\s+(\d+):\s*$", re.MULTILINE)
+
 
 SYNTHESIS_STRATEGIES = {
     "BRAIDED": "Weave parallel stories with thematic echoes. Each story stands alone but shares imagery, motifs, or emotional arcs with the others.",
@@ -21,8 +33,26 @@ SYNTHESIS_STRATEGIES = {
     "ANTHOLOGY_FRAME": "Create a meta-story that contains the others. A narrator, a place, or a ritual frames the individual tales.",
 }
 
-
-@dataclass
+# Prompt pieces that never change between calls.
+_STRATEGIES_DESC = "\n".join(f"- {k}: {v}" for k, v in SYNTHESIS_STRATEGIES.items())
+_TRAILER_TEMPLATE = (
+    "\nCombine these skeletons into 2-4 interconnected short stories.\n"
+    "Each story should be at most {max_lines} lines long.\n"
+    "Draw characters, objects, locations, and tensions from the skeletons.\n"
+    "Each skeleton need not map 1:1 to a story — blend and recombine freely.\n"
+    "\nFormat your response as:\n"
+    "STRATEGY: <strategy name>\n"
+    "---\n"
+    "TITLE: <story title>\n"
+    "<story text>\n"
+    "---\n"
+    "TITLE: <next story title>\n"
+    "<story text>\n"
+    "---"
+)
+
+
+@dataclass(slots=True)
 class SynthesizedStory:
     """A final story produced by LLM synthesis."""
     title: str = ""
@@ -60,10 +90,27 @@ class StorySynthesizer:
         Returns:
             List of SynthesizedStory objects.
         """
+        stories = [story async for story in self.synthesize_stream(skeletons, strategy)]
+        log.info("Parsed %d stories", len(stories))
+        for s in stories:
+            log.info("  \"%s\" (%d chars, strategy=%s)", s.title, len(s.content), s.strategy)
+        return stories
+
+    async def synthesize_stream(
+        self,
+        skeletons: list[StorySkeleton],
+        strategy: str = "",
+    ) -> AsyncIterator[SynthesizedStory]:
+        """Like synthesize(), but yield each story as soon as it has arrived.
+
+        Stories are parsed while the rest of the response is still
+        downloading. A story yielded before the response's STRATEGY line
+        (normally the first line) has its strategy updated when it arrives.
+        """
         # Limit to max_stories_for_llm
         top = skeletons[: self._config.max_stories_for_llm]
         if not top:
-            return []
+            return
 
         strat = strategy or self._config.synthesis_strategy
         log.info("Synthesizing from %d skeletons via %s (strategy=%s)",
@@ -71,107 +118,274 @@ class StorySynthesizer:
 
         prompt = self.build_prompt(top, strat)
         messages = [
-            {"role": "system", "content": "You are a literary storyteller. You create vivid, interconnected short stories from narrative blueprints."},
+            {"role": "system", "content": SYSTEM_PROMPT},
             {"role": "user", "content": prompt},
         ]
 
         log.info("Sending request to LLM...")
+        parser = _StoryStreamParser(strat)
+        received = 0
+        async for chunk in self._provider.stream(
+            messages,
+            temperature=self._config.temperature,
+        ):
+            received += len(chunk)
+            for story in parser.feed(chunk):
+                yield story
+        for story in parser.close():
+            yield story
+        log.info("LLM response received (%d chars)", received)
+
+    async def synthesize_all_strategies(
+        self, skeletons: list[StorySkeleton]
+    ) -> dict[str, list[SynthesizedStory]]:
+        """Synthesize *skeletons* once per strategy, with the requests in flight together.
+
+        Returns stories keyed by strategy name, in SYNTHESIS_STRATEGIES order.
+        The concurrent requests share the pooled (HTTP/2 when available) client.
+        """
+        names = list(SYNTHESIS_STRATEGIES)
+        results = await asyncio.gather(*(self.synthesize(skeletons, name) for name in names))
+        return dict(zip(names, results))
+
+    async def synthesize_many(
+        self,
+        skeleton_groups: list[list[StorySkeleton]],
+        strategies: list[str] | None = None,
+    ) -> list[list[SynthesizedStory]]:
+        """Synthesize several skeleton groups in a single LLM request.
+
+        Each group is one batch, with the strategy at the same index (empty
+        to let the LLM choose). Sending them together pays the request
+        round trip once instead of once per group.
+
+        Returns one story list per group, empty for groups the response
+        left out.
+        """
+        if strategies is None:
+            strategies = [""] * len(skeleton_groups)
+        if len(strategies) != len(skeleton_groups):
+            raise ValueError(
+                f"Got {len(strategies)} strategies for {len(skeleton_groups)} skeleton groups"
+            )
+        if not skeleton_groups:
+            return []
+
+        limit = self._config.max_stories_for_llm
+        strats = [s or self._config.synthesis_strategy for s in strategies]
+        log.info("Synthesizing %d batches via %s in one request",
+                 len(skeleton_groups), self._provider.__class__.__name__)
+
+        prompt = self.build_batch_prompt([g[:limit] for g in skeleton_groups], strats)
+        messages = [
+            {"role": "system", "content": SYSTEM_PROMPT},
+            {"role": "user", "content": prompt},
+        ]
         response = await self._provider.complete(
             messages,
             temperature=self._config.temperature,
         )
         log.info("LLM response received (%d chars)", len(response))
+        return self.parse_batch_response(response, strats)
 
-        stories = self.parse_response(response, strat)
-        log.info("Parsed %d stories", len(stories))
-        for s in stories:
-            log.info("  \"%s\" (%d chars, strategy=%s)", s.title, len(s.content), s.strategy)
-        return stories
+    def build_batch_prompt(
+        self,
+        skeleton_groups: list[list[StorySkeleton]],
+        strategies: list[str],
+    ) -> str:
+        """Build one prompt holding a labelled synthesis task per group."""
+        parts = [
+            f"You will answer {len(skeleton_groups)} independent batches.",
+            "Answer every batch. Start each answer with a line of the form",
+            "BATCH <n>:",
+            "then follow the response format that batch asks for.\n",
+        ]
+        for i, (group, strategy) in enumerate(zip(skeleton_groups, strategies), 1):
+            parts.append(f"=== BATCH {i} ===")
+            parts.append(self.build_prompt(group, strategy))
+            parts.append("")
+        return "\n".join(parts)
+
+    def parse_batch_response(
+        self, text: str, strategies: list[str]
+    ) -> list[list[SynthesizedStory]]:
+        """Split a batched response on its BATCH headers and parse each part."""
+        results: list[list[SynthesizedStory]] = [[] for _ in strategies]
+        pieces = _BATCH_HEADER_RE.split(text)
+        # pieces = [preamble, n1, body1, n2, body2, ...]
+        for number, body in zip(pieces[1::2], pieces[2::2]):
+            index = int(number) - 1
+            if 0 <= index < len(results):
+                results[index] = self.parse_response(body, strategies[index])
+        return results
 
     def build_prompt(self, skeletons: list[StorySkeleton], strategy: str = "") -> str:
         """Build synthesis prompt from skeletons."""
-        lines = [
-            "Below are narrative skeleton blueprints extracted from a stochastic chaos engine.",
-            "Each skeleton contains story atoms (characters, objects, locations, tensions, triggers, qualities),",
-            "narrative beats, and thematic tags.\n",
-        ]
+        buf = io.StringIO()
+        write = buf.write
+        write(
+            "Below are narrative skeleton blueprints extracted from a stochastic chaos engine.\n"
+            "Each skeleton contains story atoms (characters, objects, locations, tensions, triggers, qualities),\n"
+            "narrative beats, and thematic tags.\n\n"
+        )
 
-        for i, sk in enumerate(skeletons):
-            lines.append(f"--- Skeleton {i + 1} ---")
-            lines.append(f"Tone: {sk.tone}")
-            lines.append(f"Themes: {', '.join(sk.theme_tags) if sk.theme_tags else 'none'}")
+        for i, sk in enumerate(skeletons, 1):
+            write(
+                f"--- Skeleton {i} ---\n"
+                f"Tone: {sk.tone}\n"
+                f"Themes: {', '.join(sk.theme_tags) if sk.theme_tags else 'none'}\n"
+            )
 
             if sk.atoms:
-                atom_strs = [f"  - {a.name} [{a.category.value}]" for a in sk.atoms]
-                lines.append("Atoms:")
-                lines.extend(atom_strs)
+                write("Atoms:\n")
+                write("".join([f"  - {a.name} [{a.category}]\n" for a in sk.atoms]))
 
             if sk.beats:
-                lines.append(f"Beats: {' -> '.join(sk.beats)}")
+                write(f"Beats: {' -> '.join(sk.beats)}\n")
 
             if sk.spread_positions:
-                pos_strs = [f"  {pos}: {atom}" for pos, atom in sk.spread_positions.items()]
-                lines.append("Spread positions:")
-                lines.extend(pos_strs)
+                write("Spread positions:\n")
+                write("".join([f"  {pos}: {atom}\n" for pos, atom in sk.spread_positions.items()]))
 
-            lines.append("")
+            write("\n")
 
         # Strategy instructions
-        lines.append("=== TASK ===")
+        write("=== TASK ===\n")
         max_lines = self._config.story_lines
 
         if strategy and strategy in SYNTHESIS_STRATEGIES:
-            lines.append(f"Use the {strategy} strategy: {SYNTHESIS_STRATEGIES[strategy]}")
+            write(f"Use the {strategy} strategy: {SYNTHESIS_STRATEGIES[strategy]}\n")
         else:
-            strat_desc = "\n".join(f"- {k}: {v}" for k, v in SYNTHESIS_STRATEGIES.items())
-            lines.append(f"Choose the best interconnection strategy from:\n{strat_desc}")
-
-        lines.append(f"\nCombine these skeletons into 2-4 interconnected short stories.")
-        lines.append(f"Each story should be at most {max_lines} lines long.")
-        lines.append("Draw characters, objects, locations, and tensions from the skeletons.")
-        lines.append("Each skeleton need not map 1:1 to a story — blend and recombine freely.")
-        lines.append("\nFormat your response as:")
-        lines.append("STRATEGY: <strategy name>")
-        lines.append("---")
-        lines.append("TITLE: <story title>")
-        lines.append("<story text>")
-        lines.append("---")
-        lines.append("TITLE: <next story title>")
-        lines.append("<story text>")
-        lines.append("---")
-
-        return "\n".join(lines)
+            write(f"Choose the best interconnection strategy from:\n{_STRATEGIES_DESC}\n")
 
-    def parse_response(self, text: str, strategy: str = "") -> list[SynthesizedStory]:
-        """Parse LLM response into SynthesizedStory objects."""
-        stories: list[SynthesizedStory] = []
-
-        # Extract strategy if present
-        strat_match = re.search(r"STRATEGY:\s*(.+)", text)
-        used_strategy = strat_match.group(1).strip() if strat_match else strategy
+        write(_TRAILER_TEMPLATE.format(max_lines=max_lines))
 
-        # Split on --- dividers
-        sections = re.split(r"\n-{3,}\n", text)
+        return buf.getvalue()
 
-        for section in sections:
-            section = section.strip()
-            if not section:
-                continue
+    def parse_response(self, text: str, strategy: str = "") -> list[SynthesizedStory]:
+        """Parse LLM response into SynthesizedStory objects."""
+        parser = _StoryStreamParser(strategy)
+        parser.feed(text)
+        parser.close()
+        return parser.stories
+
+
+class _StoryStreamParser:
+    """Push parser that turns response text into stories as it arrives.
+
+    Text is fed in arbitrary chunks; each ``---`` delimited section is parsed
+    as soon as its closing divider is seen, and the last one on close().
+    Work per chunk is proportional to the chunk, not to the text so far.
+    """
+
+    _MARKER = "STRATEGY:"
+
+    def __init__(self, strategy: str = ""):
+        self._default_strategy = strategy
+        self._strategy: str | None = None  # from the STRATEGY line, once settled
+        # Text from the first STRATEGY marker on (or, before one is seen, just
+        # enough of the tail to catch a marker split across chunks); None once
+        # the strategy is settled.
+        self._probe: str | None = ""
+        self._marker_seen = False
+        self._parts: list[str] = []  # pieces of the unfinished trailing section
+        self._tail = ""  # suffix of those pieces that may open a divider
+        self.stories: list[SynthesizedStory] = []
+
+    def feed(self, chunk: str) -> list[SynthesizedStory]:
+        """Consume *chunk*; return the stories it completed."""
+        if self._probe is not None:
+            self._probe_strategy(chunk)
+        window = self._tail + chunk
+        if not _SECTION_SPLIT_RE.search(window):
+            self._parts.append(chunk)
+            self._tail = _divider_prefix(window)
+            return []
 
-            title_match = re.search(r"TITLE:\s*(.+)", section)
+        # A divider can only start inside the window, so search from there.
+        self._parts.append(chunk)
+        text = "".join(self._parts)
+        spans: list[tuple[int, int]] = []
+        start = 0
+        for divider in _SECTION_SPLIT_RE.finditer(text, len(text) - len(window)):
+            spans.append((start, divider.start()))
+            start = divider.end()
+        pending = text[start:]
+        self._parts = [pending]
+        self._tail = _divider_prefix(pending)
+        return self._parse_sections(text, spans)
+
+    def close(self) -> list[SynthesizedStory]:
+        """Parse whatever is left after the last divider."""
+        if self._probe is not None:
+            self._settle_strategy(final=True)
+        pending = "".join(self._parts)
+        self._parts, self._tail = [], ""
+        return self._parse_sections(pending, [(0, len(pending))])
+
+    def _probe_strategy(self, chunk: str) -> None:
+        """Track the first STRATEGY line; only the first marker can match."""
+        probe = self._probe + chunk
+        if not self._marker_seen:
+            at = probe.find(self._MARKER)
+            if at < 0:
+                self._probe = probe[-(len(self._MARKER) - 1):]
+                return
+            probe = probe[at:]
+            self._marker_seen = True
+        self._probe = probe
+        if "\n" in chunk:
+            # The STRATEGY line can only complete on a newline
+            self._settle_strategy(final=False)
+
+    def _settle_strategy(self, final: bool) -> None:
+        """Fix the strategy once the first STRATEGY line can no longer change.
+
+        It applies to every story, including any parsed before it arrived.
+        """
+        probe = self._probe
+        strat_match = _STRATEGY_RE.match(probe) if self._marker_seen else None
+        if not final and (
+            strat_match is None
+            or strat_match.end() == len(probe)  # line may still grow
+            or strat_match.group(1)[0].isspace()  # blank so far; may match a later line
+        ):
+            return
+        self._probe = None
+        if strat_match:
+            self._strategy = strat_match.group(1).strip()
+            for story in self.stories:
+                story.strategy = self._strategy
+
+    def _parse_sections(
+        self, text: str, spans: list[tuple[int, int]]
+    ) -> list[SynthesizedStory]:
+        """Parse the sections of *text* at *spans* without copying them out."""
+        strategy = self._default_strategy if self._strategy is None else self._strategy
+        title_search = _TITLE_RE.search
+        new: list[SynthesizedStory] = []
+        for start, end in spans:
+            title_match = title_search(text, start, end)
             if not title_match:
                 continue
 
             title = title_match.group(1).strip()
             # Content is everything after the TITLE line
-            content_start = title_match.end()
-            content = section[content_start:].strip()
+            content = text[title_match.end():end].strip()
 
             if content:
-                stories.append(SynthesizedStory(
+                new.append(SynthesizedStory(
                     title=title,
                     content=content,
-                    strategy=used_strategy,
+                    strategy=strategy,
                 ))
+        self.stories.extend(new)
+        return new
 
-        return stories
+
+def _divider_prefix(text: str) -> str:
+    """The suffix of *text* that could be the start of a ``---`` divider."""
+    newline = text.rfind("\n")
+    if newline < 0 or text[newline + 1:].strip("-"):
+        return ""
+    return text[newline:]
@@ -6,7 +6,7 @@ import enum
 from dataclasses import dataclass, field
 
 
-class AtomCategory(enum.Enum):
+class AtomCategory(enum.StrEnum):
     """Categories of story atoms."""
     AGENT = "agent"
     OBJECT = "object"
@@ -16,7 +16,7 @@ class AtomCategory(enum.Enum):
     QUALITY = "quality"
 
 
-class AtomSource(enum.Enum):
+class AtomSource(enum.StrEnum):
     """How an atom was produced."""
     CATALOGUE = "catalogue"
     LETTER_SOUP = "letter_soup"
@@ -26,7 +26,7 @@ class AtomSource(enum.Enum):
     EVOLVED = "evolved"
 
 
-@dataclass
+@dataclass(slots=True)
 class StoryAtom:
     """A single narrative element."""
     name: str
@@ -39,8 +39,8 @@ class StoryAtom:
     def to_dict(self) -> dict:
         return {
             "name": self.name,
-            "category": self.category.value,
-            "source": self.source.value,
+            "category": self.category,
+            "source": self.source,
             "tags": self.tags,
             "rarity": self.rarity,
             "metadata": self.metadata,
@@ -58,7 +58,7 @@ class StoryAtom:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class AffinityEntry:
     """Affinity between two atoms (sparse, symmetric)."""
     atom_a: str
@@ -69,7 +69,8 @@ class AffinityEntry:
     @property
     def key(self) -> tuple[str, str]:
         """Canonical sorted key for lookup."""
-        return tuple(sorted((self.atom_a, self.atom_b)))
+        a, b = self.atom_a, self.atom_b
+        return (a, b) if a <= b else (b, a)
 
     def to_dict(self) -> dict:
         return {
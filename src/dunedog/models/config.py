@@ -60,6 +60,7 @@ class EvolutionConfig(BaseModel):
     crossover_rate: float = 0.7
     tournament_size: int = 3
     wild_card_rate: float = 0.05
+    max_workers: int = 1  # >1 scores each generation in a process pool
 
 
 class LLMConfig(BaseModel):
@@ -71,6 +72,8 @@ class LLMConfig(BaseModel):
     max_stories_for_llm: int = 20
     synthesis_strategy: str = ""  # empty = let LLM choose
     temperature: float = 0.8
+    max_retries: int = 3  # retries on 429/5xx before giving up
+    backoff_base: float = 1.0  # seconds; doubles per retry
 
 
 # -- Preset definitions --
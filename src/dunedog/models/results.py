@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import enum
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 
 
@@ -15,7 +16,7 @@ class SamplingStrategy(enum.Enum):
     PHONETIC_CLUSTER = "phonetic_cluster"
 
 
-@dataclass
+@dataclass(slots=True)
 class Neologism:
     """A pronounceable non-word extracted from chaos."""
     text: str
@@ -24,7 +25,7 @@ class Neologism:
     definition: str = ""
     part_of_speech: str = ""
     usage_example: str = ""
-    source_context: list[str] = field(default_factory=list)
+    source_context: Sequence[str] = ()
 
     def to_dict(self) -> dict:
         return {
@@ -34,7 +35,7 @@ class Neologism:
             "definition": self.definition,
             "part_of_speech": self.part_of_speech,
             "usage_example": self.usage_example,
-            "source_context": self.source_context,
+            "source_context": list(self.source_context),
         }
 
     @classmethod
@@ -42,7 +43,7 @@ class Neologism:
         return cls(**data)
 
 
-@dataclass
+@dataclass(slots=True)
 class LetterSoupResult:
     """Output from the letter soup generator."""
     raw_soup: str
@@ -75,7 +76,7 @@ class LetterSoupResult:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class DictionaryChaosResult:
     """Output from the dictionary chaos engine."""
     sampled_words: list[str] = field(default_factory=list)
@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 
 from .atoms import StoryAtom
 
 
-@dataclass
+@dataclass(slots=True)
 class PrimordialSource:
     """Trace back to the chaos layer that produced a skeleton."""
     letter_soup_raw: str = ""
@@ -32,7 +32,7 @@ class PrimordialSource:
         return cls(**data)
 
 
-@dataclass
+@dataclass(slots=True)
 class GenerationStats:
     """Statistics about how a skeleton was generated."""
     engine: str = ""
@@ -57,7 +57,7 @@ class GenerationStats:
         return cls(**data)
 
 
-@dataclass
+@dataclass(slots=True)
 class StorySkeleton:
     """A complete narrative skeleton ready for synthesis."""
     atoms: list[StoryAtom] = field(default_factory=list)
@@ -73,6 +73,30 @@ class StorySkeleton:
     def coherence_score(self) -> float:
         return self.stats.coherence_score
 
+    def clone(self) -> StorySkeleton:
+        """Copy with fresh containers; atoms are shared, not copied.
+
+        Evolution replaces atoms rather than editing them in place, so
+        sharing the atom objects is safe and avoids a to_dict() round trip.
+        """
+        source = self.primordial_source
+        return StorySkeleton(
+            atoms=list(self.atoms),
+            beats=list(self.beats),
+            spread_positions=dict(self.spread_positions),
+            theme_tags=list(self.theme_tags),
+            tone=self.tone,
+            primordial_source=replace(
+                source,
+                exact_words=list(source.exact_words),
+                near_words=list(source.near_words),
+                neologisms=list(source.neologisms),
+                dictionary_words=list(source.dictionary_words),
+            ),
+            stats=replace(self.stats, violations=list(self.stats.violations)),
+            seed=self.seed,
+        )
+
     def to_dict(self) -> dict:
         return {
             "atoms": [a.to_dict() for a in self.atoms],
@@ -16,13 +16,16 @@ from dunedog.models.atoms import StoryAtom
 from dunedog.utils.seed_manager import SeedManager
 from dunedog.chaos.letter_soup import LetterSoupGenerator
 from dunedog.chaos.dictionary_chaos import DictionaryChaosEngine
-from dunedog.crystallize.crystallizer import SeedCrystallizer
+from dunedog.crystallize.crystallizer import CrystallizationResult, SeedCrystallizer
 from dunedog.crystallize.neologism_definer import NeologismDefiner
 from dunedog.catalogues.loader import AtomCatalogue
 from dunedog.engines.tarot_spread import TarotSpreadEngine
 from dunedog.engines.markov_chains import NarrativeMarkovChain
 from dunedog.engines.constraint_solver import WorldConstraintSolver
 
+# Skeletons whose words are crystallized together in one similarity pass.
+_CRYSTALLIZE_BATCH = 32
+
 
 class StoryBatchGenerator:
     """Generates batches of story skeletons through the full pipeline."""
@@ -83,23 +86,21 @@ class StoryBatchGenerator:
                 TaskProgressColumn(),
             ) as progress:
                 task = progress.add_task("Generating skeletons...", total=count)
-                for i in range(count):
-                    rng = self._seed_mgr.child_rng(f"skeleton_{i}")
-                    sk = self.generate_single(rng)
+                for start in range(0, count, _CRYSTALLIZE_BATCH):
+                    for i, sk in enumerate(self._generate_range(start, count), start):
+                        skeletons.append(sk)
+                        progress.update(task, advance=1)
+                        if (i + 1) % log_interval == 0:
+                            best = max(s.coherence_score for s in skeletons)
+                            log.debug("Skeleton %d/%d — best coherence %.4f", i + 1, count, best)
+        else:
+            for start in range(0, count, _CRYSTALLIZE_BATCH):
+                for i, sk in enumerate(self._generate_range(start, count), start):
                     skeletons.append(sk)
-                    progress.update(task, advance=1)
-                    if (i + 1) % log_interval == 0:
+                    if (i + 1) % log_interval == 0 or (i + 1) == count:
                         best = max(s.coherence_score for s in skeletons)
-                        log.debug("Skeleton %d/%d — best coherence %.4f", i + 1, count, best)
-        else:
-            for i in range(count):
-                rng = self._seed_mgr.child_rng(f"skeleton_{i}")
-                sk = self.generate_single(rng)
-                skeletons.append(sk)
-                if (i + 1) % log_interval == 0 or (i + 1) == count:
-                    best = max(s.coherence_score for s in skeletons)
-                    log.info("Skeleton %d/%d (%d%%) — best coherence %.4f",
-                             i + 1, count, 100 * (i + 1) // count, best)
+                        log.info("Skeleton %d/%d (%d%%) — best coherence %.4f",
+                                 i + 1, count, 100 * (i + 1) // count, best)
 
         # Evolutionary refinement
         if self.config.evolution.enabled and self.config.evolution.generations > 0:
@@ -116,9 +117,37 @@ class StoryBatchGenerator:
                  skeletons[-1].coherence_score)
         return skeletons
 
+    def _generate_range(self, start: int, count: int) -> list[StorySkeleton]:
+        """Generate skeletons ``start`` .. ``start + _CRYSTALLIZE_BATCH`` (capped at *count*).
+
+        Layer 0 runs per skeleton, then the whole slice is crystallized in one
+        batch before the remaining layers run. Each skeleton draws from its own
+        RNG in the same order as :meth:`generate_single`.
+        """
+        rngs = [
+            self._seed_mgr.child_rng(f"skeleton_{i}")
+            for i in range(start, min(start + _CRYSTALLIZE_BATCH, count))
+        ]
+        staged = [self._generate_chaos(rng) for rng in rngs]
+        crystals = self._crystallizer.crystallize_many(
+            [(all_words, soup, chaos) for soup, chaos, all_words in staged]
+        )
+        return [
+            self._assemble(rng, *stage, crystal)
+            for rng, stage, crystal in zip(rngs, staged, crystals)
+        ]
+
     def generate_single(self, rng: random.Random) -> StorySkeleton:
         """Generate a single story skeleton through the full pipeline."""
         self._init_components()
+        soup_result, chaos_result, all_words = self._generate_chaos(rng)
+        crystal = self._crystallizer.crystallize_many([(all_words, soup_result, chaos_result)])[0]
+        return self._assemble(rng, soup_result, chaos_result, all_words, crystal)
+
+    def _generate_chaos(
+        self, rng: random.Random
+    ) -> tuple[LetterSoupResult | None, DictionaryChaosResult | None, list[str]]:
+        """Layer 0: letter soup and dictionary chaos, plus the collected words."""
         cfg = self.config
 
         # -- Layer 0: Primordial Chaos --
@@ -148,11 +177,21 @@ class StoryBatchGenerator:
         if chaos_result:
             all_words.extend(chaos_result.combined_words or chaos_result.sampled_words)
 
-        # -- Layer 1: Crystallization --
-        crystal_rng = random.Random(rng.randint(0, 2**63))
-        crystal = self._crystallizer.crystallize(
-            all_words, crystal_rng, soup_result, chaos_result,
-        )
+        # Formerly seeded the crystallizer's RNG; still drawn so every later
+        # draw (and so each seed's skeletons) stays the same.
+        rng.randint(0, 2**63)
+        return soup_result, chaos_result, all_words
+
+    def _assemble(
+        self,
+        rng: random.Random,
+        soup_result: LetterSoupResult | None,
+        chaos_result: DictionaryChaosResult | None,
+        all_words: list[str],
+        crystal: CrystallizationResult,
+    ) -> StorySkeleton:
+        """Layers 1 (neologisms) and 2: build, score and annotate the skeleton."""
+        cfg = self.config
 
         # Define neologisms
         if cfg.crystallization.enable_neologisms and soup_result:
@@ -213,5 +252,8 @@ class StoryBatchGenerator:
             constraint_solver=self._solver,
             catalogue=self._catalogue,
         )
-        result = engine.evolve(skeletons, self.config.evolution, evo_rng)
+        try:
+            result = engine.evolve(skeletons, self.config.evolution, evo_rng)
+        finally:
+            engine.close()
         return result.population
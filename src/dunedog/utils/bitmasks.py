@@ -0,0 +1,26 @@
+"""Set-overlap helpers — encode label sets as int bitmasks."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable, Iterable
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+def label_masks(
+    items: Iterable[T], labels: Callable[[T], Iterable[Hashable]]
+) -> list[int]:
+    """Encode ``labels(item)`` for each item as a bitmask, one bit per distinct label.
+
+    Bits are shared across *items*, so ``a & b`` is their overlap and
+    ``(a & b).bit_count()`` its size.
+    """
+    bits: dict[Hashable, int] = {}
+    masks = []
+    for item in items:
+        mask = 0
+        for label in labels(item):
+            mask |= 1 << bits.setdefault(label, len(bits))
+        masks.append(mask)
+    return masks
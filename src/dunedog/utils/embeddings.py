@@ -5,6 +5,9 @@ from __future__ import annotations
 import hashlib
 import random
 from abc import ABC, abstractmethod
+from functools import lru_cache
+
+import numpy as np
 
 from dunedog.utils import wordnet_utils
 
@@ -22,6 +25,27 @@ class SimilarityEngine(ABC):
     ) -> list[tuple[str, float]]:
         """Return the top-*n* most similar candidates with scores."""
 
+    def score_matrix(self, words: list[str], candidates: list[str]) -> np.ndarray:
+        """Return a (len(words), len(candidates)) float32 array of similarity scores."""
+        scores = np.zeros((len(words), len(candidates)), dtype=np.float32)
+        for i, word in enumerate(words):
+            for j, cand in enumerate(candidates):
+                scores[i, j] = self.similarity(word, cand)
+        return scores
+
+    def pairwise_matrix(self, words: list[str]) -> np.ndarray:
+        """Return the symmetric (n, n) similarity matrix of *words*, zero diagonal.
+
+        Each unordered pair is scored once, as ``similarity(words[i], words[j])``
+        with ``i < j``.
+        """
+        n = len(words)
+        scores = np.zeros((n, n))
+        for i in range(n):
+            for j in range(i + 1, n):
+                scores[i, j] = scores[j, i] = self.similarity(words[i], words[j])
+        return scores
+
 
 class WordNetSimilarity(SimilarityEngine):
     """Wu-Palmer similarity via WordNet."""
@@ -29,6 +53,16 @@ class WordNetSimilarity(SimilarityEngine):
     def similarity(self, word_a: str, word_b: str) -> float:
         return wordnet_utils.wup_similarity(word_a, word_b)
 
+    def score_matrix(self, words: list[str], candidates: list[str]) -> np.ndarray:
+        return np.array(
+            wordnet_utils.wup_similarity_matrix(words, candidates), dtype=np.float32
+        ).reshape(len(words), len(candidates))
+
+    def pairwise_matrix(self, words: list[str]) -> np.ndarray:
+        return np.array(
+            wordnet_utils.wup_similarity_pairwise(words), dtype=float
+        ).reshape(len(words), len(words))
+
     def most_similar(
         self, word: str, candidates: list[str], n: int
     ) -> list[tuple[str, float]]:
@@ -61,7 +95,22 @@ class RandomSimilarity(SimilarityEngine):
 def get_similarity_engine(
     rng: random.Random | None = None,
 ) -> SimilarityEngine:
-    """Return WordNetSimilarity if NLTK is usable, else RandomSimilarity."""
+    """Return WordNetSimilarity if NLTK is usable, else RandomSimilarity.
+
+    Without *rng* the same process-wide engine is returned on every call, so
+    the NLTK probe runs once and every crystallizer shares one instance.
+    """
+    if rng is None:
+        return _default_engine()
+    return _make_engine(rng)
+
+
+def _make_engine(rng: random.Random) -> SimilarityEngine:
     if wordnet_utils._nltk_available():
         return WordNetSimilarity()
-    return RandomSimilarity(rng or random.Random())
+    return RandomSimilarity(rng)
+
+
+@lru_cache(maxsize=None)
+def _default_engine() -> SimilarityEngine:
+    return _make_engine(random.Random())
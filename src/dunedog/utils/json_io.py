@@ -0,0 +1,41 @@
+"""JSON loading and encoding — uses orjson when installed, stdlib json otherwise."""
+
+from __future__ import annotations
+
+import json
+import mmap
+import os
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+
+def load_json(path: str | os.PathLike[str]) -> Any:
+    """Parse the JSON file at *path*."""
+    if orjson is not None:
+        # Map the file and let orjson parse straight from the page cache
+        # instead of copying it into a bytes object first.
+        with open(path, "rb") as fh:
+            if os.fstat(fh.fileno()).st_size == 0:
+                return orjson.loads(b"")  # mmap rejects empty files; raise the usual decode error
+            with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                return orjson.loads(view)
+    with open(path, encoding="utf-8") as fh:
+        return json.load(fh)
+
+
+def dumps_json(obj: Any) -> bytes:
+    """Encode *obj* as compact UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def loads_json(data: bytes | str) -> Any:
+    """Parse JSON from *data* (bytes or str)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -15,6 +15,7 @@ class WordLoader:
     def __init__(self) -> None:
         self._words: frozenset[str] = frozenset()
         self._length_buckets: dict[int, list[str]] = {}
+        self._length_sets: dict[int, frozenset[str]] = {}
         self._word_list: list[str] = []
         self._loaded = False
 
@@ -36,6 +37,7 @@ class WordLoader:
         self._words = frozenset(words)
         self._word_list = words
         self._length_buckets = dict(buckets)
+        self._length_sets = {k: frozenset(v) for k, v in buckets.items()}
         self._loaded = True
 
     def _ensure_loaded(self) -> None:
@@ -52,6 +54,11 @@ class WordLoader:
         self._ensure_loaded()
         return self._length_buckets.get(length, [])
 
+    def get_word_set_by_length(self, length: int) -> frozenset[str]:
+        """Return the set of lowercase words with the given length (for exact lookups)."""
+        self._ensure_loaded()
+        return self._length_sets.get(length, frozenset())
+
     def get_random_word(self, rng: random.Random) -> str:
         """Pick one random word using the supplied RNG."""
         self._ensure_loaded()
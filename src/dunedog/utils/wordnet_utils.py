@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 
 def _nltk_available() -> bool:
     """Return True if NLTK and WordNet data are importable."""
@@ -40,6 +42,76 @@ def wup_similarity(word_a: str, word_b: str) -> float:
         return 0.0
 
 
+@lru_cache(maxsize=65536)
+def _first_synset(word: str):
+    """First WordNet synset of *word* or None; raises if WordNet is unavailable."""
+    from nltk.corpus import wordnet
+    syns = wordnet.synsets(word)
+    return syns[0] if syns else None
+
+
+def wup_similarity_matrix(words: list[str], candidates: list[str]) -> list[list[float]]:
+    """Wu-Palmer similarity of every word against every candidate.
+
+    Same scores as :func:`wup_similarity`, but first synsets are resolved once
+    (and memoized, so a fixed candidate list such as the catalogue is only
+    looked up on the first call) and candidates without a synset are skipped.
+    """
+    try:
+        cand_syns = [_first_synset(c) for c in candidates]
+    except Exception:
+        return [[0.0] * len(candidates) for _ in words]
+    # Column index and synset of every candidate that can score above zero.
+    columns = [(j, syn) for j, syn in enumerate(cand_syns) if syn is not None]
+
+    rows: list[list[float]] = []
+    for word in words:
+        row = [0.0] * len(candidates)
+        try:
+            syn = _first_synset(word)
+        except Exception:
+            syn = None
+        if syn is not None:
+            for j, cand in columns:
+                try:
+                    score = syn.wup_similarity(cand)
+                except Exception:
+                    score = None
+                if score is not None:
+                    row[j] = float(score)
+        rows.append(row)
+    return rows
+
+
+def wup_similarity_pairwise(words: list[str]) -> list[list[float]]:
+    """Symmetric Wu-Palmer matrix over *words* (zero diagonal).
+
+    Entry ``[i][j]`` for ``i < j`` equals ``wup_similarity(words[i], words[j])``
+    and is mirrored to ``[j][i]``; each first synset is resolved once.
+    """
+    n = len(words)
+    rows = [[0.0] * n for _ in range(n)]
+    try:
+        syns = [_first_synset(w) for w in words]
+    except Exception:
+        return rows
+    for i in range(n):
+        syn = syns[i]
+        if syn is None:
+            continue
+        for j in range(i + 1, n):
+            other = syns[j]
+            if other is None:
+                continue
+            try:
+                score = syn.wup_similarity(other)
+            except Exception:
+                score = None
+            if score is not None:
+                rows[i][j] = rows[j][i] = float(score)
+    return rows
+
+
 def get_hypernyms(word: str) -> list[str]:
     """Return hypernym lemma names for the first synset of *word*."""
     try:
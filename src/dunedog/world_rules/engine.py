@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 import random
+from dataclasses import replace
 from pathlib import Path
 
 from dunedog.models.atoms import AtomCategory, AtomSource, StoryAtom
@@ -15,6 +16,8 @@ from dunedog.models.validation import (
     ValidationResult,
 )
 
+_VIOLATION_CACHE_SIZE = 4096
+
 
 class WorldRulesEngine:
     """Loads world rules (invariants + tendencies) and validates skeletons."""
@@ -22,6 +25,12 @@ class WorldRulesEngine:
     def __init__(self) -> None:
         self._invariants: list[Invariant] = []
         self._tendencies: list[Tendency] = []
+        # Invariant violations keyed by (atom tag set, beat set); see
+        # _violations().
+        self._violation_cache: dict[
+            tuple[frozenset[str], frozenset[str]],
+            tuple[tuple[str, InvariantSeverity], ...],
+        ] = {}
         self._load_rules()
 
     def _load_rules(self) -> None:
@@ -99,6 +108,31 @@ class WorldRulesEngine:
 
         return None
 
+    def _violations(
+        self, skeleton: StorySkeleton
+    ) -> tuple[tuple[str, InvariantSeverity], ...]:
+        """``(message, severity)`` for every invariant *skeleton* breaks.
+
+        check_invariant() reads only the set of atom tags and the set of
+        beats, so results are memoized on exactly those; widen the key if
+        a check type ever reads anything else.
+        """
+        key = (
+            frozenset(tag for atom in skeleton.atoms for tag in atom.tags),
+            frozenset(skeleton.beats),
+        )
+        violations = self._violation_cache.get(key)
+        if violations is None:
+            violations = tuple(
+                (msg, inv.severity)
+                for inv in self._invariants
+                if (msg := self.check_invariant(skeleton, inv)) is not None
+            )
+            if len(self._violation_cache) >= _VIOLATION_CACHE_SIZE:
+                self._violation_cache.clear()
+            self._violation_cache[key] = violations
+        return violations
+
     # ------------------------------------------------------------------
     # Tendencies
     # ------------------------------------------------------------------
@@ -135,9 +169,12 @@ class WorldRulesEngine:
             if effect == "add_tag":
                 tag = params.get("tag", "")
                 if tag and skeleton.atoms:
-                    atom = rng.choice(skeleton.atoms)
+                    # Same draw as rng.choice(atoms). Atoms may be shared
+                    # between skeletons, so swap in a re-tagged copy.
+                    idx = rng.randrange(len(skeleton.atoms))
+                    atom = skeleton.atoms[idx]
                     if tag not in atom.tags:
-                        atom.tags.append(tag)
+                        skeleton.atoms[idx] = replace(atom, tags=[*atom.tags, tag])
                         mutated = True
 
             elif effect == "add_tension":
@@ -186,10 +223,8 @@ class WorldRulesEngine:
         """
         result = ValidationResult()
 
-        for inv in self._invariants:
-            msg = self.check_invariant(skeleton, inv)
-            if msg is not None:
-                result.add_violation(msg, inv.severity)
+        for msg, severity in self._violations(skeleton):
+            result.add_violation(msg, severity)
 
         if rng is not None:
             result.tendencies_applied = self.apply_tendencies(skeleton, rng)
@@ -0,0 +1,97 @@
+"""Tests for the atom catalogue."""
+import random
+
+from dunedog.catalogues.loader import AtomCatalogue
+from dunedog.models.atoms import AffinityEntry, AtomCategory, AtomSource, StoryAtom
+
+
+class TestSampleWeighted:
+    def test_matches_weighted_choices(self, catalogue):
+        pool = catalogue.get_by_category(AtomCategory.AGENT)
+        weights = [max(1.0 - a.rarity, 0.01) for a in pool]
+        picked = catalogue.sample_weighted(AtomCategory.AGENT, random.Random(7), n=5)
+        expected = random.Random(7).choices(pool, weights=weights, k=5)
+        assert picked == expected
+
+    def test_empty_category(self):
+        assert AtomCatalogue().sample_weighted(AtomCategory.AGENT, random.Random(1)) == []
+
+    def test_add_atom_invalidates_cache(self):
+        catalogue = AtomCatalogue()
+        catalogue.add_atom(StoryAtom("first", AtomCategory.OBJECT, AtomSource.CATALOGUE, [], 0.0))
+        assert catalogue.sample_weighted(AtomCategory.OBJECT, random.Random(1))[0].name == "first"
+
+        catalogue.add_atom(StoryAtom("second", AtomCategory.OBJECT, AtomSource.CATALOGUE, [], 0.0))
+        names = {
+            catalogue.sample_weighted(AtomCategory.OBJECT, random.Random(seed))[0].name
+            for seed in range(20)
+        }
+        assert names == {"first", "second"}
+
+
+class TestLoad:
+    def test_load_from_paths(self, tmp_path):
+        atoms = tmp_path / "atoms.json"
+        atoms.write_text(
+            '[{"name": "oracle", "category": "agent", "tags": ["fate"], "rarity": 0.2},'
+            ' {"name": "lantern", "category": "object", "source": "catalogue"}]',
+            encoding="utf-8",
+        )
+        affinities = tmp_path / "affinities.json"
+        affinities.write_text(
+            '[{"atom_a": "oracle", "atom_b": "lantern", "strength": 0.7}]', encoding="utf-8"
+        )
+        catalogue = AtomCatalogue.load(atoms, affinities)
+        assert len(catalogue) == 2
+        assert catalogue.atoms[0].source == AtomSource.CATALOGUE
+        assert catalogue.get_affinity("lantern", "oracle") == 0.7
+
+
+class TestAffinity:
+    def test_symmetric_lookup(self):
+        catalogue = AtomCatalogue()
+        catalogue.add_atom(StoryAtom("oracle", AtomCategory.AGENT, AtomSource.CATALOGUE, [], 0.2))
+        catalogue.add_affinity(AffinityEntry("oracle", "lantern", -0.4))
+        assert catalogue.get_affinity("oracle", "lantern") == -0.4
+        assert catalogue.get_affinity("lantern", "oracle") == -0.4
+
+    def test_unknown_pair(self, catalogue):
+        assert catalogue.get_affinity("no-such-atom", "another") == 0.0
+
+    def test_affinity_matrix_matches_lookup(self, catalogue):
+        names = [a.name for a in catalogue.atoms[:40]] + ["no-such-atom"]
+        matrix = catalogue.affinity_matrix(names)
+        assert matrix.shape == (len(names), len(names))
+        for i, a in enumerate(names):
+            for j, b in enumerate(names):
+                if i != j:
+                    assert matrix[i, j] == catalogue.get_affinity(a, b)
+
+    def test_affinity_matrix_refreshes_after_add(self):
+        catalogue = AtomCatalogue()
+        catalogue.add_affinity(AffinityEntry("oracle", "lantern", 0.5))
+        assert catalogue.affinity_matrix(["oracle", "lantern"])[0, 1] == 0.5
+        catalogue.add_affinity(AffinityEntry("seer", "oracle", -0.25))
+        assert catalogue.affinity_matrix(["oracle", "seer"])[1, 0] == -0.25
+
+    def test_affinity_block_matches_lookup(self, catalogue):
+        rows = [a.name for a in catalogue.atoms[:20]] + ["no-such-atom"]
+        cols = [a.name for a in catalogue.atoms[20:30]]
+        block = catalogue.affinity_block(rows, cols)
+        assert block.shape == (len(rows), len(cols))
+        for i, a in enumerate(rows):
+            for j, b in enumerate(cols):
+                assert block[i, j] == catalogue.get_affinity(a, b)
+
+
+class TestQueries:
+    def test_views_refresh_after_add(self):
+        catalogue = AtomCatalogue()
+        catalogue.add_atom(StoryAtom("oracle", AtomCategory.AGENT, AtomSource.CATALOGUE, ["fate"], 0.2))
+        assert catalogue.get_by_tag("fate") is catalogue.get_by_tag("fate")
+        assert len(catalogue.atoms) == 1
+
+        catalogue.add_atom(StoryAtom("seer", AtomCategory.AGENT, AtomSource.CATALOGUE, ["fate"], 0.4))
+        assert [a.name for a in catalogue.get_by_tag("fate")] == ["oracle", "seer"]
+        assert [a.name for a in catalogue.get_by_category(AtomCategory.AGENT)] == ["oracle", "seer"]
+        assert len(catalogue.atoms) == 2
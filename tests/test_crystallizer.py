@@ -32,6 +32,32 @@ class TestCrystallize:
         # All forms should collapse to one entry
         assert len(names) <= 1 or len(set(n.lower() for n in names)) == 1
 
+    def test_crystallizers_share_similarity_engine(self, catalogue):
+        first = SeedCrystallizer(catalogue=catalogue)
+        second = SeedCrystallizer(catalogue=catalogue)
+        assert first._similarity is second._similarity
+
+    def test_crystallize_many_matches_single(self, rng, catalogue):
+        crystallizer = SeedCrystallizer(catalogue=catalogue)
+        inputs = [["warrior", "castle"], ["castle", "fear", "run"], []]
+        batched = crystallizer.crystallize_many([(words, None, None) for words in inputs])
+        singles = [crystallizer.crystallize(words, rng) for words in inputs]
+        assert batched == singles
+
+
+class TestMapToCatalogue:
+    def test_batched_matches_per_word(self, catalogue):
+        crystallizer = SeedCrystallizer(catalogue=catalogue, similarity_threshold=0.5)
+        words = ["lantern", "oracle", "storm", "glimbor"]
+        batched = crystallizer._match_catalogue(words)
+        assert batched == [crystallizer.map_to_catalogue(w) for w in words]
+        for word, atom in zip(words, batched):
+            if atom is not None:
+                best = max(
+                    crystallizer._similarity.similarity(word, a.name) for a in catalogue.atoms
+                )
+                assert crystallizer._similarity.similarity(word, atom.name) == best
+
 
 class TestInferCategory:
     def test_warrior_is_agent(self, catalogue):
@@ -87,6 +113,13 @@ class TestNeologismDefiner:
         assert result.definition != ""
         assert result.usage_example != ""
 
+    def test_define_fills_placeholders(self):
+        definer = NeologismDefiner()
+        neo = Neologism(text="glimbora", pronounceability=0.8, phonetic_mood="dreamy")
+        result = definer.define(neo, ["shadow"], random.Random(3))
+        assert "{" not in result.definition
+        assert "glimbora" in result.usage_example
+
     def test_infer_pos_adverb(self):
         definer = NeologismDefiner()
         assert definer.infer_part_of_speech("quickly") == "adverb"
@@ -5,7 +5,7 @@ import random
 import pytest
 
 from dunedog.engines.tarot_spread import TarotSpreadEngine
-from dunedog.engines.markov_chains import NarrativeMarkovChain, VALID_ENDINGS
+from dunedog.engines.markov_chains import BEAT_TYPES, NarrativeMarkovChain, VALID_ENDINGS
 from dunedog.engines.constraint_solver import WorldConstraintSolver
 from dunedog.engines.evolutionary import StoryEvolutionEngine
 from dunedog.world_rules.engine import WorldRulesEngine
@@ -82,6 +82,21 @@ class TestNarrativeMarkovChain:
         for i in range(len(seq) - 1):
             assert seq[i] != seq[i + 1], f"Immediate repetition at index {i}: {seq[i]}"
 
+    def test_sampling_matches_random_choices(self):
+        """The cached sampling rows must draw exactly like rng.choices."""
+        options = {"CLIMAX": 0.2, "CRISIS": 0.0, "MIDPOINT": 0.5, "ESCALATION": -0.1, "OPENING": 0.3}
+        weights = [max(0.0, w) for w in options.values()]
+        row = NarrativeMarkovChain._cumulative(options)
+        for seed in range(50):
+            expected = random.Random(seed).choices(list(options), weights=weights)[0]
+            assert NarrativeMarkovChain._sample(row, random.Random(seed)) == expected
+
+    def test_base_rows_precompiled_and_shared(self):
+        """Every beat has a sampling row, built once and shared by all chains."""
+        a, b = NarrativeMarkovChain(), NarrativeMarkovChain()
+        assert a._rows is b._rows
+        assert set(BEAT_TYPES) <= set(a._rows)
+
 
 # ------------------------------------------------------------------ #
 # WorldRulesEngine
@@ -139,6 +154,18 @@ class TestWorldConstraintSolver:
         solver.score_and_update(skeleton)
         assert skeleton.stats.coherence_score >= 0.0
 
+    def test_pairwise_stats_match_brute_force(self, sample_atoms, catalogue):
+        """_pairwise_stats() should match a direct walk over atom pairs."""
+        solver = WorldConstraintSolver(catalogue=catalogue)
+        skeleton = StorySkeleton(atoms=sample_atoms)
+        pairs = [
+            (a, b) for i, a in enumerate(sample_atoms) for b in sample_atoms[i + 1:]
+        ]
+        affinity = sum(catalogue.get_affinity(a.name, b.name) for a, b in pairs)
+        shared = sum(1 for a, b in pairs if set(a.tags) & set(b.tags))
+        stats = solver._pairwise_stats(skeleton)
+        assert stats == (pytest.approx(affinity), shared, len(pairs))
+
 
 # ------------------------------------------------------------------ #
 # StoryEvolutionEngine
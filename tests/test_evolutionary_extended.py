@@ -2,6 +2,7 @@
 
 import random
 
+import numpy as np
 import pytest
 
 from dunedog.engines.evolutionary import StoryEvolutionEngine
@@ -113,6 +114,26 @@ class TestSelectionMethods:
         assert a is pop[2]
         assert b is pop[2]
 
+    def test_tournament_select_pairs(self):
+        engine = StoryEvolutionEngine()
+        pop = _make_population(n=6)
+        fitness = np.array([s.coherence_score for s in pop])
+        pairs = engine._tournament_select_pairs(pop, fitness, 3, 2, random.Random(42))
+        assert len(pairs) == 3
+        for a, b in pairs:
+            assert a in pop
+            assert b in pop
+
+    def test_tournament_select_pairs_prefers_high_fitness(self):
+        engine = StoryEvolutionEngine()
+        pop = _make_population(n=6)
+        pop[2].stats.coherence_score = 100.0
+        fitness = np.array([s.coherence_score for s in pop])
+        pairs = engine._tournament_select_pairs(pop, fitness, 50, 6, random.Random(42))
+        winners = [s for pair in pairs for s in pair]
+        # pop[2] wins every tournament it enters; with k == n that is most
+        assert winners.count(pop[2]) > len(winners) // 2
+
 
 # ------------------------------------------------------------------ #
 # Crossover
@@ -237,6 +258,16 @@ class TestMutation:
         evolved = [a for a in sk.atoms if a.source == AtomSource.EVOLVED]
         assert len(evolved) > 0
 
+    def test_evolved_variant_is_cached(self):
+        """Evolved copies are built once and leave the catalogue atom alone."""
+        engine = StoryEvolutionEngine()
+        original = engine._by_category[AtomCategory.AGENT][0]
+        variant = engine._evolved_variant(original)
+        assert variant.source == AtomSource.EVOLVED
+        assert variant.name == original.name
+        assert original.source != AtomSource.EVOLVED
+        assert engine._evolved_variant(original) is variant
+
 
 # ------------------------------------------------------------------ #
 # Wild card injection
@@ -458,6 +489,18 @@ class TestCopySkeleton:
         copy.atoms[0] = StoryAtom("replaced", AtomCategory.AGENT, AtomSource.CATALOGUE, [])
         assert original.atoms[0].name != "replaced"
 
+    def test_copy_containers_are_independent(self):
+        engine = StoryEvolutionEngine()
+        pop = _make_population()
+        original = pop[0]
+        copy = engine._copy_skeleton(original)
+        copy.beats.append("extra")
+        copy.theme_tags.append("extra")
+        copy.spread_positions["extra"] = "x"
+        assert "extra" not in original.beats
+        assert "extra" not in original.theme_tags
+        assert "extra" not in original.spread_positions
+
 
 # ------------------------------------------------------------------ #
 # _rebuild_spread_positions
@@ -494,3 +537,53 @@ class TestRebuildSpreadPositions:
         )
         result = StoryEvolutionEngine._rebuild_spread_positions(sk)
         assert result == {}
+
+
+# ------------------------------------------------------------------ #
+# Parallel scoring
+# ------------------------------------------------------------------ #
+
+class TestEvolve:
+    def test_one_generation_keeps_fittest_and_breeds_offspring(self):
+        engine = StoryEvolutionEngine()
+        scored: list[list[tuple[StorySkeleton, float]]] = []
+        score_population = engine._score_population
+
+        def spy(population, config):
+            score_population(population, config)
+            scored.append([(s, s.coherence_score) for s in population])
+
+        engine._score_population = spy
+        population = _make_population(7)
+        config = EvolutionConfig(enabled=True, generations=1, population_size=7)
+        result = engine.evolve(population, config, random.Random(5))
+
+        first = scored[0]
+        assert result.generations_run == 1
+        assert result.fitness_history == [max(score for _, score in first)]
+        assert len(result.population) == 7
+        assert all(s.stats.generation == 1 for s in result.population)
+        # 7 // 2 = 3 pairs -> 6 offspring, so only the single fittest survives
+        fittest = max(first, key=lambda pair: pair[1])[0]
+        survivors = [s for s in result.population if any(s is p for p in population)]
+        assert survivors == [fittest]
+        assert result.best_skeleton is result.population[0]
+        scores = [s.coherence_score for s in result.population]
+        assert scores == sorted(scores, reverse=True)
+
+
+class TestParallelScoring:
+    def test_pool_matches_serial_evolution(self):
+        config = dict(enabled=True, generations=2, population_size=8)
+        serial = StoryEvolutionEngine().evolve(
+            _make_population(8), EvolutionConfig(**config), random.Random(3)
+        )
+        engine = StoryEvolutionEngine()
+        try:
+            parallel = engine.evolve(
+                _make_population(8), EvolutionConfig(**config, max_workers=2), random.Random(3)
+            )
+        finally:
+            engine.close()
+        assert parallel.fitness_history == serial.fitness_history
+        assert [s.to_dict() for s in parallel.population] == [s.to_dict() for s in serial.population]
@@ -5,7 +5,12 @@ import asyncio
 import pytest
 
 from dunedog.llm.provider import LLMProvider, LLMError, create_provider, DEFAULT_MODELS
-from dunedog.llm.synthesizer import StorySynthesizer, SynthesizedStory
+from dunedog.llm.synthesizer import (
+    SYNTHESIS_STRATEGIES,
+    StorySynthesizer,
+    SynthesizedStory,
+    _StoryStreamParser,
+)
 from dunedog.models.atoms import StoryAtom, AtomCategory, AtomSource
 from dunedog.models.config import LLMConfig
 from dunedog.models.skeleton import StorySkeleton, GenerationStats
@@ -171,3 +176,119 @@ class TestStorySynthesizer:
         assert "desert" in stories[0].content
         assert stories[1].title == "Echo of Bells"
         assert stories[0].strategy == "BRAIDED"
+
+    def test_synthesize_streams_small_chunks(self):
+        """Stories split across arbitrary stream chunks parse like the full text."""
+        canned = (
+            "STRATEGY: CAUSE_AND_ECHO\n"
+            "---\n"
+            "TITLE: Dream of Sand\n"
+            "The desert remembers what the city forgets.\n"
+            "----\n"
+            "TITLE: Echo of Bells\n"
+            "A bell rings once, and everything changes."
+        )
+
+        class StreamingProvider(MockLLMProvider):
+            async def stream(self, messages, **kwargs):
+                for i in range(0, len(self._response), 3):
+                    yield self._response[i:i + 3]
+
+        synth = StorySynthesizer(StreamingProvider(canned), LLMConfig(max_stories_for_llm=5))
+        stories = asyncio.run(synth.synthesize([_make_skeleton()]))
+
+        expected = synth.parse_response(canned)
+        assert [s.to_dict() for s in stories] == [s.to_dict() for s in expected]
+        assert [s.title for s in stories] == ["Dream of Sand", "Echo of Bells"]
+        assert stories[1].strategy == "CAUSE_AND_ECHO"
+
+    def test_synthesize_stream_yields_before_response_ends(self):
+        """A story is delivered as soon as its closing divider arrives."""
+        events = []
+
+        class StreamingProvider(MockLLMProvider):
+            async def stream(self, messages, **kwargs):
+                for chunk in ("STRATEGY: RASHOMON\n---\nTITLE: First\nIt begins.",
+                              "\n---\nTITLE: Second\n", "It ends."):
+                    events.append("chunk")
+                    yield chunk
+
+        async def consume():
+            synth = StorySynthesizer(StreamingProvider(""), LLMConfig(max_stories_for_llm=5))
+            async for story in synth.synthesize_stream([_make_skeleton()]):
+                events.append(story.title)
+
+        asyncio.run(consume())
+        assert events == ["chunk", "chunk", "First", "chunk", "Second"]
+
+    def test_stream_parser_keeps_no_head_without_strategy(self):
+        """Without a STRATEGY line the parser buffers only a few characters of it."""
+        parser = _StoryStreamParser("BRAIDED")
+        text = "TITLE: Long\n" + "words and more words\n" * 500 + "---\nTITLE: Next\nEnd."
+        for i in range(0, len(text), 8):
+            parser.feed(text[i:i + 8])
+            assert len(parser._probe) < len("STRATEGY:")
+        parser.close()
+        assert [s.title for s in parser.stories] == ["Long", "Next"]
+        assert all(s.strategy == "BRAIDED" for s in parser.stories)
+
+    def test_synthesize_all_strategies_runs_concurrently(self):
+        """One request per strategy, all in flight at the same time."""
+        in_flight = []
+        peak = []
+
+        class SlowProvider(MockLLMProvider):
+            async def complete(self, messages, **kwargs):
+                in_flight.append(1)
+                peak.append(len(in_flight))
+                await asyncio.sleep(0.01)
+                in_flight.pop()
+                strategy = messages[1]["content"].split("Use the ")[1].split(" strategy")[0]
+                return f"---\nTITLE: {strategy} tale\nSomething happens.\n---\n"
+
+        synth = StorySynthesizer(SlowProvider(""), LLMConfig(max_stories_for_llm=5))
+        results = asyncio.run(synth.synthesize_all_strategies([_make_skeleton()]))
+
+        assert list(results) == list(SYNTHESIS_STRATEGIES)
+        assert max(peak) == len(SYNTHESIS_STRATEGIES)
+        for name, stories in results.items():
+            assert stories[0].title == f"{name} tale"
+            assert stories[0].strategy == name
+
+    def test_synthesize_many_single_request(self):
+        """Several skeleton groups go out in one request and parse per batch."""
+        canned = (
+            "BATCH 1:\n"
+            "STRATEGY: BRAIDED\n"
+            "---\n"
+            "TITLE: Dream of Sand\n"
+            "The desert remembers.\n"
+            "---\n"
+            "BATCH 2:\n"
+            "STRATEGY: RASHOMON\n"
+            "---\n"
+            "TITLE: Echo of Bells\n"
+            "A bell rings once.\n"
+            "---\n"
+        )
+        calls = []
+
+        class CountingProvider(MockLLMProvider):
+            async def complete(self, messages, **kwargs):
+                calls.append(messages)
+                return await super().complete(messages, **kwargs)
+
+        synth = StorySynthesizer(CountingProvider(canned), LLMConfig(max_stories_for_llm=5))
+        groups = [[_make_skeleton()], [_make_skeleton(), _make_skeleton()], [_make_skeleton()]]
+        results = asyncio.run(synth.synthesize_many(groups, ["BRAIDED", "RASHOMON", ""]))
+
+        assert len(calls) == 1
+        assert "=== BATCH 3 ===" in calls[0][1]["content"]
+        assert [s.title for s in results[0]] == ["Dream of Sand"]
+        assert results[1][0].strategy == "RASHOMON"
+        assert results[2] == []
+
+    def test_synthesize_many_strategy_count_mismatch(self):
+        synth = StorySynthesizer(MockLLMProvider(""))
+        with pytest.raises(ValueError):
+            asyncio.run(synth.synthesize_many([[_make_skeleton()]], ["BRAIDED", "RASHOMON"]))
@@ -1,6 +1,7 @@
 """Tests for LLM HTTP provider complete() methods using mocked httpx."""
 
 import asyncio
+import json
 
 import httpx
 import pytest
@@ -10,15 +11,16 @@ from dunedog.llm.openai import OpenAIProvider
 from dunedog.llm.anthropic import AnthropicProvider
 from dunedog.llm.openrouter import OpenRouterProvider
 from dunedog.llm.chatgpt import ChatGPTProvider
-from dunedog.llm.provider import LLMError, LLMProvider, create_provider
+from dunedog.llm.provider import LLMError, LLMProvider, aclose_client, create_provider
 
 
 def _mock_response(json_data, status_code=200):
     """Create a mock httpx response."""
     resp = MagicMock()
     resp.status_code = status_code
-    resp.json.return_value = json_data
+    resp.content = json.dumps(json_data).encode()
     resp.text = ""
+    resp.headers = {}
     if status_code >= 400:
         resp.raise_for_status.side_effect = httpx.HTTPStatusError(
             "error", request=MagicMock(), response=resp
@@ -49,7 +51,7 @@ class TestOpenAIProvider:
             "choices": [{"message": {"content": "Hello from OpenAI"}}]
         })
 
-        with patch("dunedog.llm.openai.httpx.AsyncClient") as mock_cls:
+        with patch("dunedog.llm.provider.httpx.AsyncClient") as mock_cls:
             mock_cls.return_value = _make_mock_client(mock_resp)
             result = asyncio.run(provider.complete([{"role": "user", "content": "Hi"}]))
             assert result == "Hello from OpenAI"
@@ -58,7 +60,7 @@ class TestOpenAIProvider:
         provider = OpenAIProvider(api_key="bad-key", model="gpt-4o")
         mock_resp = _mock_response({}, status_code=401)
 
-        with patch("dunedog.llm.openai.httpx.AsyncClient") as mock_cls:
+        with patch("dunedog.llm.provider.httpx.AsyncClient") as mock_cls:
             mock_cls.return_value = _make_mock_client(mock_resp)
             with pytest.raises(LLMError, match="OpenAI API returned 401"):
                 asyncio.run(provider.complete([{"role": "user", "content": "Hi"}]))
@@ -70,7 +72,7 @@ class TestOpenAIProvider:
         })
         mock_client = _make_mock_client(mock_resp)
 
-        with patch("dunedog.llm.openai.httpx.AsyncClient") as mock_cls:
+        with patch("dunedog.llm.provider.httpx.AsyncClient") as mock_cls:
             mock_cls.return_value = mock_client
             asyncio.run(provider.complete(
                 [{"role": "user", "content": "Hello"}],
@@ -78,7 +80,7 @@ class TestOpenAIProvider:
                 temperature=0.5,
             ))
             call_args = mock_client.post.call_args
-            body = call_args.kwargs.get("json") or call_args[1].get("json")
+            body = json.loads(call_args.kwargs["content"])
             assert body["model"] == "gpt-4o"
             assert body["max_tokens"] == 100
             assert body["temperature"] == 0.5
@@ -91,11 +93,11 @@ class TestOpenAIProvider:
         })
         mock_client = _make_mock_client(mock_resp)
 
-        with patch("dunedog.llm.openai.httpx.AsyncClient") as mock_cls:
+        with patch("dunedog.llm.provider.httpx.AsyncClient") as mock_cls:
             mock_cls.return_value = mock_client
             asyncio.run(provider.complete([{"role": "user", "content": "Hi"}]))
             call_args = mock_client.post.call_args
-            body = call_args.kwargs.get("json") or call_args[1].get("json")
+            body = json.loads(call_args.kwargs["content"])
             assert body["max_tokens"] == 4096
 
     def test_complete_key_error_raises_llm_error(self):
@@ -103,7 +105,7 @@ class TestOpenAIProvider:
         provider = OpenAIProvider(api_key="test-key", model="gpt-4o")
         mock_resp = _mock_response({"unexpected": "format"})
 
-        with patch("dunedog.llm.openai.httpx.AsyncClient") as mock_cls:
+        with patch("dunedog.llm.provider.httpx.AsyncClient") as mock_cls:
             mock_cls.return_value = _make_mock_client(mock_resp)
             with pytest.raises(LLMError, match="OpenAI request failed"):
                 asyncio.run(provider.complete([{"role": "user", "content": "Hi"}]))
@@ -115,7 +117,7 @@ class TestOpenAIProvider:
         })
         mock_client = _make_mock_client(mock_resp)
 
-        with patch("dunedog.llm.openai.httpx.AsyncClient") as mock_cls:
+        with patch("dunedog.llm.provider.httpx.AsyncClient") as mock_cls:
             mock_cls.return_value = mock_client
             asyncio.run(provider.complete([{"role": "user", "content": "Hi"}]))
             call_args = mock_client.post.call_args
@@ -135,7 +137,7 @@ class TestAnthropicProvider:
             "content": [{"text": "Hello from Anthropic"}]
         })
 
-        with patch("dunedog.llm.anthropic.httpx.AsyncClient") as mock_cls:
+        with patch("dunedog.llm.provider.httpx.AsyncClient") as mock_cls:
             mock_cls.return_value = _make_mock_client(mock_resp)
             result = asyncio.run(provider.complete([
                 {"role": "system", "content": "You are helpful."},
@@ -149,7 +151,7 @@ class TestAnthropicProvider:
         mock_resp = _mock_response({"content": [{"text": "response"}]})
         mock_client = _make_mock_client(mock_resp)
 
-        with patch("dunedog.llm.anthropic.httpx.AsyncClient") as mock_cls:
+        with patch("dunedog.llm.provider.httpx.AsyncClient") as mock_cls:
             mock_cls.return_value = mock_client
             asyncio.run(provider.complete([
                 {"role": "system", "content": "System prompt"},
@@ -157,7 +159,7 @@ class TestAnthropicProvider:
             ]))
 
             call_args = mock_client.post.call_args
-            body = call_args.kwargs.get("json") or call_args[1].get("json")
+            body = json.loads(call_args.kwargs["content"])
             assert body["system"] == "System prompt"
             # Messages should not contain system role
             assert all(m["role"] != "system" for m in body["messages"])
@@ -168,21 +170,23 @@ class TestAnthropicProvider:
         mock_resp = _mock_response({"content": [{"text": "response"}]})
         mock_client = _make_mock_client(mock_resp)
 
-        with patch("dunedog.llm.anthropic.httpx.AsyncClient") as mock_cls:
+        with patch("dunedog.llm.provider.httpx.AsyncClient") as mock_cls:
             mock_cls.return_value = mock_client
             asyncio.run(provider.complete([
                 {"role": "user", "content": "Hello"},
             ]))
 
             call_args = mock_client.post.call_args
-            body = call_args.kwargs.get("json") or call_args[1].get("json")
+            body = json.loads(call_args.kwargs["content"])
             assert "system" not in body
 
     def test_complete_error_500(self):
-        provider = AnthropicProvider(api_key="test-key", model="claude-sonnet-4-5-20250929")
+        provider = AnthropicProvider(
+            api_key="test-key", model="claude-sonnet-4-5-20250929", max_retries=0
+        )
         mock_resp = _mock_response({}, status_code=500)
 
-        with patch("dunedog.llm.anthropic.httpx.AsyncClient") as mock_cls:
+        with patch("dunedog.llm.provider.httpx.AsyncClient") as mock_cls:
             mock_cls.return_value = _make_mock_client(mock_resp)
             with pytest.raises(LLMError, match="Anthropic API returned 500"):
                 asyncio.run(provider.complete([{"role": "user", "content": "Hi"}]))
@@ -192,7 +196,7 @@ class TestAnthropicProvider:
         mock_resp = _mock_response({"content": [{"text": "ok"}]})
         mock_client = _make_mock_client(mock_resp)
 
-        with patch("dunedog.llm.anthropic.httpx.AsyncClient") as mock_cls:
+        with patch("dunedog.llm.provider.httpx.AsyncClient") as mock_cls:
             mock_cls.return_value = mock_client
             asyncio.run(provider.complete([{"role": "user", "content": "Hi"}]))
             call_args = mock_client.post.call_args
@@ -213,16 +217,18 @@ class TestOpenRouterProvider:
             "choices": [{"message": {"content": "Hello from OpenRouter"}}]
         })
 
-        with patch("dunedog.llm.openrouter.httpx.AsyncClient") as mock_cls:
+        with patch("dunedog.llm.provider.httpx.AsyncClient") as mock_cls:
             mock_cls.return_value = _make_mock_client(mock_resp)
             result = asyncio.run(provider.complete([{"role": "user", "content": "Hi"}]))
             assert result == "Hello from OpenRouter"
 
     def test_complete_error_429(self):
-        provider = OpenRouterProvider(api_key="test-key", model="anthropic/claude-sonnet-4.5")
+        provider = OpenRouterProvider(
+            api_key="test-key", model="anthropic/claude-sonnet-4.5", max_retries=0
+        )
         mock_resp = _mock_response({}, status_code=429)
 
-        with patch("dunedog.llm.openrouter.httpx.AsyncClient") as mock_cls:
+        with patch("dunedog.llm.provider.httpx.AsyncClient") as mock_cls:
             mock_cls.return_value = _make_mock_client(mock_resp)
             with pytest.raises(LLMError, match="OpenRouter API returned 429"):
                 asyncio.run(provider.complete([{"role": "user", "content": "Hi"}]))
@@ -234,7 +240,7 @@ class TestOpenRouterProvider:
         })
         mock_client = _make_mock_client(mock_resp)
 
-        with patch("dunedog.llm.openrouter.httpx.AsyncClient") as mock_cls:
+        with patch("dunedog.llm.provider.httpx.AsyncClient") as mock_cls:
             mock_cls.return_value = mock_client
             asyncio.run(provider.complete([{"role": "user", "content": "Hi"}]))
             call_args = mock_client.post.call_args
@@ -245,7 +251,7 @@ class TestOpenRouterProvider:
         provider = OpenRouterProvider(api_key="test-key", model="anthropic/claude-sonnet-4.5")
         mock_resp = _mock_response({"bad": "data"})
 
-        with patch("dunedog.llm.openrouter.httpx.AsyncClient") as mock_cls:
+        with patch("dunedog.llm.provider.httpx.AsyncClient") as mock_cls:
             mock_cls.return_value = _make_mock_client(mock_resp)
             with pytest.raises(LLMError, match="OpenRouter request failed"):
                 asyncio.run(provider.complete([{"role": "user", "content": "Hi"}]))
@@ -263,7 +269,7 @@ class TestChatGPTProvider:
             "message": {"content": {"parts": ["Hello from ChatGPT"]}}
         })
 
-        with patch("dunedog.llm.chatgpt.httpx.AsyncClient") as mock_cls:
+        with patch("dunedog.llm.provider.httpx.AsyncClient") as mock_cls:
             mock_cls.return_value = _make_mock_client(mock_resp)
             result = asyncio.run(provider.complete([
                 {"role": "system", "content": "sys"},
@@ -279,7 +285,7 @@ class TestChatGPTProvider:
         })
         mock_client = _make_mock_client(mock_resp)
 
-        with patch("dunedog.llm.chatgpt.httpx.AsyncClient") as mock_cls:
+        with patch("dunedog.llm.provider.httpx.AsyncClient") as mock_cls:
             mock_cls.return_value = mock_client
             asyncio.run(provider.complete([
                 {"role": "system", "content": "system prompt"},
@@ -288,7 +294,7 @@ class TestChatGPTProvider:
                 {"role": "user", "content": "second message"},
             ]))
             call_args = mock_client.post.call_args
-            body = call_args.kwargs.get("json") or call_args[1].get("json")
+            body = json.loads(call_args.kwargs["content"])
             # The body should contain the last user message
             parts = body["messages"][0]["content"]["parts"]
             assert parts == ["second message"]
@@ -297,7 +303,7 @@ class TestChatGPTProvider:
         provider = ChatGPTProvider(api_key="bad-token", model="gpt-4o")
         mock_resp = _mock_response({}, status_code=403)
 
-        with patch("dunedog.llm.chatgpt.httpx.AsyncClient") as mock_cls:
+        with patch("dunedog.llm.provider.httpx.AsyncClient") as mock_cls:
             mock_cls.return_value = _make_mock_client(mock_resp)
             with pytest.raises(LLMError, match="ChatGPT API returned 403"):
                 asyncio.run(provider.complete([{"role": "user", "content": "Hi"}]))
@@ -309,7 +315,7 @@ class TestChatGPTProvider:
         })
         mock_client = _make_mock_client(mock_resp)
 
-        with patch("dunedog.llm.chatgpt.httpx.AsyncClient") as mock_cls:
+        with patch("dunedog.llm.provider.httpx.AsyncClient") as mock_cls:
             mock_cls.return_value = mock_client
             asyncio.run(provider.complete([{"role": "user", "content": "Hi"}]))
             call_args = mock_client.post.call_args
@@ -373,3 +379,188 @@ class TestCreateProvider:
     def test_custom_model_overrides_default(self):
         p = create_provider("openai", api_key="key", model="gpt-3.5-turbo")
         assert p.model == "gpt-3.5-turbo"
+
+    def test_client_override_is_used(self):
+        mock_client = _make_mock_client(_mock_response({
+            "choices": [{"message": {"content": "ok"}}]
+        }))
+        p = create_provider("openai", api_key="key", client=mock_client)
+        assert asyncio.run(p.complete([{"role": "user", "content": "Hi"}])) == "ok"
+        mock_client.post.assert_awaited_once()
+
+
+class TestRetry:
+    def _run(self, provider, responses):
+        mock_client = _make_mock_client(None)
+        mock_client.post = AsyncMock(side_effect=responses)
+        provider._client = mock_client
+        with patch("dunedog.llm.provider.asyncio.sleep", new=AsyncMock()) as sleep:
+            result = asyncio.run(provider.complete([{"role": "user", "content": "Hi"}]))
+        return result, mock_client, sleep
+
+    def test_retries_transient_status_then_succeeds(self):
+        provider = OpenAIProvider(api_key="key", model="gpt-4o", max_retries=3)
+        ok = _mock_response({"choices": [{"message": {"content": "ok"}}]})
+        result, client, sleep = self._run(
+            provider, [_mock_response({}, 503), _mock_response({}, 429), ok]
+        )
+        assert result == "ok"
+        assert client.post.await_count == 3
+        assert sleep.await_count == 2
+
+    def test_honours_retry_after(self):
+        provider = OpenAIProvider(api_key="key", model="gpt-4o")
+        limited = _mock_response({}, 429)
+        limited.headers = {"retry-after": "7"}
+        ok = _mock_response({"choices": [{"message": {"content": "ok"}}]})
+        _, _, sleep = self._run(provider, [limited, ok])
+        sleep.assert_awaited_once_with(7.0)
+
+    def test_retry_after_is_capped_and_logged(self, caplog):
+        provider = OpenAIProvider(api_key="key", model="gpt-4o")
+        limited = _mock_response({}, 429)
+        limited.headers = {"retry-after": "3600"}
+        ok = _mock_response({"choices": [{"message": {"content": "ok"}}]})
+        with caplog.at_level("WARNING", logger="dunedog.llm.provider"):
+            _, _, sleep = self._run(provider, [limited, ok])
+        sleep.assert_awaited_once_with(30.0)
+        assert "OpenAI API returned 429; retrying in 30.0s" in caplog.text
+
+    def test_gives_up_after_max_retries(self):
+        provider = OpenAIProvider(api_key="key", model="gpt-4o", max_retries=2)
+        with pytest.raises(LLMError, match="OpenAI API returned 502"):
+            self._run(provider, [_mock_response({}, 502) for _ in range(3)])
+
+    def test_client_errors_are_not_retried(self):
+        provider = OpenAIProvider(api_key="key", model="gpt-4o")
+        mock_client = _make_mock_client(_mock_response({}, 400))
+        provider._client = mock_client
+        with pytest.raises(LLMError, match="returned 400"):
+            asyncio.run(provider.complete([{"role": "user", "content": "Hi"}]))
+        mock_client.post.assert_awaited_once()
+
+    def test_backoff_grows_and_is_capped(self):
+        provider = OpenAIProvider(api_key="key", model="gpt-4o", backoff_base=1.0)
+        resp = _mock_response({}, 503)
+        assert 1.0 <= provider._retry_delay(resp, 0) <= 2.0
+        assert 4.0 <= provider._retry_delay(resp, 2) <= 5.0
+        assert provider._retry_delay(resp, 20) <= 31.0
+
+
+def _make_stream_client(lines, status_code=200):
+    """Create a mock client whose stream() yields the given SSE lines."""
+    resp = _mock_response({}, status_code=status_code)
+    resp.is_error = status_code >= 400
+    resp.aread = AsyncMock()
+
+    async def aiter_lines():
+        for line in lines:
+            yield line
+
+    resp.aiter_lines = aiter_lines
+    ctx = MagicMock()
+    ctx.__aenter__ = AsyncMock(return_value=resp)
+    ctx.__aexit__ = AsyncMock(return_value=None)
+    mock_client = _make_mock_client(resp)
+    mock_client.stream = MagicMock(return_value=ctx)
+    return mock_client
+
+
+async def _collect(aiter):
+    return [piece async for piece in aiter]
+
+
+class TestStreaming:
+    def test_openai_stream_yields_deltas(self):
+        client = _make_stream_client([
+            'data: {"choices": [{"delta": {"role": "assistant"}}]}',
+            "",
+            'data: {"choices": [{"delta": {"content": "Hel"}}]}',
+            ": keep-alive",
+            'data: {"choices": [{"delta": {"content": "lo"}}]}',
+            "data: [DONE]",
+        ])
+        provider = OpenAIProvider(api_key="key", model="gpt-4o", client=client)
+        pieces = asyncio.run(_collect(provider.stream([{"role": "user", "content": "Hi"}])))
+        assert pieces == ["Hel", "lo"]
+        body = json.loads(client.stream.call_args.kwargs["content"])
+        assert body["stream"] is True
+
+    def test_openrouter_stream_records_usage(self):
+        client = _make_stream_client([
+            'data: {"choices": [{"delta": {"content": "ok"}}]}',
+            'data: {"choices": [], "usage": {"total_tokens": 9}}',
+            "data: [DONE]",
+        ])
+        provider = OpenRouterProvider(api_key="key", model="m", client=client)
+        assert asyncio.run(_collect(provider.stream([]))) == ["ok"]
+        assert provider.last_usage == {"total_tokens": 9}
+
+    def test_anthropic_stream_yields_text_deltas(self):
+        client = _make_stream_client([
+            "event: message_start",
+            'data: {"type": "message_start", "message": {}}',
+            'data: {"type": "content_block_delta", "delta": {"type": "text_delta", "text": "Once"}}',
+            'data: {"type": "content_block_delta", "delta": {"type": "text_delta", "text": " upon"}}',
+            'data: {"type": "message_stop"}',
+        ])
+        provider = AnthropicProvider(api_key="key", model="m", client=client)
+        assert asyncio.run(_collect(provider.stream([]))) == ["Once", " upon"]
+
+    def test_stream_error_status_raises(self):
+        client = _make_stream_client([], status_code=401)
+        provider = OpenAIProvider(api_key="key", model="gpt-4o", client=client)
+        with pytest.raises(LLMError, match="OpenAI API returned 401"):
+            asyncio.run(_collect(provider.stream([])))
+
+    def test_chatgpt_falls_back_to_complete(self):
+        client = _make_mock_client(_mock_response({
+            "message": {"content": {"parts": ["whole"]}}
+        }))
+        provider = ChatGPTProvider(api_key="key", model="m", client=client)
+        assert asyncio.run(_collect(provider.stream([]))) == ["whole"]
+
+
+class TestSharedClient:
+    def test_client_reused_within_event_loop(self):
+        provider = OpenAIProvider(api_key="test-key", model="gpt-4o")
+        mock_resp = _mock_response({
+            "choices": [{"message": {"content": "ok"}}]
+        })
+        mock_client = _make_mock_client(mock_resp)
+        mock_client.is_closed = False
+
+        async def run_twice():
+            await provider.complete([{"role": "user", "content": "a"}])
+            await provider.complete([{"role": "user", "content": "b"}])
+            await aclose_client()
+
+        with patch("dunedog.llm.provider.httpx.AsyncClient") as mock_cls:
+            mock_cls.return_value = mock_client
+            asyncio.run(run_twice())
+            assert mock_cls.call_count == 1
+            assert mock_client.post.await_count == 2
+            mock_client.aclose.assert_awaited_once()
+
+    def test_provider_aclose_leaves_shared_client_open(self):
+        first = OpenAIProvider(api_key="key", model="gpt-4o")
+        second = AnthropicProvider(api_key="key", model="m")
+        mock_client = _make_mock_client(_mock_response({
+            "choices": [{"message": {"content": "ok"}}],
+            "content": [{"text": "ok"}],
+        }))
+        mock_client.is_closed = False
+
+        async def run():
+            await first.complete([{"role": "user", "content": "a"}])
+            await first.aclose()
+            await second.complete([{"role": "user", "content": "b"}])
+            mock_client.aclose.assert_not_awaited()
+            await aclose_client()
+
+        with patch("dunedog.llm.provider.httpx.AsyncClient") as mock_cls:
+            mock_cls.return_value = mock_client
+            asyncio.run(run())
+            assert mock_cls.call_count == 1
+            assert mock_client.post.await_count == 2
+            mock_client.aclose.assert_awaited_once()
@@ -79,6 +79,37 @@ class TestClusterAtoms:
             assert [a.name for a in c1] == [a.name for a in c2]
 
 
+class _FixedSimilarity(RandomSimilarity):
+    """Similarity looked up from a fixed table keyed by name pair."""
+
+    def __init__(self, table):
+        super().__init__(random.Random(0))
+        self._table = {frozenset(k): v for k, v in table.items()}
+
+    def similarity(self, word_a, word_b):
+        return self._table.get(frozenset((word_a, word_b)), 0.0)
+
+
+class TestAverageLinkage:
+    def test_two_groups(self):
+        names = ["a", "b", "c", "x", "y"]
+        atoms = [StoryAtom(n, AtomCategory.AGENT, AtomSource.CATALOGUE, []) for n in names]
+        engine = _FixedSimilarity({
+            ("a", "b"): 0.9, ("b", "c"): 0.8, ("a", "c"): 0.7,
+            ("x", "y"): 0.95, ("c", "x"): 0.4,
+        })
+        result = cluster_atoms(atoms, similarity_engine=engine, threshold=0.5)
+        assert [[a.name for a in c] for c in result] == [["a", "b", "c"], ["x", "y"]]
+
+    def test_average_below_threshold_stops_merge(self):
+        names = ["a", "b", "c"]
+        atoms = [StoryAtom(n, AtomCategory.AGENT, AtomSource.CATALOGUE, []) for n in names]
+        # a-b merge at 0.9; average of (a,c)=0.8 and (b,c)=0.1 is 0.45 < 0.5.
+        engine = _FixedSimilarity({("a", "b"): 0.9, ("a", "c"): 0.8, ("b", "c"): 0.1})
+        result = cluster_atoms(atoms, similarity_engine=engine, threshold=0.5)
+        assert [[a.name for a in c] for c in result] == [["a", "b"], ["c"]]
+
+
 class TestTagBasedClustering:
     """Tests for the _tag_based_clustering fallback."""
 
@@ -136,6 +167,15 @@ class TestTagBasedClustering:
         result = _tag_based_clustering(atoms)
         assert len(result) == 2
 
+    def test_repeated_tag_does_not_merge_everything(self):
+        """A tag listed twice on one atom must not count as shared by all."""
+        atoms = [
+            StoryAtom("a", AtomCategory.AGENT, AtomSource.CATALOGUE, ["x", "x"]),
+            StoryAtom("b", AtomCategory.AGENT, AtomSource.CATALOGUE, ["y"]),
+        ]
+        result = _tag_based_clustering(atoms)
+        assert [[a.name for a in c] for c in result] == [["a"], ["b"]]
+
     def test_multiple_distinct_clusters(self):
         atoms = [
             StoryAtom("a", AtomCategory.AGENT, AtomSource.CATALOGUE, ["fire"]),
@@ -429,6 +429,40 @@ class TestValidateFull:
         assert result.valid is True
         assert len(result.soft_violations) >= 1
 
+    def test_validate_reuses_invariant_checks(self):
+        """Revalidating the same tag and beat sets should not re-run the checks."""
+        engine = WorldRulesEngine()
+        engine._invariants = [_make_invariant(
+            name="beat_req",
+            check_type="requires_beat",
+            severity=InvariantSeverity.SOFT,
+            parameters={"beat": "CLIMAX"},
+        )]
+        engine._tendencies = []
+        calls = []
+        check = engine.check_invariant
+
+        def counting_check(skeleton, invariant):
+            calls.append(skeleton)
+            return check(skeleton, invariant)
+
+        engine.check_invariant = counting_check
+        skeleton = _make_skeleton(
+            atoms=[StoryAtom("a", AtomCategory.AGENT, AtomSource.CATALOGUE, ["test"])],
+            beats=["OPENING"],
+        )
+        first = engine.validate(skeleton)
+        second = engine.validate(skeleton)
+        assert second.soft_violations == first.soft_violations == [
+            "[beat_req] Required beat 'CLIMAX' missing"
+        ]
+        assert second is not first
+        assert len(calls) == 1
+
+        skeleton.beats.append("CLIMAX")
+        assert engine.validate(skeleton).soft_violations == []
+        assert len(calls) == 2
+
     def test_validate_no_invariants_no_tendencies(self):
         engine = WorldRulesEngine()
         engine._invariants = []